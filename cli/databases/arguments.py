@@ -0,0 +1,21 @@
+"""Command-line argument helpers shared by the database CLIs."""
+
+import sys
+from uuid import UUID
+
+
+def parse_uuid_or_exit(value: str, description: str) -> UUID:
+    """Parse a UUID argument, exiting with an error message if it is invalid.
+
+    Args:
+        value: Raw argument text.
+        description: What the ID refers to, used in the error (e.g. "label ID").
+
+    Returns:
+        The parsed UUID.
+    """
+    try:
+        return UUID(value)
+    except ValueError:
+        print(f"Invalid {description}: {value}", file=sys.stderr)
+        sys.exit(1)
@@ -7,11 +7,13 @@ import argparse
 import json
 import sys
 from datetime import date
-from typing import Optional
-from uuid import UUID
+from typing import Callable, Optional
 
 from pydantic import ValidationError
 
+from cli.databases.arguments import parse_uuid_or_exit
+from cli.databases.output import dump, dump_array, set_compact
+from cli.databases.parsers import create_bloodwork_parser
 from src.databases.clients.sqlite import DatabaseClient
 from src.databases.datatypes.bloodwork import (
     Biomarker,
@@ -39,19 +41,19 @@ def format_biomarker(biomarker: Biomarker, collected_date: Optional[str] = None)
 def report_to_dict(report: LabReport) -> dict:
     """Convert a lab report to a JSON-serializable dict."""
     return {
-        "id": str(report.id),
+        "id": report.id,
         "lab_provider": report.lab_provider,
-        "collected_date": report.collected_date.isoformat(),
+        "collected_date": report.collected_date,
         "source_file": report.source_file,
-        "created_at": report.created_at.isoformat(),
+        "created_at": report.created_at,
     }
 
 
 def panel_to_dict(panel: Panel) -> dict:
     """Convert a panel to a JSON-serializable dict."""
     return {
-        "id": str(panel.id),
-        "lab_report_id": str(panel.lab_report_id),
+        "id": panel.id,
+        "lab_report_id": panel.lab_report_id,
         "name": panel.name,
         "comment": panel.comment,
     }
@@ -60,8 +62,8 @@ def panel_to_dict(panel: Panel) -> dict:
 def biomarker_to_dict(biomarker: Biomarker) -> dict:
     """Convert a biomarker to a JSON-serializable dict."""
     return {
-        "id": str(biomarker.id),
-        "panel_id": str(biomarker.panel_id),
+        "id": biomarker.id,
+        "panel_id": biomarker.panel_id,
         "name": biomarker.name,
         "code": biomarker.code,
         "value": biomarker.value,
@@ -169,15 +171,15 @@ def cmd_import(repo: BloodworkRepository, args: argparse.Namespace) -> None:
     # Output
     if not created:
         if args.json:
-            print(json.dumps({"status": "already_imported"}))
+            dump({"status": "already_imported"})
         else:
             print(f"Already imported: {source_file}")
     elif args.json:
-        print(json.dumps({
-            "lab_report_id": str(lab_report.id),
+        dump({
+            "lab_report_id": lab_report.id,
             "panels_created": len(panels),
             "biomarkers_created": len(biomarkers),
-        }, indent=2))
+        })
     else:
         print(f"Imported lab report: {lab_report.id}")
         print(f"  Panels: {len(panels)}")
@@ -188,7 +190,7 @@ def cmd_list(repo: BloodworkRepository, args: argparse.Namespace) -> None:
     """List all lab reports."""
     reports = repo.list_reports()
     if args.json:
-        print(json.dumps([report_to_dict(r) for r in reports], indent=2))
+        dump_array(report_to_dict(r) for r in reports)
     else:
         if not reports:
             print("No lab reports found.")
@@ -201,11 +203,7 @@ def cmd_list(repo: BloodworkRepository, args: argparse.Namespace) -> None:
 
 def cmd_report(repo: BloodworkRepository, args: argparse.Namespace) -> None:
     """Show details for a single lab report."""
-    try:
-        report_id = UUID(args.id)
-    except ValueError:
-        print(f"Invalid report ID: {args.id}", file=sys.stderr)
-        sys.exit(1)
+    report_id = parse_uuid_or_exit(args.id, "report ID")
 
     report = repo.get_report(report_id)
     if report is None:
@@ -213,20 +211,23 @@ def cmd_report(repo: BloodworkRepository, args: argparse.Namespace) -> None:
         sys.exit(1)
 
     panels = repo.get_panels_for_report(report_id)
+    biomarkers_by_panel = repo.get_biomarkers_for_panels([p.id for p in panels])
 
     if args.json:
         report_dict = report_to_dict(report)
         report_dict["panels"] = []
         for panel in panels:
             panel_dict = panel_to_dict(panel)
-            biomarkers = repo.get_biomarkers_for_panel(panel.id)
+            biomarkers = biomarkers_by_panel[panel.id]
             panel_dict["biomarkers"] = [biomarker_to_dict(b) for b in biomarkers]
             report_dict["panels"].append(panel_dict)
-        print(json.dumps(report_dict, indent=2))
+        dump(report_dict)
     else:
+        # Formatted once per report rather than once per biomarker row
+        collected_date = str(report.collected_date)
         print(f"Report: {report.id}")
         print(f"Provider: {report.lab_provider}")
-        print(f"Collected: {report.collected_date}")
+        print(f"Collected: {collected_date}")
         print(f"Source: {report.source_file if report.source_file else '-'}")
         print()
         for panel in panels:
@@ -235,9 +236,8 @@ def cmd_report(repo: BloodworkRepository, args: argparse.Namespace) -> None:
                 print(f"Comment: {panel.comment}")
             print("Name\tValue\tUnit\tFlag\tRange\tDate")
             print("-" * 80)
-            biomarkers = repo.get_biomarkers_for_panel(panel.id)
-            for biomarker in biomarkers:
-                print(format_biomarker(biomarker, str(report.collected_date)))
+            for biomarker in biomarkers_by_panel[panel.id]:
+                print(format_biomarker(biomarker, collected_date))
             print()
 
 
@@ -247,7 +247,7 @@ def cmd_biomarker(repo: BloodworkRepository, args: argparse.Namespace) -> None:
     biomarkers = repo.get_biomarker_history(args.code, limit=limit)
 
     if args.json:
-        print(json.dumps([biomarker_to_dict(b) for b in biomarkers], indent=2))
+        dump_array(biomarker_to_dict(b) for b in biomarkers)
     else:
         if not biomarkers:
             print(f"No biomarker found with code: {args.code}")
@@ -261,11 +261,10 @@ def cmd_biomarker(repo: BloodworkRepository, args: argparse.Namespace) -> None:
 
 def cmd_flagged(repo: BloodworkRepository, args: argparse.Namespace) -> None:
     """Show biomarkers with abnormal flags."""
-    biomarkers = repo.get_flagged_biomarkers()
-
     if args.json:
-        print(json.dumps([biomarker_to_dict(b) for b in biomarkers], indent=2))
+        dump_array(biomarker_to_dict(b) for b in repo.iter_flagged_biomarkers())
     else:
+        biomarkers = repo.get_flagged_biomarkers()
         if not biomarkers:
             print("No flagged biomarkers found.")
             return
@@ -281,7 +280,7 @@ def cmd_recent(repo: BloodworkRepository, args: argparse.Namespace) -> None:
     biomarkers = repo.get_recent_biomarkers()
 
     if args.json:
-        print(json.dumps([biomarker_to_dict(b) for b in biomarkers], indent=2))
+        dump_array(biomarker_to_dict(b) for b in biomarkers)
     else:
         if not biomarkers:
             print("No biomarkers found.")
@@ -293,55 +292,22 @@ def cmd_recent(repo: BloodworkRepository, args: argparse.Namespace) -> None:
             print(format_biomarker(biomarker))
 
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create argument parser for bloodwork CLI."""
-    parser = argparse.ArgumentParser(
-        prog="bloodwork",
-        description="Query bloodwork data from the command line.",
-    )
-    parser.add_argument(
-        "--json",
-        action="store_true",
-        help="Output in JSON format instead of formatted text",
-    )
-
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
-
-    # import command
-    import_parser = subparsers.add_parser("import", help="Import bloodwork from JSON file")
-    import_parser.add_argument(
-        "--file", "-f",
-        help="JSON file to read (default: stdin)",
-    )
-
-    # list command
-    subparsers.add_parser("list", help="List all lab reports")
-
-    # report command
-    report_parser = subparsers.add_parser("report", help="Show details for a single report")
-    report_parser.add_argument("id", help="Report ID (UUID)")
-
-    # biomarker command
-    biomarker_parser = subparsers.add_parser("biomarker", help="Show history for a biomarker code")
-    biomarker_parser.add_argument("code", help="Biomarker code (e.g., GLUCOSE, HBA1C)")
-    biomarker_parser.add_argument(
-        "--limit", "-n", type=int, default=4, help="Number of historical values (default: 4)"
-    )
-
-    # flagged command
-    subparsers.add_parser("flagged", help="Show abnormal biomarker results")
-
-    # recent command
-    subparsers.add_parser("recent", help="Show latest value for each biomarker")
-
-    return parser
+_COMMANDS: dict[str, Callable[[BloodworkRepository, argparse.Namespace], None]] = {
+    "import": cmd_import,
+    "list": cmd_list,
+    "report": cmd_report,
+    "biomarker": cmd_biomarker,
+    "flagged": cmd_flagged,
+    "recent": cmd_recent,
+}
 
 
 def main(args: Optional[list[str]] = None) -> None:
     """Main entry point for bloodwork CLI."""
-    parser = create_parser()
+    parser = create_bloodwork_parser()
     argcomplete.autocomplete(parser)
     parsed_args = parser.parse_args(args)
+    set_compact(parsed_args.compact)
 
     if parsed_args.command is None:
         parser.print_help()
@@ -350,18 +316,7 @@ def main(args: Optional[list[str]] = None) -> None:
     with DatabaseClient() as client:
         with client.get_session() as session:
             repo = BloodworkRepository(session)
-            if parsed_args.command == "import":
-                cmd_import(repo, parsed_args)
-            elif parsed_args.command == "list":
-                cmd_list(repo, parsed_args)
-            elif parsed_args.command == "report":
-                cmd_report(repo, parsed_args)
-            elif parsed_args.command == "biomarker":
-                cmd_biomarker(repo, parsed_args)
-            elif parsed_args.command == "flagged":
-                cmd_flagged(repo, parsed_args)
-            elif parsed_args.command == "recent":
-                cmd_recent(repo, parsed_args)
+            _COMMANDS[parsed_args.command](repo, parsed_args)
 
 
 if __name__ == "__main__":
@@ -7,12 +7,14 @@ import argparse
 import json
 import sys
 from datetime import date
-from typing import Optional
+from typing import Callable, Optional
 
 from pydantic import ValidationError
 
+from cli.databases.output import dump, dump_array, set_compact
+from cli.databases.parsers import create_dna_parser
 from src.databases.clients.sqlite import DatabaseClient
-from src.databases.datatypes.dna import DnaRepository, DnaTest, Repute, Snp
+from src.databases.datatypes.dna import DnaRepository, DnaTest, Snp
 
 
 def format_snp(snp: Snp) -> str:
@@ -29,8 +31,8 @@ def format_test(test: DnaTest) -> str:
 def snp_to_dict(snp: Snp) -> dict:
     """Convert a SNP to a JSON-serializable dict."""
     return {
-        "id": str(snp.id),
-        "dna_test_id": str(snp.dna_test_id),
+        "id": snp.id,
+        "dna_test_id": snp.dna_test_id,
         "rsid": snp.rsid,
         "genotype": snp.genotype,
         "magnitude": snp.magnitude,
@@ -42,11 +44,11 @@ def snp_to_dict(snp: Snp) -> dict:
 def dna_test_to_dict(test: DnaTest) -> dict:
     """Convert a DNA test to a JSON-serializable dict."""
     return {
-        "id": str(test.id),
+        "id": test.id,
         "source": test.source,
-        "collected_date": test.collected_date.isoformat(),
+        "collected_date": test.collected_date,
         "source_file": test.source_file,
-        "created_at": test.created_at.isoformat(),
+        "created_at": test.created_at,
     }
 
 
@@ -80,16 +82,14 @@ def parse_dna_json(
     snps: list[Snp] = []
 
     for snp_data in data.get("snps", []):
-        # Parse repute - can be None, "good", or "bad"
-        repute_value = snp_data.get("repute")
-        repute = Repute(repute_value) if repute_value else None
-
+        # Repute can be missing, empty, "good", or "bad"; validation turns
+        # the string into its Repute member
         snp = Snp.model_validate({
             "dna_test_id": dna_test.id,
             "rsid": snp_data["rsid"],
             "genotype": snp_data["genotype"],
             "magnitude": snp_data["magnitude"],
-            "repute": repute,
+            "repute": snp_data.get("repute") or None,
             "gene": snp_data["gene"],
         })
         snps.append(snp)
@@ -139,14 +139,14 @@ def cmd_import(repo: DnaRepository, args: argparse.Namespace) -> None:
     # Output
     if not created:
         if args.json:
-            print(json.dumps({"status": "already_imported"}))
+            dump({"status": "already_imported"})
         else:
             print(f"Already imported: {source_file}")
     elif args.json:
-        print(json.dumps({
-            "dna_test_id": str(dna_test.id),
+        dump({
+            "dna_test_id": dna_test.id,
             "snps_created": len(snps),
-        }, indent=2))
+        })
     else:
         print(f"Imported DNA test: {dna_test.id}")
         print(f"  SNPs: {len(snps)}")
@@ -156,7 +156,7 @@ def cmd_list(repo: DnaRepository, args: argparse.Namespace) -> None:
     """List all DNA tests."""
     tests = repo.list_tests()
     if args.json:
-        print(json.dumps([dna_test_to_dict(t) for t in tests], indent=2))
+        dump_array(dna_test_to_dict(t) for t in tests)
     else:
         if not tests:
             print("No DNA tests found.")
@@ -174,7 +174,7 @@ def cmd_snp(repo: DnaRepository, args: argparse.Namespace) -> None:
         print(f"SNP not found: {args.rsid}", file=sys.stderr)
         sys.exit(1)
     if args.json:
-        print(json.dumps(snp_to_dict(snp), indent=2))
+        dump(snp_to_dict(snp))
     else:
         print("rsid\tgenotype\tgene\tmagnitude\trepute")
         print("-" * 60)
@@ -185,7 +185,7 @@ def cmd_gene(repo: DnaRepository, args: argparse.Namespace) -> None:
     """Show all SNPs for a gene."""
     snps = repo.get_snps_for_gene(args.gene)
     if args.json:
-        print(json.dumps([snp_to_dict(s) for s in snps], indent=2))
+        dump_array(snp_to_dict(s) for s in snps)
     else:
         if not snps:
             print(f"No SNPs found for gene: {args.gene}")
@@ -198,10 +198,10 @@ def cmd_gene(repo: DnaRepository, args: argparse.Namespace) -> None:
 
 def cmd_high_impact(repo: DnaRepository, args: argparse.Namespace) -> None:
     """Show SNPs with magnitude >= 3."""
-    snps = repo.get_high_impact_snps()
     if args.json:
-        print(json.dumps([snp_to_dict(s) for s in snps], indent=2))
+        dump_array(snp_to_dict(s) for s in repo.iter_high_impact_snps())
     else:
+        snps = repo.get_high_impact_snps()
         if not snps:
             print("No high-impact SNPs found (magnitude >= 3).")
             return
@@ -211,49 +211,21 @@ def cmd_high_impact(repo: DnaRepository, args: argparse.Namespace) -> None:
             print(format_snp(snp))
 
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create argument parser for DNA CLI."""
-    parser = argparse.ArgumentParser(
-        prog="dna",
-        description="Query DNA data from the command line.",
-    )
-    parser.add_argument(
-        "--json",
-        action="store_true",
-        help="Output in JSON format instead of formatted text",
-    )
-
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
-
-    # import command
-    import_parser = subparsers.add_parser("import", help="Import DNA data from JSON file")
-    import_parser.add_argument(
-        "--file", "-f",
-        help="JSON file to read (default: stdin)",
-    )
-
-    # list command
-    subparsers.add_parser("list", help="List all DNA tests")
-
-    # snp command
-    snp_parser = subparsers.add_parser("snp", help="Show details for a single SNP")
-    snp_parser.add_argument("rsid", help="Reference SNP ID (e.g., rs1234)")
-
-    # gene command
-    gene_parser = subparsers.add_parser("gene", help="Show all SNPs for a gene")
-    gene_parser.add_argument("gene", help="Gene name (e.g., MTHFR)")
-
-    # high-impact command
-    subparsers.add_parser("high-impact", help="Show SNPs with magnitude >= 3")
-
-    return parser
+_COMMANDS: dict[str, Callable[[DnaRepository, argparse.Namespace], None]] = {
+    "import": cmd_import,
+    "list": cmd_list,
+    "snp": cmd_snp,
+    "gene": cmd_gene,
+    "high-impact": cmd_high_impact,
+}
 
 
 def main(args: Optional[list[str]] = None) -> None:
     """Main entry point for DNA CLI."""
-    parser = create_parser()
+    parser = create_dna_parser()
     argcomplete.autocomplete(parser)
     parsed_args = parser.parse_args(args)
+    set_compact(parsed_args.compact)
 
     if parsed_args.command is None:
         parser.print_help()
@@ -262,16 +234,7 @@ def main(args: Optional[list[str]] = None) -> None:
     with DatabaseClient() as client:
         with client.get_session() as session:
             repo = DnaRepository(session)
-            if parsed_args.command == "import":
-                cmd_import(repo, parsed_args)
-            elif parsed_args.command == "list":
-                cmd_list(repo, parsed_args)
-            elif parsed_args.command == "snp":
-                cmd_snp(repo, parsed_args)
-            elif parsed_args.command == "gene":
-                cmd_gene(repo, parsed_args)
-            elif parsed_args.command == "high-impact":
-                cmd_high_impact(repo, parsed_args)
+            _COMMANDS[parsed_args.command](repo, parsed_args)
 
 
 if __name__ == "__main__":
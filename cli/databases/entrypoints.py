@@ -0,0 +1,45 @@
+"""Console script entry points for the database CLIs.
+
+Shell completion only needs the argument parser, so it is answered here
+before the CLI module, and with it SQLAlchemy and the models, is imported.
+"""
+
+import argparse
+import importlib
+from collections.abc import Callable
+
+import argcomplete
+
+from cli.databases import parsers
+
+
+def _run(create_parser: Callable[[], argparse.ArgumentParser], module: str) -> None:
+    """Handle a completion request, or import the CLI module and run it."""
+    # Exits the process here when invoked by the shell for tab completion
+    argcomplete.autocomplete(create_parser())
+    importlib.import_module(module).main()
+
+
+def bloodwork() -> None:
+    """Run the bloodwork CLI."""
+    _run(parsers.create_bloodwork_parser, "cli.databases.bloodwork")
+
+
+def dna() -> None:
+    """Run the DNA CLI."""
+    _run(parsers.create_dna_parser, "cli.databases.dna")
+
+
+def knowledge() -> None:
+    """Run the knowledge CLI."""
+    _run(parsers.create_knowledge_parser, "cli.databases.knowledge")
+
+
+def protocols() -> None:
+    """Run the supplement protocol CLI."""
+    _run(parsers.create_protocol_parser, "cli.databases.supplement_protocol")
+
+
+def supplements() -> None:
+    """Run the supplements CLI."""
+    _run(parsers.create_supplement_parser, "cli.databases.supplement")
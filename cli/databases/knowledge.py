@@ -6,9 +6,12 @@ import argcomplete
 import argparse
 import json
 import sys
-from typing import Optional
+from typing import Callable, Optional
 from uuid import UUID
 
+from cli.databases.arguments import parse_uuid_or_exit
+from cli.databases.output import dump, set_compact
+from cli.databases.parsers import create_knowledge_parser
 from src.databases.clients.sqlite import DatabaseClient
 from src.databases.datatypes.knowledge import (
     Knowledge,
@@ -61,23 +64,23 @@ def format_knowledge_detail(
 def knowledge_to_dict(knowledge: Knowledge) -> dict:
     """Convert a knowledge entry to a JSON-serializable dict."""
     return {
-        "id": str(knowledge.id),
+        "id": knowledge.id,
         "type": knowledge.type.value,
         "status": knowledge.status.value,
         "summary": knowledge.summary,
         "content": knowledge.content,
         "confidence": knowledge.confidence,
-        "supersedes_id": str(knowledge.supersedes_id) if knowledge.supersedes_id else None,
+        "supersedes_id": knowledge.supersedes_id,
         "supersession_reason": knowledge.supersession_reason,
-        "created_at": knowledge.created_at.isoformat(),
+        "created_at": knowledge.created_at,
     }
 
 
 def tag_to_dict(tag: KnowledgeTag) -> dict:
     """Convert a knowledge tag to a JSON-serializable dict."""
     return {
-        "id": str(tag.id),
-        "knowledge_id": str(tag.knowledge_id),
+        "id": tag.id,
+        "knowledge_id": tag.knowledge_id,
         "tag": tag.tag,
     }
 
@@ -85,13 +88,30 @@ def tag_to_dict(tag: KnowledgeTag) -> dict:
 def link_to_dict(link: KnowledgeLink) -> dict:
     """Convert a knowledge link to a JSON-serializable dict."""
     return {
-        "id": str(link.id),
-        "knowledge_id": str(link.knowledge_id),
+        "id": link.id,
+        "knowledge_id": link.knowledge_id,
         "link_type": link.link_type.value,
-        "target_id": str(link.target_id),
+        "target_id": link.target_id,
     }
 
 
+def entries_to_dicts(repo: KnowledgeRepository, entries: list[Knowledge]) -> list[dict]:
+    """Convert knowledge entries with their tags and links to JSON-serializable dicts.
+
+    Tags and links for all entries are loaded with one query each.
+    """
+    entry_ids = [entry.id for entry in entries]
+    tags_by_entry = repo.get_tags_for_entries(entry_ids)
+    links_by_entry = repo.get_links_for_entries(entry_ids)
+    result = []
+    for entry in entries:
+        entry_dict = knowledge_to_dict(entry)
+        entry_dict["tags"] = [tag_to_dict(t) for t in tags_by_entry[entry.id]]
+        entry_dict["links"] = [link_to_dict(l) for l in links_by_entry[entry.id]]
+        result.append(entry_dict)
+    return result
+
+
 def parse_knowledge_json(data: dict) -> tuple[Knowledge, list[KnowledgeTag], list[KnowledgeLink]]:
     """Parse JSON data into Knowledge, tags, and links.
 
@@ -168,8 +188,11 @@ def cmd_create(repo: KnowledgeRepository, args: argparse.Namespace) -> None:
         sys.exit(1)
 
     # Validate links exist
+    found = repo.validate_link_targets_exist(
+        [(link.link_type, link.target_id) for link in links]
+    )
     for link in links:
-        if not repo.validate_link_target_exists(link.link_type, link.target_id):
+        if not found[(link.link_type, link.target_id)]:
             print(
                 f"Link target does not exist: {link.link_type.value} {link.target_id}",
                 file=sys.stderr,
@@ -183,18 +206,14 @@ def cmd_create(repo: KnowledgeRepository, args: argparse.Namespace) -> None:
         result = knowledge_to_dict(knowledge)
         result["tags"] = [tag_to_dict(t) for t in tags]
         result["links"] = [link_to_dict(l) for l in links]
-        print(json.dumps(result, indent=2))
+        dump(result)
     else:
         print(f"Created knowledge entry: {knowledge.id}")
 
 
 def cmd_get(repo: KnowledgeRepository, args: argparse.Namespace) -> None:
     """Get a single knowledge entry by ID."""
-    try:
-        knowledge_id = UUID(args.id)
-    except ValueError:
-        print(f"Invalid knowledge ID: {args.id}", file=sys.stderr)
-        sys.exit(1)
+    knowledge_id = parse_uuid_or_exit(args.id, "knowledge ID")
 
     knowledge = repo.get_knowledge(knowledge_id)
     if knowledge is None:
@@ -208,7 +227,7 @@ def cmd_get(repo: KnowledgeRepository, args: argparse.Namespace) -> None:
         result = knowledge_to_dict(knowledge)
         result["tags"] = [tag_to_dict(t) for t in tags]
         result["links"] = [link_to_dict(l) for l in links]
-        print(json.dumps(result, indent=2))
+        dump(result)
     else:
         print(format_knowledge_detail(knowledge, tags, links))
 
@@ -218,15 +237,7 @@ def cmd_list(repo: KnowledgeRepository, args: argparse.Namespace) -> None:
     entries = repo.list_active()
 
     if args.json:
-        result = []
-        for entry in entries:
-            entry_dict = knowledge_to_dict(entry)
-            tags = repo.get_tags_for_knowledge(entry.id)
-            links = repo.get_links_for_knowledge(entry.id)
-            entry_dict["tags"] = [tag_to_dict(t) for t in tags]
-            entry_dict["links"] = [link_to_dict(l) for l in links]
-            result.append(entry_dict)
-        print(json.dumps(result, indent=2))
+        dump(entries_to_dicts(repo, entries))
     else:
         if not entries:
             print("No active knowledge entries found.")
@@ -243,21 +254,13 @@ def cmd_tag(repo: KnowledgeRepository, args: argparse.Namespace) -> None:
 
     if not entries:
         if args.json:
-            print(json.dumps([], indent=2))
+            dump([])
         else:
             print(f"No knowledge entries found with tag: {args.tag}")
         return
 
     if args.json:
-        result = []
-        for entry in entries:
-            entry_dict = knowledge_to_dict(entry)
-            tags = repo.get_tags_for_knowledge(entry.id)
-            links = repo.get_links_for_knowledge(entry.id)
-            entry_dict["tags"] = [tag_to_dict(t) for t in tags]
-            entry_dict["links"] = [link_to_dict(l) for l in links]
-            result.append(entry_dict)
-        print(json.dumps(result, indent=2))
+        dump(entries_to_dicts(repo, entries))
     else:
         print(f"Knowledge entries with tag '{args.tag}':")
         print("ID\tType\tConfidence\tSummary")
@@ -275,31 +278,19 @@ def cmd_linked(repo: KnowledgeRepository, args: argparse.Namespace) -> None:
         print(f"Invalid link type: {args.type}. Valid types: {valid_types}", file=sys.stderr)
         sys.exit(1)
 
-    try:
-        target_id = UUID(args.id)
-    except ValueError:
-        print(f"Invalid target ID: {args.id}", file=sys.stderr)
-        sys.exit(1)
+    target_id = parse_uuid_or_exit(args.id, "target ID")
 
     entries = repo.get_linked_to(link_type, target_id)
 
     if not entries:
         if args.json:
-            print(json.dumps([], indent=2))
+            dump([])
         else:
             print(f"No knowledge entries linked to {args.type} {args.id}")
         return
 
     if args.json:
-        result = []
-        for entry in entries:
-            entry_dict = knowledge_to_dict(entry)
-            tags = repo.get_tags_for_knowledge(entry.id)
-            links = repo.get_links_for_knowledge(entry.id)
-            entry_dict["tags"] = [tag_to_dict(t) for t in tags]
-            entry_dict["links"] = [link_to_dict(l) for l in links]
-            result.append(entry_dict)
-        print(json.dumps(result, indent=2))
+        dump(entries_to_dicts(repo, entries))
     else:
         print(f"Knowledge entries linked to {args.type} {args.id}:")
         print("ID\tType\tConfidence\tSummary")
@@ -310,11 +301,7 @@ def cmd_linked(repo: KnowledgeRepository, args: argparse.Namespace) -> None:
 
 def cmd_supersede(repo: KnowledgeRepository, args: argparse.Namespace) -> None:
     """Supersede an existing knowledge entry."""
-    try:
-        old_id = UUID(args.id)
-    except ValueError:
-        print(f"Invalid knowledge ID: {args.id}", file=sys.stderr)
-        sys.exit(1)
+    old_id = parse_uuid_or_exit(args.id, "knowledge ID")
 
     # Verify old knowledge exists
     old_knowledge = repo.get_knowledge(old_id)
@@ -336,8 +323,11 @@ def cmd_supersede(repo: KnowledgeRepository, args: argparse.Namespace) -> None:
         sys.exit(1)
 
     # Validate links exist
+    found = repo.validate_link_targets_exist(
+        [(link.link_type, link.target_id) for link in links]
+    )
     for link in links:
-        if not repo.validate_link_target_exists(link.link_type, link.target_id):
+        if not found[(link.link_type, link.target_id)]:
             print(
                 f"Link target does not exist: {link.link_type.value} {link.target_id}",
                 file=sys.stderr,
@@ -353,60 +343,27 @@ def cmd_supersede(repo: KnowledgeRepository, args: argparse.Namespace) -> None:
         result = knowledge_to_dict(knowledge)
         result["tags"] = [tag_to_dict(t) for t in new_tags]
         result["links"] = [link_to_dict(l) for l in new_links]
-        print(json.dumps(result, indent=2))
+        dump(result)
     else:
         print(f"Superseded knowledge entry {old_id} with new entry: {knowledge.id}")
 
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create argument parser for knowledge CLI."""
-    parser = argparse.ArgumentParser(
-        prog="knowledge",
-        description="Store and query knowledge entries from the command line.",
-    )
-    parser.add_argument(
-        "--json",
-        action="store_true",
-        help="Output in JSON format instead of formatted text",
-    )
-
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
-
-    # create command
-    create_parser = subparsers.add_parser("create", help="Create a new knowledge entry from JSON")
-    create_parser.add_argument(
-        "--file", "-f",
-        help="JSON file to read (default: stdin)",
-    )
-
-    # get command
-    get_parser = subparsers.add_parser("get", help="Show a single knowledge entry")
-    get_parser.add_argument("id", help="Knowledge ID (UUID)")
-
-    # list command
-    subparsers.add_parser("list", help="List active knowledge entries")
-
-    # tag command
-    tag_parser = subparsers.add_parser("tag", help="Show knowledge entries by tag")
-    tag_parser.add_argument("tag", help="Tag value to search for")
-
-    # linked command
-    linked_parser = subparsers.add_parser("linked", help="Show knowledge entries linked to a target")
-    linked_parser.add_argument("type", help="Link type (snp, biomarker, ingredient, supplement, protocol, knowledge)")
-    linked_parser.add_argument("id", help="Target ID (UUID)")
-
-    # supersede command
-    supersede_parser = subparsers.add_parser("supersede", help="Supersede an existing knowledge entry")
-    supersede_parser.add_argument("id", help="ID of knowledge entry to supersede (UUID)")
-
-    return parser
+_COMMANDS: dict[str, Callable[[KnowledgeRepository, argparse.Namespace], None]] = {
+    "create": cmd_create,
+    "get": cmd_get,
+    "list": cmd_list,
+    "tag": cmd_tag,
+    "linked": cmd_linked,
+    "supersede": cmd_supersede,
+}
 
 
 def main(args: Optional[list[str]] = None) -> None:
     """Main entry point for knowledge CLI."""
-    parser = create_parser()
+    parser = create_knowledge_parser()
     argcomplete.autocomplete(parser)
     parsed_args = parser.parse_args(args)
+    set_compact(parsed_args.compact)
 
     if parsed_args.command is None:
         parser.print_help()
@@ -415,18 +372,7 @@ def main(args: Optional[list[str]] = None) -> None:
     with DatabaseClient() as client:
         with client.get_session() as session:
             repo = KnowledgeRepository(session)
-            if parsed_args.command == "create":
-                cmd_create(repo, parsed_args)
-            elif parsed_args.command == "get":
-                cmd_get(repo, parsed_args)
-            elif parsed_args.command == "list":
-                cmd_list(repo, parsed_args)
-            elif parsed_args.command == "tag":
-                cmd_tag(repo, parsed_args)
-            elif parsed_args.command == "linked":
-                cmd_linked(repo, parsed_args)
-            elif parsed_args.command == "supersede":
-                cmd_supersede(repo, parsed_args)
+            _COMMANDS[parsed_args.command](repo, parsed_args)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,149 @@
+"""JSON output helpers shared by the database CLIs."""
+
+import codecs
+import json
+import sys
+from collections.abc import Iterable, Iterator
+from datetime import date
+from typing import Any
+from uuid import UUID
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson installed
+    orjson = None
+
+
+def _default(obj: Any) -> str:
+    """Serialize the non-JSON types the CLIs emit (UUIDs, dates, datetimes)."""
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, date):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Stdlib encoders, built once and reused for every record. Non-ASCII text is
+# escaped, as json.dumps does by default, so output is safe on any stream
+_ENCODER = json.JSONEncoder(indent=2, default=_default)
+_COMPACT_ENCODER = json.JSONEncoder(separators=(",", ":"), default=_default)
+
+# Set from the CLI's --compact flag; indented output is the default
+_compact = False
+
+
+def set_compact(enabled: bool) -> None:
+    """Switch JSON output between indented (default) and compact form."""
+    global _compact
+    _compact = enabled
+
+
+def _orjson_ascii(obj: Any) -> bytes | None:
+    """Return orjson's encoding of obj, or None if the stdlib must be used.
+
+    orjson always writes non-ASCII text as raw UTF-8 and has no option to
+    escape it, so output containing any falls back to the stdlib encoder.
+    Returns None as well when orjson is not installed.
+    """
+    if orjson is None:
+        return None
+    data = orjson.dumps(obj, option=0 if _compact else orjson.OPT_INDENT_2)
+    return data if data.isascii() else None
+
+
+def dumps(obj: Any) -> str:
+    """Serialize CLI output to JSON, indented unless compact mode is on.
+
+    Uses orjson when it is installed, which handles UUID, date, and datetime
+    values natively. Falls back to the stdlib json module otherwise, with
+    identical output for the values the CLIs produce.
+    """
+    data = _orjson_ascii(obj)
+    if data is not None:
+        return data.decode()
+    return (_COMPACT_ENCODER if _compact else _ENCODER).encode(obj)
+
+
+def _iterencode(obj: Any) -> Iterator[str]:
+    """Yield the dumps() text for obj in chunks from the stdlib encoder.
+
+    The encoder streams chunks as it walks obj, so the full string is never
+    built. Every chunk is ASCII and can be written to any text stream.
+    """
+    yield from (_COMPACT_ENCODER if _compact else _ENCODER).iterencode(obj)
+
+
+def _utf8_stdout_buffer() -> Any:
+    """Return stdout's binary buffer if orjson bytes can be written to it as-is.
+
+    That needs orjson plus a UTF-8 text stream with an underlying buffer.
+    Pending text is flushed first so output written with print() stays in
+    order. Returns None when output must go through the text layer.
+    """
+    if orjson is None:
+        return None
+    out = sys.stdout
+    buffer = getattr(out, "buffer", None)
+    if buffer is None or codecs.lookup(out.encoding or "ascii").name != "utf-8":
+        return None
+    out.flush()
+    return buffer
+
+
+def _orjson_bytes(obj: Any) -> Iterator[bytes]:
+    """Yield the dumps() bytes for obj, from orjson whenever it can be used."""
+    data = _orjson_ascii(obj)
+    if data is not None:
+        yield data
+    else:
+        for chunk in _iterencode(obj):
+            yield chunk.encode()
+
+
+def dump(obj: Any) -> None:
+    """Write obj to stdout as JSON followed by a newline.
+
+    Equivalent to ``print(dumps(obj))``. With orjson and a UTF-8 stdout, the
+    encoded bytes go straight to the stdout buffer without a decode/encode
+    round trip through str; other streams get the stdlib encoder's text.
+    """
+    buffer = _utf8_stdout_buffer()
+    if buffer is not None:
+        for chunk in _orjson_bytes(obj):
+            buffer.write(chunk)
+        buffer.write(b"\n")
+        return
+
+    out = sys.stdout
+    for chunk in _iterencode(obj):
+        out.write(chunk)
+    out.write("\n")
+
+
+def dump_array(items: Iterable[Any]) -> None:
+    """Write items to stdout as a JSON array, one element at a time.
+
+    Produces the same text as ``print(dumps(list(items)))`` without holding
+    every element, or the whole serialized array, in memory at once.
+    """
+    if _compact:
+        parts = ("[", ",", "]\n", "[]\n", "\n", "")
+    else:
+        parts = ("[\n  ", ",\n  ", "\n]\n", "[]\n", "\n", "\n  ")
+
+    buffer = _utf8_stdout_buffer()
+    if buffer is not None:
+        write, encode = buffer.write, _orjson_bytes
+        parts = tuple(part.encode() for part in parts)
+    else:
+        write, encode = sys.stdout.write, _iterencode
+    opening, separator, closing, empty, newline, indent = parts
+
+    first = True
+    for item in items:
+        write(opening if first else separator)
+        for chunk in encode(item):
+            # Serialized strings escape newlines, so every raw newline is structural
+            write(chunk.replace(newline, indent) if indent else chunk)
+        first = False
+    write(empty if first else closing)
@@ -0,0 +1,240 @@
+"""Argument parsers for the database CLIs.
+
+Kept apart from the CLI modules so shell completion can build a parser
+without importing the database layer.
+"""
+
+import argparse
+from functools import cache
+
+
+@cache
+def create_bloodwork_parser() -> argparse.ArgumentParser:
+    """Create argument parser for bloodwork CLI."""
+    parser = argparse.ArgumentParser(
+        prog="bloodwork",
+        description="Query bloodwork data from the command line.",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output in JSON format instead of formatted text",
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="With --json, emit compact JSON without indentation",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+
+    # import command
+    import_parser = subparsers.add_parser("import", help="Import bloodwork from JSON file")
+    import_parser.add_argument(
+        "--file", "-f",
+        help="JSON file to read (default: stdin)",
+    )
+
+    # list command
+    subparsers.add_parser("list", help="List all lab reports")
+
+    # report command
+    report_parser = subparsers.add_parser("report", help="Show details for a single report")
+    report_parser.add_argument("id", help="Report ID (UUID)")
+
+    # biomarker command
+    biomarker_parser = subparsers.add_parser("biomarker", help="Show history for a biomarker code")
+    biomarker_parser.add_argument("code", help="Biomarker code (e.g., GLUCOSE, HBA1C)")
+    biomarker_parser.add_argument(
+        "--limit", "-n", type=int, default=4, help="Number of historical values (default: 4)"
+    )
+
+    # flagged command
+    subparsers.add_parser("flagged", help="Show abnormal biomarker results")
+
+    # recent command
+    subparsers.add_parser("recent", help="Show latest value for each biomarker")
+
+    return parser
+
+
+@cache
+def create_dna_parser() -> argparse.ArgumentParser:
+    """Create argument parser for DNA CLI."""
+    parser = argparse.ArgumentParser(
+        prog="dna",
+        description="Query DNA data from the command line.",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output in JSON format instead of formatted text",
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="With --json, emit compact JSON without indentation",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+
+    # import command
+    import_parser = subparsers.add_parser("import", help="Import DNA data from JSON file")
+    import_parser.add_argument(
+        "--file", "-f",
+        help="JSON file to read (default: stdin)",
+    )
+
+    # list command
+    subparsers.add_parser("list", help="List all DNA tests")
+
+    # snp command
+    snp_parser = subparsers.add_parser("snp", help="Show details for a single SNP")
+    snp_parser.add_argument("rsid", help="Reference SNP ID (e.g., rs1234)")
+
+    # gene command
+    gene_parser = subparsers.add_parser("gene", help="Show all SNPs for a gene")
+    gene_parser.add_argument("gene", help="Gene name (e.g., MTHFR)")
+
+    # high-impact command
+    subparsers.add_parser("high-impact", help="Show SNPs with magnitude >= 3")
+
+    return parser
+
+
+@cache
+def create_knowledge_parser() -> argparse.ArgumentParser:
+    """Create argument parser for knowledge CLI."""
+    parser = argparse.ArgumentParser(
+        prog="knowledge",
+        description="Store and query knowledge entries from the command line.",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output in JSON format instead of formatted text",
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="With --json, emit compact JSON without indentation",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+
+    # create command
+    create_parser = subparsers.add_parser("create", help="Create a new knowledge entry from JSON")
+    create_parser.add_argument(
+        "--file", "-f",
+        help="JSON file to read (default: stdin)",
+    )
+
+    # get command
+    get_parser = subparsers.add_parser("get", help="Show a single knowledge entry")
+    get_parser.add_argument("id", help="Knowledge ID (UUID)")
+
+    # list command
+    subparsers.add_parser("list", help="List active knowledge entries")
+
+    # tag command
+    tag_parser = subparsers.add_parser("tag", help="Show knowledge entries by tag")
+    tag_parser.add_argument("tag", help="Tag value to search for")
+
+    # linked command
+    linked_parser = subparsers.add_parser("linked", help="Show knowledge entries linked to a target")
+    linked_parser.add_argument("type", help="Link type (snp, biomarker, ingredient, supplement, protocol, knowledge)")
+    linked_parser.add_argument("id", help="Target ID (UUID)")
+
+    # supersede command
+    supersede_parser = subparsers.add_parser("supersede", help="Supersede an existing knowledge entry")
+    supersede_parser.add_argument("id", help="ID of knowledge entry to supersede (UUID)")
+
+    return parser
+
+
+@cache
+def create_supplement_parser() -> argparse.ArgumentParser:
+    """Create argument parser for supplements CLI."""
+    parser = argparse.ArgumentParser(
+        prog="supplements",
+        description="Query supplement label data from the command line.",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output in JSON format instead of formatted text",
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="With --json, emit compact JSON without indentation",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+
+    # import command
+    import_parser = subparsers.add_parser("import", help="Import supplement from JSON file")
+    import_parser.add_argument(
+        "--file", "-f",
+        help="JSON file to read (default: stdin)",
+    )
+
+    # list command
+    subparsers.add_parser("list", help="List all supplement labels")
+
+    # label command
+    label_parser = subparsers.add_parser("label", help="Show details for a single label")
+    label_parser.add_argument("id", help="Label ID (UUID)")
+
+    # ingredient command
+    ingredient_parser = subparsers.add_parser("ingredient", help="Show labels containing an ingredient")
+    ingredient_parser.add_argument("code", help="Ingredient code (e.g., VITAMIN_D3, MAGNESIUM)")
+
+    # search command
+    search_parser = subparsers.add_parser("search", help="Search by brand or product name")
+    search_parser.add_argument("term", help="Search term")
+
+    return parser
+
+
+@cache
+def create_protocol_parser() -> argparse.ArgumentParser:
+    """Create argument parser for protocol CLI."""
+    parser = argparse.ArgumentParser(
+        prog="protocols",
+        description="Query supplement protocol data from the command line.",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output in JSON format instead of formatted text",
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="With --json, emit compact JSON without indentation",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+
+    # import command
+    import_parser = subparsers.add_parser("import", help="Import protocol from JSON file")
+    import_parser.add_argument(
+        "--file", "-f",
+        help="JSON file to read (default: stdin)",
+    )
+
+    # current command
+    subparsers.add_parser("current", help="Show the latest protocol")
+
+    # list command
+    subparsers.add_parser("list", help="List all protocols")
+
+    # protocol command
+    protocol_parser = subparsers.add_parser("protocol", help="Show details for a single protocol")
+    protocol_parser.add_argument("id", help="Protocol ID (UUID)")
+
+    # history command
+    subparsers.add_parser("history", help="Show protocol changes over time")
+
+    return parser
@@ -6,11 +6,14 @@ import argcomplete
 import argparse
 import json
 import sys
-from typing import Optional
+from typing import Callable, Optional
 from uuid import UUID
 
 from pydantic import ValidationError
 
+from cli.databases.arguments import parse_uuid_or_exit
+from cli.databases.output import dump, dump_array, set_compact
+from cli.databases.parsers import create_supplement_parser
 from src.databases.clients.sqlite import DatabaseClient
 from src.databases.datatypes.supplement import (
     Ingredient,
@@ -38,9 +41,9 @@ def format_ingredient(ingredient: Ingredient) -> str:
 def label_to_dict(label: SupplementLabel) -> dict:
     """Convert a supplement label to a JSON-serializable dict."""
     return {
-        "id": str(label.id),
+        "id": label.id,
         "source_file": label.source_file,
-        "created_at": label.created_at.isoformat(),
+        "created_at": label.created_at,
         "brand": label.brand,
         "product_name": label.product_name,
         "form": label.form.value,
@@ -55,9 +58,9 @@ def label_to_dict(label: SupplementLabel) -> dict:
 def ingredient_to_dict(ingredient: Ingredient) -> dict:
     """Convert an ingredient to a JSON-serializable dict."""
     return {
-        "id": str(ingredient.id),
-        "supplement_label_id": str(ingredient.supplement_label_id) if ingredient.supplement_label_id else None,
-        "blend_id": str(ingredient.blend_id) if ingredient.blend_id else None,
+        "id": ingredient.id,
+        "supplement_label_id": ingredient.supplement_label_id,
+        "blend_id": ingredient.blend_id,
         "type": ingredient.type.value,
         "name": ingredient.name,
         "code": ingredient.code,
@@ -71,8 +74,8 @@ def ingredient_to_dict(ingredient: Ingredient) -> dict:
 def blend_to_dict(blend: ProprietaryBlend) -> dict:
     """Convert a proprietary blend to a JSON-serializable dict."""
     return {
-        "id": str(blend.id),
-        "supplement_label_id": str(blend.supplement_label_id),
+        "id": blend.id,
+        "supplement_label_id": blend.supplement_label_id,
         "name": blend.name,
         "total_amount": blend.total_amount,
         "total_unit": blend.total_unit,
@@ -214,15 +217,15 @@ def cmd_import(repo: SupplementRepository, args: argparse.Namespace) -> None:
     # Output
     if not created:
         if args.json:
-            print(json.dumps({"status": "already_imported"}))
+            dump({"status": "already_imported"})
         else:
             print(f"Already imported: {source_file}")
     elif args.json:
-        print(json.dumps({
-            "supplement_label_id": str(label.id),
+        dump({
+            "supplement_label_id": label.id,
             "blends_created": len(blends),
             "ingredients_created": len(ingredients),
-        }, indent=2))
+        })
     else:
         print(f"Imported supplement label: {label.id}")
         print(f"  Blends: {len(blends)}")
@@ -231,26 +234,21 @@ def cmd_import(repo: SupplementRepository, args: argparse.Namespace) -> None:
 
 def cmd_list(repo: SupplementRepository, args: argparse.Namespace) -> None:
     """List all supplement labels."""
-    labels = repo.list_labels()
     if args.json:
-        print(json.dumps([label_to_dict(l) for l in labels], indent=2))
+        dump_array(label_to_dict(l) for l in repo.iter_labels())
     else:
+        labels = repo.list_labels()
         if not labels:
             print("No supplement labels found.")
             return
-        print("ID\tBrand\tProduct\tForm")
-        print("-" * 80)
-        for label in labels:
-            print(format_label(label))
+        lines = ["ID\tBrand\tProduct\tForm", "-" * 80]
+        lines.extend(format_label(l) for l in labels)
+        print("\n".join(lines))
 
 
 def cmd_label(repo: SupplementRepository, args: argparse.Namespace) -> None:
     """Show details for a single supplement label."""
-    try:
-        label_id = UUID(args.id)
-    except ValueError:
-        print(f"Invalid label ID: {args.id}", file=sys.stderr)
-        sys.exit(1)
+    label_id = parse_uuid_or_exit(args.id, "label ID")
 
     label = repo.get_label(label_id)
     if label is None:
@@ -259,6 +257,7 @@ def cmd_label(repo: SupplementRepository, args: argparse.Namespace) -> None:
 
     ingredients = repo.get_ingredients_for_label(label_id)
     blends = repo.get_blends_for_label(label_id)
+    blend_ingredients = repo.get_ingredients_for_blends([b.id for b in blends])
 
     if args.json:
         label_dict = label_to_dict(label)
@@ -266,10 +265,11 @@ def cmd_label(repo: SupplementRepository, args: argparse.Namespace) -> None:
         label_dict["blends"] = []
         for blend in blends:
             blend_dict = blend_to_dict(blend)
-            blend_ingredients = repo.get_ingredients_for_blend(blend.id)
-            blend_dict["ingredients"] = [ingredient_to_dict(i) for i in blend_ingredients]
+            blend_dict["ingredients"] = [
+                ingredient_to_dict(i) for i in blend_ingredients[blend.id]
+            ]
             label_dict["blends"].append(blend_dict)
-        print(json.dumps(label_dict, indent=2))
+        dump(label_dict)
     else:
         print(f"Label: {label.id}")
         print(f"Brand: {label.brand}")
@@ -291,10 +291,9 @@ def cmd_label(repo: SupplementRepository, args: argparse.Namespace) -> None:
         for blend in blends:
             amount_str = f"{blend.total_amount} {blend.total_unit}" if blend.total_amount else ""
             print(f"Blend: {blend.name} {amount_str}")
-            blend_ingredients = repo.get_ingredients_for_blend(blend.id)
             print("Name\tAmount\tUnit\t%DV\tType")
             print("-" * 60)
-            for ingredient in blend_ingredients:
+            for ingredient in blend_ingredients[blend.id]:
                 print(format_ingredient(ingredient))
             print()
 
@@ -302,17 +301,20 @@ def cmd_label(repo: SupplementRepository, args: argparse.Namespace) -> None:
 def cmd_ingredient(repo: SupplementRepository, args: argparse.Namespace) -> None:
     """Show labels containing a given ingredient code."""
     ingredients = repo.get_ingredients_by_code(args.code)
+    labels = repo.get_labels(
+        {ing.supplement_label_id for ing in ingredients if ing.supplement_label_id}
+    )
 
     if args.json:
         result = []
         for ing in ingredients:
             ing_dict = ingredient_to_dict(ing)
             if ing.supplement_label_id:
-                label = repo.get_label(ing.supplement_label_id)
+                label = labels.get(ing.supplement_label_id)
                 if label:
                     ing_dict["label"] = label_to_dict(label)
             result.append(ing_dict)
-        print(json.dumps(result, indent=2))
+        dump(result)
     else:
         if not ingredients:
             print(f"No supplements found containing: {args.code}")
@@ -323,7 +325,7 @@ def cmd_ingredient(repo: SupplementRepository, args: argparse.Namespace) -> None
         seen_labels: set[UUID] = set()
         for ing in ingredients:
             if ing.supplement_label_id and ing.supplement_label_id not in seen_labels:
-                label = repo.get_label(ing.supplement_label_id)
+                label = labels.get(ing.supplement_label_id)
                 if label:
                     amount_str = f"{ing.amount:.1f}" if ing.amount else "-"
                     unit_str = ing.unit if ing.unit else ""
@@ -336,7 +338,7 @@ def cmd_search(repo: SupplementRepository, args: argparse.Namespace) -> None:
     labels = repo.search_labels(args.term)
 
     if args.json:
-        print(json.dumps([label_to_dict(l) for l in labels], indent=2))
+        dump_array(label_to_dict(l) for l in labels)
     else:
         if not labels:
             print(f"No supplements found matching: {args.term}")
@@ -348,50 +350,21 @@ def cmd_search(repo: SupplementRepository, args: argparse.Namespace) -> None:
             print(format_label(label))
 
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create argument parser for supplements CLI."""
-    parser = argparse.ArgumentParser(
-        prog="supplements",
-        description="Query supplement label data from the command line.",
-    )
-    parser.add_argument(
-        "--json",
-        action="store_true",
-        help="Output in JSON format instead of formatted text",
-    )
-
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
-
-    # import command
-    import_parser = subparsers.add_parser("import", help="Import supplement from JSON file")
-    import_parser.add_argument(
-        "--file", "-f",
-        help="JSON file to read (default: stdin)",
-    )
-
-    # list command
-    subparsers.add_parser("list", help="List all supplement labels")
-
-    # label command
-    label_parser = subparsers.add_parser("label", help="Show details for a single label")
-    label_parser.add_argument("id", help="Label ID (UUID)")
-
-    # ingredient command
-    ingredient_parser = subparsers.add_parser("ingredient", help="Show labels containing an ingredient")
-    ingredient_parser.add_argument("code", help="Ingredient code (e.g., VITAMIN_D3, MAGNESIUM)")
-
-    # search command
-    search_parser = subparsers.add_parser("search", help="Search by brand or product name")
-    search_parser.add_argument("term", help="Search term")
-
-    return parser
+_COMMANDS: dict[str, Callable[[SupplementRepository, argparse.Namespace], None]] = {
+    "import": cmd_import,
+    "list": cmd_list,
+    "label": cmd_label,
+    "ingredient": cmd_ingredient,
+    "search": cmd_search,
+}
 
 
 def main(args: Optional[list[str]] = None) -> None:
     """Main entry point for supplements CLI."""
-    parser = create_parser()
+    parser = create_supplement_parser()
     argcomplete.autocomplete(parser)
     parsed_args = parser.parse_args(args)
+    set_compact(parsed_args.compact)
 
     if parsed_args.command is None:
         parser.print_help()
@@ -400,16 +373,7 @@ def main(args: Optional[list[str]] = None) -> None:
     with DatabaseClient() as client:
         with client.get_session() as session:
             repo = SupplementRepository(session)
-            if parsed_args.command == "import":
-                cmd_import(repo, parsed_args)
-            elif parsed_args.command == "list":
-                cmd_list(repo, parsed_args)
-            elif parsed_args.command == "label":
-                cmd_label(repo, parsed_args)
-            elif parsed_args.command == "ingredient":
-                cmd_ingredient(repo, parsed_args)
-            elif parsed_args.command == "search":
-                cmd_search(repo, parsed_args)
+            _COMMANDS[parsed_args.command](repo, parsed_args)
 
 
 if __name__ == "__main__":
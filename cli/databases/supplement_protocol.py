@@ -7,11 +7,13 @@ import argparse
 import json
 import sys
 from datetime import date
-from typing import Optional
-from uuid import UUID
+from typing import Callable, Optional
 
 from pydantic import ValidationError
 
+from cli.databases.arguments import parse_uuid_or_exit
+from cli.databases.output import dump, dump_array, set_compact
+from cli.databases.parsers import create_protocol_parser
 from src.databases.clients.sqlite import DatabaseClient
 from src.databases.datatypes.supplement_protocol import (
     Frequency,
@@ -21,6 +23,17 @@ from src.databases.datatypes.supplement_protocol import (
     SupplementProtocolRepository,
 )
 
+# Daily schedule fields on ProtocolSupplement and their short display tags
+_SCHEDULE_FIELDS = (
+    ("upon_waking", "wake"),
+    ("breakfast", "bfast"),
+    ("mid_morning", "mid-am"),
+    ("lunch", "lunch"),
+    ("mid_afternoon", "mid-pm"),
+    ("dinner", "dinner"),
+    ("before_sleep", "sleep"),
+)
+
 
 def format_protocol(protocol: SupplementProtocol) -> str:
     """Format a protocol for display."""
@@ -38,33 +51,23 @@ def format_supplement(supplement: ProtocolSupplement) -> str:
 
 def format_schedule(supplement: ProtocolSupplement) -> str:
     """Format the daily schedule for a supplement."""
-    parts = []
-    if supplement.upon_waking:
-        parts.append(f"wake:{supplement.upon_waking}")
-    if supplement.breakfast:
-        parts.append(f"bfast:{supplement.breakfast}")
-    if supplement.mid_morning:
-        parts.append(f"mid-am:{supplement.mid_morning}")
-    if supplement.lunch:
-        parts.append(f"lunch:{supplement.lunch}")
-    if supplement.mid_afternoon:
-        parts.append(f"mid-pm:{supplement.mid_afternoon}")
-    if supplement.dinner:
-        parts.append(f"dinner:{supplement.dinner}")
-    if supplement.before_sleep:
-        parts.append(f"sleep:{supplement.before_sleep}")
-    return ",".join(parts) if parts else "-"
+    parts = [
+        f"{tag}:{count}"
+        for field, tag in _SCHEDULE_FIELDS
+        if (count := getattr(supplement, field))
+    ]
+    return ",".join(parts) or "-"
 
 
 def protocol_to_dict(protocol: SupplementProtocol) -> dict:
     """Convert a protocol to a JSON-serializable dict."""
     return {
-        "id": str(protocol.id),
-        "protocol_date": protocol.protocol_date.isoformat(),
+        "id": protocol.id,
+        "protocol_date": protocol.protocol_date,
         "prescriber": protocol.prescriber,
         "next_visit": protocol.next_visit,
         "source_file": protocol.source_file,
-        "created_at": protocol.created_at.isoformat(),
+        "created_at": protocol.created_at,
         "protein_goal": protocol.protein_goal,
         "lifestyle_notes": protocol.lifestyle_notes,
     }
@@ -73,26 +76,29 @@ def protocol_to_dict(protocol: SupplementProtocol) -> dict:
 def supplement_to_dict(supplement: ProtocolSupplement) -> dict:
     """Convert a protocol supplement to a JSON-serializable dict."""
     return {
-        "id": str(supplement.id),
-        "protocol_id": str(supplement.protocol_id),
-        "supplement_label_id": str(supplement.supplement_label_id) if supplement.supplement_label_id else None,
+        "id": supplement.id,
+        "protocol_id": supplement.protocol_id,
+        "supplement_label_id": supplement.supplement_label_id,
         "type": supplement.type.value,
         "name": supplement.name,
         "instructions": supplement.instructions,
         "dosage": supplement.dosage,
         "frequency": supplement.frequency.value,
         "schedule": {
-            "upon_waking": supplement.upon_waking,
-            "breakfast": supplement.breakfast,
-            "mid_morning": supplement.mid_morning,
-            "lunch": supplement.lunch,
-            "mid_afternoon": supplement.mid_afternoon,
-            "dinner": supplement.dinner,
-            "before_sleep": supplement.before_sleep,
+            field: getattr(supplement, field) for field, _ in _SCHEDULE_FIELDS
         },
     }
 
 
+def protocol_with_supplements_to_dict(
+    protocol: SupplementProtocol, supplements: list[ProtocolSupplement]
+) -> dict:
+    """Convert a protocol and its supplements to a JSON-serializable dict."""
+    protocol_dict = protocol_to_dict(protocol)
+    protocol_dict["supplements"] = [supplement_to_dict(s) for s in supplements]
+    return protocol_dict
+
+
 def parse_protocol_json(
     data: dict, source_file: str | None
 ) -> tuple[SupplementProtocol, list[ProtocolSupplement]]:
@@ -207,14 +213,14 @@ def cmd_import(repo: SupplementProtocolRepository, args: argparse.Namespace) ->
     # Output
     if not created:
         if args.json:
-            print(json.dumps({"status": "already_imported"}))
+            dump({"status": "already_imported"})
         else:
             print(f"Already imported: {source_file}")
     elif args.json:
-        print(json.dumps({
-            "protocol_id": str(protocol.id),
+        dump({
+            "protocol_id": protocol.id,
             "supplements_created": len(supplements),
-        }, indent=2))
+        })
     else:
         print(f"Imported protocol: {protocol.id}")
         print(f"  Supplements: {len(supplements)}")
@@ -222,150 +228,111 @@ def cmd_import(repo: SupplementProtocolRepository, args: argparse.Namespace) ->
 
 def cmd_current(repo: SupplementProtocolRepository, args: argparse.Namespace) -> None:
     """Show the latest protocol."""
-    protocol = repo.get_current_protocol()
-    if protocol is None:
+    result = repo.get_current_protocol_with_supplements()
+    if result is None:
         print("No protocols found.")
         return
 
+    protocol, supplements = result
     if args.json:
-        protocol_dict = protocol_to_dict(protocol)
-        supplements = repo.get_supplements_for_protocol(protocol.id)
-        protocol_dict["supplements"] = [supplement_to_dict(s) for s in supplements]
-        print(json.dumps(protocol_dict, indent=2))
+        dump(protocol_with_supplements_to_dict(protocol, supplements))
     else:
-        print_protocol_details(repo, protocol)
+        print_protocol_details(protocol, supplements)
 
 
 def cmd_list(repo: SupplementProtocolRepository, args: argparse.Namespace) -> None:
     """List all protocols."""
     protocols = repo.list_protocols()
     if args.json:
-        print(json.dumps([protocol_to_dict(p) for p in protocols], indent=2))
+        dump_array(protocol_to_dict(p) for p in protocols)
     else:
         if not protocols:
             print("No protocols found.")
             return
-        print("ID\tDate\tPrescriber")
-        print("-" * 80)
-        for protocol in protocols:
-            print(format_protocol(protocol))
+        lines = ["ID\tDate\tPrescriber", "-" * 80]
+        lines.extend(format_protocol(p) for p in protocols)
+        print("\n".join(lines))
 
 
 def cmd_protocol(repo: SupplementProtocolRepository, args: argparse.Namespace) -> None:
     """Show details for a single protocol."""
-    try:
-        protocol_id = UUID(args.id)
-    except ValueError:
-        print(f"Invalid protocol ID: {args.id}", file=sys.stderr)
-        sys.exit(1)
+    protocol_id = parse_uuid_or_exit(args.id, "protocol ID")
 
-    protocol = repo.get_protocol(protocol_id)
-    if protocol is None:
+    result = repo.get_protocol_with_supplements(protocol_id)
+    if result is None:
         print(f"Protocol not found: {args.id}", file=sys.stderr)
         sys.exit(1)
 
+    protocol, supplements = result
     if args.json:
-        protocol_dict = protocol_to_dict(protocol)
-        supplements = repo.get_supplements_for_protocol(protocol.id)
-        protocol_dict["supplements"] = [supplement_to_dict(s) for s in supplements]
-        print(json.dumps(protocol_dict, indent=2))
+        dump(protocol_with_supplements_to_dict(protocol, supplements))
     else:
-        print_protocol_details(repo, protocol)
+        print_protocol_details(protocol, supplements)
 
 
 def cmd_history(repo: SupplementProtocolRepository, args: argparse.Namespace) -> None:
     """Show protocol changes over time."""
     protocols = repo.list_protocols()
+    supplements_by_protocol = repo.get_supplements_for_protocols(
+        [p.id for p in protocols]
+    )
 
     if args.json:
-        result = []
-        for protocol in protocols:
-            protocol_dict = protocol_to_dict(protocol)
-            supplements = repo.get_supplements_for_protocol(protocol.id)
-            protocol_dict["supplements"] = [supplement_to_dict(s) for s in supplements]
-            result.append(protocol_dict)
-        print(json.dumps(result, indent=2))
+        dump_array(
+            protocol_with_supplements_to_dict(p, supplements_by_protocol[p.id])
+            for p in protocols
+        )
     else:
         if not protocols:
             print("No protocols found.")
             return
         for i, protocol in enumerate(protocols):
             if i > 0:
-                print()
-                print("=" * 80)
-                print()
-            print_protocol_details(repo, protocol)
+                print("\n" + "=" * 80 + "\n")
+            print_protocol_details(protocol, supplements_by_protocol[protocol.id])
 
 
 def print_protocol_details(
-    repo: SupplementProtocolRepository, protocol: SupplementProtocol
+    protocol: SupplementProtocol, supplements: list[ProtocolSupplement]
 ) -> None:
     """Print formatted protocol details."""
-    print(f"Protocol: {protocol.id}")
-    print(f"Date: {protocol.protocol_date}")
+    lines = [f"Protocol: {protocol.id}", f"Date: {protocol.protocol_date}"]
     if protocol.prescriber:
-        print(f"Prescriber: {protocol.prescriber}")
+        lines.append(f"Prescriber: {protocol.prescriber}")
     if protocol.next_visit:
-        print(f"Next Visit: {protocol.next_visit}")
+        lines.append(f"Next Visit: {protocol.next_visit}")
     if protocol.protein_goal:
-        print(f"Protein Goal: {protocol.protein_goal}")
+        lines.append(f"Protein Goal: {protocol.protein_goal}")
     if protocol.lifestyle_notes:
-        print("Lifestyle Notes:")
-        for note in protocol.lifestyle_notes:
-            print(f"  - {note}")
-    print()
+        lines.append("Lifestyle Notes:")
+        lines.extend(f"  - {note}" for note in protocol.lifestyle_notes)
+    lines.append("")
 
-    supplements = repo.get_supplements_for_protocol(protocol.id)
     if supplements:
-        print("Supplements:")
-        print("Name\tFrequency\tDosage\tSchedule\tInstructions")
-        print("-" * 100)
-        for supplement in supplements:
-            print(format_supplement(supplement))
-
-
-def create_parser() -> argparse.ArgumentParser:
-    """Create argument parser for protocol CLI."""
-    parser = argparse.ArgumentParser(
-        prog="protocols",
-        description="Query supplement protocol data from the command line.",
-    )
-    parser.add_argument(
-        "--json",
-        action="store_true",
-        help="Output in JSON format instead of formatted text",
-    )
-
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
-
-    # import command
-    import_parser = subparsers.add_parser("import", help="Import protocol from JSON file")
-    import_parser.add_argument(
-        "--file", "-f",
-        help="JSON file to read (default: stdin)",
-    )
-
-    # current command
-    subparsers.add_parser("current", help="Show the latest protocol")
-
-    # list command
-    subparsers.add_parser("list", help="List all protocols")
+        lines.append("Supplements:")
+        lines.append("Name\tFrequency\tDosage\tSchedule\tInstructions")
+        lines.append("-" * 100)
+        lines.extend(format_supplement(s) for s in supplements)
 
-    # protocol command
-    protocol_parser = subparsers.add_parser("protocol", help="Show details for a single protocol")
-    protocol_parser.add_argument("id", help="Protocol ID (UUID)")
+    # Single write per protocol instead of one per line
+    print("\n".join(lines))
 
-    # history command
-    subparsers.add_parser("history", help="Show protocol changes over time")
 
-    return parser
+_COMMANDS: dict[str, Callable[[SupplementProtocolRepository, argparse.Namespace], None]] = {
+    "import": cmd_import,
+    "current": cmd_current,
+    "list": cmd_list,
+    "protocol": cmd_protocol,
+    "history": cmd_history,
+}
 
 
 def main(args: Optional[list[str]] = None) -> None:
     """Main entry point for protocol CLI."""
-    parser = create_parser()
+    parser = create_protocol_parser()
     argcomplete.autocomplete(parser)
     parsed_args = parser.parse_args(args)
+    set_compact(parsed_args.compact)
 
     if parsed_args.command is None:
         parser.print_help()
@@ -374,16 +341,7 @@ def main(args: Optional[list[str]] = None) -> None:
     with DatabaseClient() as client:
         with client.get_session() as session:
             repo = SupplementProtocolRepository(session)
-            if parsed_args.command == "import":
-                cmd_import(repo, parsed_args)
-            elif parsed_args.command == "current":
-                cmd_current(repo, parsed_args)
-            elif parsed_args.command == "list":
-                cmd_list(repo, parsed_args)
-            elif parsed_args.command == "protocol":
-                cmd_protocol(repo, parsed_args)
-            elif parsed_args.command == "history":
-                cmd_history(repo, parsed_args)
+            _COMMANDS[parsed_args.command](repo, parsed_args)
 
 
 if __name__ == "__main__":
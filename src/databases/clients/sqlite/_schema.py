@@ -0,0 +1,15 @@
+"""Model imports that register every table with SQLModel metadata.
+
+Also exposes the DDL for tables SQLAlchemy cannot declare, such as the
+FTS5 label search index.
+
+Imported lazily by DatabaseClient.init_schema() so that CLIs which only
+query existing data don't pay for importing every datatype package.
+"""
+
+from src.databases.datatypes.bloodwork.models import LabReport, Panel, Biomarker  # noqa: F401
+from src.databases.datatypes.supplement.models import SupplementLabel, ProprietaryBlend, Ingredient  # noqa: F401
+from src.databases.datatypes.supplement.models import LABEL_SEARCH_DDL, LABEL_SEARCH_REBUILD  # noqa: F401
+from src.databases.datatypes.supplement_protocol.models import SupplementProtocol, ProtocolSupplement  # noqa: F401
+from src.databases.datatypes.dna.models import DnaTest, Snp  # noqa: F401
+from src.databases.datatypes.knowledge.models import Knowledge, KnowledgeLink, KnowledgeTag  # noqa: F401
@@ -1,17 +1,20 @@
 """SQLite database client with SQLModel for Bio-Architect."""
 
+import sqlite3
 from pathlib import Path
 from typing import Optional
+from uuid import UUID
 
-from sqlalchemy import Engine, event
+from sqlalchemy import CheckConstraint, Connection, Engine, MetaData, Table, event
+from sqlalchemy.schema import CreateTable
 from sqlmodel import SQLModel, Session, create_engine
 
-# Import all models to register them with SQLModel metadata
-from src.databases.datatypes.bloodwork.models import LabReport, Panel, Biomarker  # noqa: F401
-from src.databases.datatypes.supplement.models import SupplementLabel, ProprietaryBlend, Ingredient  # noqa: F401
-from src.databases.datatypes.supplement_protocol.models import SupplementProtocol, ProtocolSupplement  # noqa: F401
-from src.databases.datatypes.dna.models import DnaTest, Snp  # noqa: F401
-from src.databases.datatypes.knowledge.models import Knowledge, KnowledgeLink, KnowledgeTag  # noqa: F401
+from ...datatypes.types import EnumCode, UUIDBlob
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson installed
+    orjson = None
 
 # Project root computed from this file's location
 # client.py is at src/databases/clients/sqlite/client.py (5 levels deep)
@@ -20,56 +23,330 @@ _PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent.parent
 # Default database path (absolute, relative to project root)
 DEFAULT_DB_PATH = _PROJECT_ROOT / "data/databases/sqlite/bio.db"
 
+# Stored in PRAGMA user_version once init_schema() has run. Bump whenever
+# tables or indexes change so existing databases pick up the new DDL.
+SCHEMA_VERSION = 15
+
+# First schema version storing UUIDs as 16-byte blobs; earlier databases
+# hold them as 32-character hex text and are converted by init_schema()
+_UUID_BLOB_VERSION = 7
+
+# First schema version with the supplement label search index; earlier
+# databases get it filled from their existing labels by init_schema()
+_LABEL_SEARCH_VERSION = 10
+
+# Last schema version changing table DDL that SQLite cannot alter in place
+# (WITHOUT ROWID child tables in 9, CHECK constraints in 12, column types
+# in 13, rowids restored on the panel, biomarker and protocol supplement
+# tables in 15); earlier databases get their stale tables rebuilt by
+# init_schema()
+_TABLE_REBUILD_VERSION = 15
+
+# First schema version storing some enums as integer codes; earlier
+# databases hold member names as text and are converted by init_schema()
+_ENUM_CODE_VERSION = 13
+
+
+# Per-connection PRAGMAs: FK enforcement plus fewer fsyncs, in-memory temp
+# tables, a 256 MiB memory map, and a 64 MiB page cache
+_CONNECTION_PRAGMAS = """
+PRAGMA foreign_keys = ON;
+PRAGMA synchronous = NORMAL;
+PRAGMA temp_store = MEMORY;
+PRAGMA mmap_size = 268435456;
+PRAGMA cache_size = -65536;
+"""
+
+# Prepared statements kept per connection by the sqlite3 module (default
+# 128), so repeated repository queries skip re-preparing their SQL
+_STATEMENT_CACHE_SIZE = 256
+
+
+def _orjson_dumps(value: object) -> str:
+    """Serialize a JSON column value with orjson, as text for SQLite."""
+    return orjson.dumps(value).decode()
 
-def _enable_foreign_keys(dbapi_connection, connection_record):
-    """Enable foreign key constraints for SQLite connections."""
+
+# JSON columns (label warnings, protocol lifestyle notes) are encoded and
+# decoded with orjson when it is installed; SQLAlchemy uses the stdlib json
+# module otherwise. Both read what the other wrote.
+_JSON_CODEC = (
+    {"json_serializer": _orjson_dumps, "json_deserializer": orjson.loads}
+    if orjson is not None
+    else {}
+)
+
+
+def _configure_sqlite(dbapi_connection, connection_record):
+    """Enable foreign keys, WAL journaling, and performance PRAGMAs."""
     cursor = dbapi_connection.cursor()
-    cursor.execute("PRAGMA foreign_keys = ON")
+    try:
+        cursor.execute("PRAGMA journal_mode = WAL")
+    except sqlite3.OperationalError:
+        # Read-only databases keep their existing journal mode
+        pass
+    cursor.executescript(_CONNECTION_PRAGMAS)
     cursor.close()
 
 
+def _configure_read_only(dbapi_connection, connection_record):
+    """Reject writes as well as schema changes on read-only connections."""
+    dbapi_connection.execute("PRAGMA query_only = ON")
+
+
+def _convert_text_uuids(conn: Connection) -> None:
+    """Rewrite UUIDs stored as hex text by older schemas as 16-byte blobs.
+
+    Runs inside init_schema()'s transaction with foreign keys off, since
+    parent and child keys are rewritten in separate UPDATEs.
+    """
+    conn.connection.dbapi_connection.create_function(
+        "uuid_text_to_blob", 1, lambda value: UUID(value).bytes, deterministic=True
+    )
+    for table in SQLModel.metadata.sorted_tables:
+        for column in table.columns:
+            if isinstance(column.type, UUIDBlob):
+                conn.exec_driver_sql(
+                    f'UPDATE "{table.name}" SET "{column.name}" = '
+                    f'uuid_text_to_blob("{column.name}") '
+                    f"WHERE typeof(\"{column.name}\") = 'text'"
+                )
+
+
+def _convert_enum_names(conn: Connection) -> None:
+    """Rewrite enum member names stored as text by older schemas as codes.
+
+    Runs inside init_schema()'s transaction, after the affected tables were
+    rebuilt with integer columns. An unknown name becomes NULL, which the
+    NOT NULL constraint rejects, rolling the migration back.
+    """
+    for table in SQLModel.metadata.sorted_tables:
+        for column in table.columns:
+            if isinstance(column.type, EnumCode):
+                cases = " ".join(
+                    f"WHEN '{member.name}' THEN {code}"
+                    for code, member in enumerate(column.type.enum_class)
+                )
+                conn.exec_driver_sql(
+                    f'UPDATE "{table.name}" SET "{column.name}" = '
+                    f'CASE "{column.name}" {cases} END '
+                    f"WHERE typeof(\"{column.name}\") = 'text'"
+                )
+
+
+def _has_rowid(sql: str) -> bool:
+    """Check whether a stored CREATE TABLE statement keeps the rowid."""
+    return not sql.rstrip().upper().endswith("WITHOUT ROWID")
+
+
+def _declares_rowid(table: Table) -> bool:
+    """Check whether a table is declared without sqlite_with_rowid=False."""
+    return table.dialect_options["sqlite"]["with_rowid"] is not False
+
+
+def _table_is_stale(conn: Connection, table: Table, sql: str) -> bool:
+    """Check whether a table's stored DDL differs in rowid, CHECKs, or types."""
+    if _has_rowid(sql) != _declares_rowid(table):
+        return True
+    if any(
+        isinstance(constraint, CheckConstraint) and constraint.name not in sql
+        for constraint in table.constraints
+    ):
+        return True
+    stored_types = {
+        row[1]: row[2].upper()
+        for row in conn.exec_driver_sql(f'PRAGMA table_info("{table.name}")')
+    }
+    return any(
+        stored_types.get(column.name)
+        != column.type.compile(dialect=conn.dialect).upper()
+        for column in table.columns
+    )
+
+
+def _rebuild_stale_tables(conn: Connection) -> None:
+    """Rebuild tables whose stored DDL predates their declaration.
+
+    SQLite cannot add or drop a table's rowid or add a CHECK constraint in
+    place, so each stale table is copied into a new one that is renamed over
+    it, following SQLite's documented ALTER TABLE procedure. Rowids are
+    copied when both tables have one, since listings sort by them. Runs
+    inside init_schema()'s transaction with foreign keys off. The dropped
+    table's indexes are recreated by init_schema() afterwards.
+    """
+    # Copies of every table, so the rebuilt tables' foreign keys resolve
+    copies = MetaData()
+    for table in SQLModel.metadata.sorted_tables:
+        table.to_metadata(copies)
+
+    for table in SQLModel.metadata.sorted_tables:
+        sql = conn.exec_driver_sql(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?",
+            (table.name,),
+        ).scalar_one()
+        if not _table_is_stale(conn, table, sql):
+            continue
+
+        rebuilt = table.to_metadata(copies, name=f"_rebuild_{table.name}")
+        conn.execute(CreateTable(rebuilt))
+        columns = ", ".join(f'"{column.name}"' for column in table.columns)
+        if _has_rowid(sql) and _declares_rowid(table):
+            columns = f"rowid, {columns}"
+        conn.exec_driver_sql(
+            f'INSERT INTO "{rebuilt.name}" ({columns}) '
+            f'SELECT {columns} FROM "{table.name}"'
+        )
+        conn.exec_driver_sql(f'DROP TABLE "{table.name}"')
+        conn.exec_driver_sql(f'ALTER TABLE "{rebuilt.name}" RENAME TO "{table.name}"')
+
+
 class DatabaseClient:
     """SQLite database client for Bio-Architect health data."""
 
-    def __init__(self, db_path: Optional[Path] = None, auto_init_schema: bool = True):
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        auto_init_schema: bool = True,
+        read_only: bool = False,
+    ):
         """Initialize database client.
 
         Args:
             db_path: Path to SQLite database file. Defaults to data/databases/sqlite/bio.db
             auto_init_schema: Whether to automatically initialize schema when engine is created.
                              Defaults to True. Set to False for testing scenarios.
+            read_only: Open an existing database in read-only mode (mode=ro plus
+                       PRAGMA query_only). Implies auto_init_schema=False, so
+                       creating the engine raises sqlite3.DatabaseError if the
+                       database predates SCHEMA_VERSION.
         """
         self.db_path = db_path or DEFAULT_DB_PATH
+        self.read_only = read_only
         self._engine: Optional[Engine] = None
-        self._auto_init_schema = auto_init_schema
+        self._auto_init_schema = auto_init_schema and not read_only
         self._schema_initialized = False
 
     @property
     def engine(self) -> Engine:
         """Get the SQLAlchemy engine, creating one if needed."""
         if self._engine is None:
-            # Ensure parent directory exists
-            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            if self.read_only:
+                url = f"sqlite:///{self.db_path.resolve().as_uri()}?mode=ro&uri=true"
+            else:
+                # Ensure parent directory exists
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                url = f"sqlite:///{self.db_path}"
 
-            self._engine = create_engine(f"sqlite:///{self.db_path}")
-            # Enable foreign keys for all connections
-            event.listen(self._engine, "connect", _enable_foreign_keys)
+            self._engine = create_engine(
+                url,
+                connect_args={
+                    "check_same_thread": False,
+                    "cached_statements": _STATEMENT_CACHE_SIZE,
+                },
+                **_JSON_CODEC,
+            )
+            # Configure PRAGMAs for all connections
+            event.listen(self._engine, "connect", _configure_sqlite)
+            if self.read_only:
+                event.listen(self._engine, "connect", _configure_read_only)
+                try:
+                    self._check_readable_schema()
+                except BaseException:
+                    self.close()
+                    raise
 
-            # Auto-initialize schema if enabled
+            # Auto-initialize schema if enabled and not already current
             if self._auto_init_schema and not self._schema_initialized:
-                self.init_schema()
+                if self._schema_is_current():
+                    self._schema_initialized = True
+                else:
+                    self.init_schema()
 
         return self._engine
 
+    def _check_readable_schema(self) -> None:
+        """Refuse to read a database older than SCHEMA_VERSION.
+
+        A read-only client cannot migrate the database, and queries against an
+        older schema bind blob UUIDs and integer enum codes to text columns,
+        so they would silently match nothing.
+        """
+        with self._engine.connect() as conn:
+            version = conn.exec_driver_sql("PRAGMA user_version").scalar()
+        if version < SCHEMA_VERSION:
+            raise sqlite3.DatabaseError(
+                f"Database schema version {version} is older than "
+                f"{SCHEMA_VERSION}; open it once without read_only to migrate it"
+            )
+
+    def _schema_is_current(self) -> bool:
+        """Check whether the database was initialized with SCHEMA_VERSION or later.
+
+        Reading one PRAGMA is much cheaper than create_all(), which inspects
+        every table on each CLI invocation. A newer database is left alone
+        rather than handed to init_schema(), which refuses to downgrade it.
+        """
+        with self._engine.connect() as conn:
+            version = conn.exec_driver_sql("PRAGMA user_version").scalar()
+        return version >= SCHEMA_VERSION
+
     def init_schema(self) -> None:
         """Create all database tables from SQLModel metadata.
 
         This method is idempotent - calling it multiple times is safe
-        and will only create tables that don't already exist.
+        and will only create tables that don't already exist. Raises
+        sqlite3.DatabaseError for a database newer than SCHEMA_VERSION.
         """
+        # Register every model with SQLModel metadata before creating tables
+        from . import _schema
+
         # Use _engine directly if available to avoid recursion from engine property
         engine = self._engine if self._engine else self.engine
-        SQLModel.metadata.create_all(engine)
+        with engine.connect() as conn:
+            # Migrations rewrite parent and child rows separately, so foreign
+            # keys are off for the transaction and checked once before commit.
+            # The PRAGMA has no effect inside a transaction, hence before BEGIN.
+            conn.exec_driver_sql("PRAGMA foreign_keys = OFF")
+            try:
+                # The sqlite3 driver runs DDL in autocommit mode, committing each
+                # CREATE separately; an explicit BEGIN makes the schema one transaction
+                conn.exec_driver_sql("BEGIN")
+                version = conn.exec_driver_sql("PRAGMA user_version").scalar()
+                if version > SCHEMA_VERSION:
+                    raise sqlite3.DatabaseError(
+                        f"Database schema version {version} is newer than "
+                        f"{SCHEMA_VERSION}; refusing to downgrade it"
+                    )
+                SQLModel.metadata.create_all(conn)
+                if version < _TABLE_REBUILD_VERSION:
+                    _rebuild_stale_tables(conn)
+                # create_all() skips tables that already exist, including their
+                # indexes, so add any indexes introduced since the database was created
+                for table in SQLModel.metadata.sorted_tables:
+                    for index in table.indexes:
+                        index.create(conn, checkfirst=True)
+                if version < _UUID_BLOB_VERSION:
+                    _convert_text_uuids(conn)
+                if version < _ENUM_CODE_VERSION:
+                    _convert_enum_names(conn)
+                # Created after the UUID conversion, so the index copies blob IDs
+                for statement in _schema.LABEL_SEARCH_DDL:
+                    conn.exec_driver_sql(statement)
+                if version < _LABEL_SEARCH_VERSION:
+                    for statement in _schema.LABEL_SEARCH_REBUILD:
+                        conn.exec_driver_sql(statement)
+                if conn.exec_driver_sql("PRAGMA foreign_key_check").first():
+                    raise sqlite3.IntegrityError(
+                        "Schema migration left foreign key violations"
+                    )
+                conn.exec_driver_sql(f"PRAGMA user_version = {SCHEMA_VERSION}")
+                conn.commit()
+            except BaseException:
+                # Roll back first: foreign_keys cannot be re-enabled mid-transaction
+                conn.rollback()
+                raise
+            finally:
+                conn.exec_driver_sql("PRAGMA foreign_keys = ON")
         self._schema_initialized = True
 
     def get_session(self) -> Session:
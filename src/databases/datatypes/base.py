@@ -1,10 +1,26 @@
 """Base repository class with common functionality."""
 
-from typing import TypeVar
+from collections.abc import Iterator
+from typing import Any, TypeVar
 
-from sqlmodel import Session, SQLModel, select
+from sqlalchemy import ColumnElement, literal_column
+from sqlalchemy.orm import configure_mappers
+from sqlmodel import Session, SQLModel, exists, insert, select
+from sqlmodel.sql.expression import Select
 
-T = TypeVar("T", bound=SQLModel)
+ModelT = TypeVar("ModelT", bound=SQLModel)
+
+# Rows fetched from SQLite per batch by statements streamed with yield_per
+STREAM_CHUNK_SIZE = 1000
+
+
+def insertion_order(model: type[SQLModel]) -> ColumnElement[int]:
+    """Return a sort key listing a table's rows in the order they were inserted.
+
+    SQLite gives each new row of a rowid table a larger rowid than any it
+    holds, and init_schema() keeps rowids when it rebuilds a table.
+    """
+    return literal_column(f"{model.__tablename__}.rowid")
 
 
 class BaseRepository:
@@ -13,18 +29,104 @@ class BaseRepository:
     def __init__(self, session: Session):
         self.session = session
 
-    def get_existing_by_source_file(self, model: type[T], source_file: str | None) -> T | None:
+    def begin_immediate(self) -> None:
+        """Open the session's transaction with BEGIN IMMEDIATE.
+
+        pysqlite otherwise starts a deferred transaction at the first write,
+        which has to upgrade to the write lock mid-transaction and can hit
+        SQLITE_BUSY when another process is writing. Taking the lock up front
+        also makes a duplicate import check and the inserts after it atomic.
+        Does nothing if a transaction is already open.
+        """
+        connection = self.session.connection()
+        if not connection.connection.dbapi_connection.in_transaction:
+            connection.exec_driver_sql("BEGIN IMMEDIATE")
+
+    def source_file_exists(self, model: type[SQLModel], source_file: str | None) -> bool:
         """Check if a record with this source_file already exists.
 
+        Runs a scalar EXISTS probe instead of loading the matching row.
+
         Args:
             model: The SQLModel class to query.
             source_file: The source file path to check.
 
         Returns:
-            The existing record if found, None otherwise.
+            True if a matching record exists, False otherwise.
         """
         if not source_file:
-            return None
+            return False
         return self.session.exec(
-            select(model).where(model.source_file == source_file)
-        ).first()
+            select(exists().where(model.source_file == source_file))
+        ).one()
+
+    def insert_all(self, model: type[ModelT], instances: list[ModelT]) -> None:
+        """Insert model instances with one core executemany.
+
+        The instances are not added to the session, so there is no unit of
+        work flush and nothing to refresh after commit. NULLs are rendered
+        explicitly, so rows leaving different optional fields unset still
+        share one statement rather than being batched by their key sets.
+
+        Args:
+            model: The SQLModel table class to insert into.
+            instances: Instances of model with their IDs already assigned.
+        """
+        if not instances:
+            return
+        self.session.execute(
+            insert(model).execution_options(render_nulls=True),
+            [instance.model_dump() for instance in instances],
+        )
+
+    def construct_all(
+        self,
+        model: type[ModelT],
+        statement: Select[Any],
+        params: dict[str, Any] | None = None,
+    ) -> list[ModelT]:
+        """Build untracked model instances from plain column rows.
+
+        ORM loading spends most of its time per row on identity map
+        bookkeeping and SQLModel instance setup. model_construct() skips
+        both. Use this for large read-only results only, because the
+        instances are not attached to the session.
+
+        Args:
+            model: The SQLModel table class to build.
+            statement: A select of ``model.__table__.columns`` in table order.
+            params: Values for the statement's bound parameters, if any.
+
+        Returns:
+            One model instance per result row.
+        """
+        # model_construct() skips the ORM load that would otherwise configure
+        # the mappers; attribute access on an unconfigured class fails
+        configure_mappers()
+        names = model.__table__.columns.keys()
+        return [
+            model.model_construct(**dict(zip(names, row)))
+            for row in self.session.exec(statement, params=params)
+        ]
+
+    def construct_each(
+        self,
+        model: type[ModelT],
+        statement: Select[Any],
+        params: dict[str, Any] | None = None,
+    ) -> Iterator[ModelT]:
+        """Stream untracked model instances from plain column rows.
+
+        The iterator counterpart of construct_all(). Rows are fetched
+        STREAM_CHUNK_SIZE at a time, so the whole result is never held in
+        memory. The session must stay open until iteration finishes.
+        """
+        # model_construct() skips the ORM load that would otherwise configure
+        # the mappers; attribute access on an unconfigured class fails
+        configure_mappers()
+        names = model.__table__.columns.keys()
+        rows = self.session.exec(
+            statement.execution_options(yield_per=STREAM_CHUNK_SIZE), params=params
+        )
+        for row in rows:
+            yield model.model_construct(**dict(zip(names, row)))
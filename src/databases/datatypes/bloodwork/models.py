@@ -3,10 +3,13 @@
 from datetime import date, datetime
 from enum import Enum
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
+from sqlalchemy import Index, text
 from sqlmodel import SQLModel, Field
 
+from ..ids import uuid7
+from ..types import UUIDBlob
 from .validators import BiomarkerCode
 
 
@@ -25,11 +28,15 @@ class LabReport(SQLModel, table=True):
     """A complete lab report containing multiple panels."""
 
     __tablename__ = "lab_reports"
+    # Date ordering for report listings and the biomarker history join
+    __table_args__ = (
+        Index("ix_lab_reports_collected_date_id", "collected_date", "id"),
+    )
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True, sa_type=UUIDBlob)
     lab_provider: str
     collected_date: date
-    source_file: Optional[str] = None
+    source_file: Optional[str] = Field(default=None, index=True)
     created_at: datetime = Field(default_factory=datetime.now)
 
 
@@ -37,9 +44,13 @@ class Panel(SQLModel, table=True):
     """A group of related biomarkers tested together."""
 
     __tablename__ = "panels"
+    # Covers the biomarkers -> panels -> lab_reports join without a table lookup
+    __table_args__ = (Index("ix_panels_id_lab_report_id", "id", "lab_report_id"),)
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
-    lab_report_id: UUID = Field(foreign_key="lab_reports.id")
+    id: UUID = Field(default_factory=uuid7, primary_key=True, sa_type=UUIDBlob)
+    lab_report_id: UUID = Field(
+        foreign_key="lab_reports.id", index=True, sa_type=UUIDBlob
+    )
     name: str
     comment: Optional[str] = None
 
@@ -48,9 +59,21 @@ class Biomarker(SQLModel, table=True):
     """A single biomarker measurement from a lab test."""
 
     __tablename__ = "biomarkers"
-
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
-    panel_id: UUID = Field(foreign_key="panels.id")
+    __table_args__ = (
+        # Declared here because Field(index=True) is lost on the Annotated code type
+        Index("ix_biomarkers_code_panel_id", "code", "panel_id"),
+        # Partial index over abnormal results only, which are few, for
+        # get_flagged_biomarkers(). Enum columns store member names.
+        Index(
+            "ix_biomarkers_abnormal_flag_code",
+            "flag",
+            "code",
+            sqlite_where=text("flag != 'NORMAL'"),
+        ),
+    )
+
+    id: UUID = Field(default_factory=uuid7, primary_key=True, sa_type=UUIDBlob)
+    panel_id: UUID = Field(foreign_key="panels.id", index=True, sa_type=UUIDBlob)
     name: str
     code: BiomarkerCode
     value: float
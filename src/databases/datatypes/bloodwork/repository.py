@@ -1,20 +1,52 @@
 """Repository for bloodwork data access."""
 
+from collections.abc import Iterator
 from uuid import UUID
 
-from sqlmodel import select
+from sqlalchemy import bindparam
+from sqlmodel import func, select
 
-from ..base import BaseRepository
+from ..base import BaseRepository, insertion_order
 from .models import Biomarker, Flag, LabReport, Panel
 
+# Hot statements built once and run with bound parameters, so each call
+# skips rebuilding the select and its compiled-cache key
+_REPORTS = select(*LabReport.__table__.columns).order_by(
+    LabReport.collected_date.desc()
+)
+# Panels and biomarkers list in import order, which the lab report follows
+_PANELS_FOR_REPORT = (
+    select(Panel)
+    .where(Panel.lab_report_id == bindparam("report_id"))
+    .order_by(insertion_order(Panel))
+)
+_BIOMARKERS_FOR_PANEL = (
+    select(*Biomarker.__table__.columns)
+    .where(Biomarker.panel_id == bindparam("panel_id"))
+    .order_by(insertion_order(Biomarker))
+)
+_BIOMARKER_HISTORY = (
+    select(*Biomarker.__table__.columns)
+    .join(Panel, Biomarker.panel_id == Panel.id)
+    .join(LabReport, Panel.lab_report_id == LabReport.id)
+    .where(Biomarker.code == bindparam("code"))
+    .order_by(LabReport.collected_date.desc())
+    .limit(bindparam("limit"))
+)
+_FLAGGED_BIOMARKERS = select(*Biomarker.__table__.columns).where(
+    Biomarker.flag != Flag.NORMAL
+)
+
 
 class BloodworkRepository(BaseRepository):
     """Repository for bloodwork database operations."""
 
     def list_reports(self) -> list[LabReport]:
-        """List all lab reports ordered by collected_date descending."""
-        statement = select(LabReport).order_by(LabReport.collected_date.desc())
-        return list(self.session.exec(statement).all())
+        """List all lab reports ordered by collected_date descending.
+
+        The returned reports are read-only and not attached to the session.
+        """
+        return self.construct_all(LabReport, _REPORTS)
 
     def get_report(self, report_id: UUID) -> LabReport | None:
         """Get a lab report by ID."""
@@ -22,53 +54,116 @@ class BloodworkRepository(BaseRepository):
 
     def get_panels_for_report(self, report_id: UUID) -> list[Panel]:
         """Get all panels for a lab report."""
-        statement = select(Panel).where(Panel.lab_report_id == report_id)
-        return list(self.session.exec(statement).all())
+        params = {"report_id": report_id}
+        return list(self.session.exec(_PANELS_FOR_REPORT, params=params).all())
+
+    def get_panels_for_reports(
+        self, report_ids: list[UUID]
+    ) -> dict[UUID, list[Panel]]:
+        """Get panels for several lab reports in one query.
+
+        Returns:
+            Dict mapping each report ID to its panels in import order.
+            Every requested ID is present, with an empty list if it has none.
+        """
+        panels_by_report: dict[UUID, list[Panel]] = {
+            report_id: [] for report_id in report_ids
+        }
+        if not report_ids:
+            return panels_by_report
+
+        statement = (
+            select(Panel)
+            .where(Panel.lab_report_id.in_(report_ids))
+            .order_by(insertion_order(Panel))
+        )
+        for panel in self.session.exec(statement).all():
+            panels_by_report[panel.lab_report_id].append(panel)
+        return panels_by_report
 
     def get_biomarkers_for_panel(self, panel_id: UUID) -> list[Biomarker]:
-        """Get all biomarkers for a panel."""
-        statement = select(Biomarker).where(Biomarker.panel_id == panel_id)
-        return list(self.session.exec(statement).all())
+        """Get all biomarkers for a panel.
+
+        The returned biomarkers are read-only and not attached to the session.
+        """
+        params = {"panel_id": panel_id}
+        return self.construct_all(Biomarker, _BIOMARKERS_FOR_PANEL, params)
+
+    def get_biomarkers_for_panels(
+        self, panel_ids: list[UUID]
+    ) -> dict[UUID, list[Biomarker]]:
+        """Get biomarkers for several panels in one query.
+
+        Returns:
+            Dict mapping each panel ID to its biomarkers in import order.
+            Every requested ID is present, with an empty list if it has none.
+            The biomarkers are read-only and not attached to the session.
+        """
+        biomarkers_by_panel: dict[UUID, list[Biomarker]] = {
+            panel_id: [] for panel_id in panel_ids
+        }
+        if not panel_ids:
+            return biomarkers_by_panel
 
-    def get_biomarker_history(self, code: str, limit: int = 4) -> list[Biomarker]:
-        """Get biomarker history for a code, ordered by date descending."""
         statement = (
-            select(Biomarker)
-            .join(Panel, Biomarker.panel_id == Panel.id)
-            .join(LabReport, Panel.lab_report_id == LabReport.id)
-            .where(Biomarker.code == code)
-            .order_by(LabReport.collected_date.desc())
-            .limit(limit)
+            select(*Biomarker.__table__.columns)
+            .where(Biomarker.panel_id.in_(panel_ids))
+            .order_by(insertion_order(Biomarker))
         )
-        return list(self.session.exec(statement).all())
+        for biomarker in self.construct_all(Biomarker, statement):
+            biomarkers_by_panel[biomarker.panel_id].append(biomarker)
+        return biomarkers_by_panel
+
+    def get_biomarker_history(self, code: str, limit: int = 4) -> list[Biomarker]:
+        """Get biomarker history for a code, ordered by date descending.
+
+        The returned biomarkers are read-only and not attached to the session.
+        """
+        params = {"code": code, "limit": limit}
+        return self.construct_all(Biomarker, _BIOMARKER_HISTORY, params)
 
     def get_flagged_biomarkers(self) -> list[Biomarker]:
-        """Get all biomarkers with non-normal flags."""
-        statement = select(Biomarker).where(Biomarker.flag != Flag.NORMAL)
-        return list(self.session.exec(statement).all())
+        """Get all biomarkers with non-normal flags.
+
+        The returned biomarkers are read-only and not attached to the session.
+        """
+        return self.construct_all(Biomarker, _FLAGGED_BIOMARKERS)
+
+    def iter_flagged_biomarkers(self) -> Iterator[Biomarker]:
+        """Stream all biomarkers with non-normal flags.
+
+        Biomarkers are built as the iterator advances rather than all at
+        once. The session must stay open until iteration finishes.
+        """
+        yield from self.construct_each(Biomarker, _FLAGGED_BIOMARKERS)
 
     def get_recent_biomarkers(self) -> list[Biomarker]:
-        """Get the most recent value for each biomarker code."""
-        # Get all biomarkers ordered by date descending
-        statement = (
-            select(Biomarker)
+        """Get the most recent value for each biomarker code, ordered by code.
+
+        The returned biomarkers are read-only and not attached to the session.
+        """
+        # Rank each code's values newest first and keep only the top row in SQL
+        ranked = (
+            select(
+                Biomarker.id,
+                func.row_number()
+                .over(
+                    partition_by=Biomarker.code,
+                    order_by=LabReport.collected_date.desc(),
+                )
+                .label("rank"),
+            )
             .join(Panel, Biomarker.panel_id == Panel.id)
             .join(LabReport, Panel.lab_report_id == LabReport.id)
-            .order_by(LabReport.collected_date.desc())
+            .subquery()
         )
-        all_biomarkers = self.session.exec(statement).all()
-
-        # Keep only the most recent for each code
-        seen_codes: set[str] = set()
-        biomarkers: list[Biomarker] = []
-        for b in all_biomarkers:
-            if b.code not in seen_codes:
-                seen_codes.add(b.code)
-                biomarkers.append(b)
-
-        # Sort by code for consistent output
-        biomarkers.sort(key=lambda b: b.code)
-        return biomarkers
+        statement = (
+            select(*Biomarker.__table__.columns)
+            .join(ranked, Biomarker.id == ranked.c.id)
+            .where(ranked.c.rank == 1)
+            .order_by(Biomarker.code)
+        )
+        return self.construct_all(Biomarker, statement)
 
     def save_report(
         self,
@@ -81,18 +176,15 @@ class BloodworkRepository(BaseRepository):
         Returns:
             True if newly created, False if already imported.
         """
-        if self.get_existing_by_source_file(LabReport, report.source_file):
+        self.begin_immediate()
+        if self.source_file_exists(LabReport, report.source_file):
+            self.session.rollback()
             return False
 
-        self.session.add(report)
-        self.session.flush()  # Ensure report exists before panels
-
-        for panel in panels:
-            self.session.add(panel)
-        self.session.flush()  # Ensure panels exist before biomarkers
-
-        for biomarker in biomarkers:
-            self.session.add(biomarker)
+        # Core INSERTs in FK order: one statement per table
+        self.insert_all(LabReport, [report])
+        self.insert_all(Panel, panels)
+        self.insert_all(Biomarker, biomarkers)
 
         self.session.commit()
         return True
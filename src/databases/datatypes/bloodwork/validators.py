@@ -1,17 +1,25 @@
 """Validators for bloodwork data."""
 
+from functools import lru_cache
 from typing import Annotated
 
 from pydantic import AfterValidator
 
 from src.databases.datatypes.validators import load_codes_from_yaml, validate_code
 
-VALID_BIOMARKER_CODES: set[str] = load_codes_from_yaml("biomarker_codes.yaml")
+VALID_BIOMARKER_CODES: frozenset[str] = frozenset(
+    load_codes_from_yaml("biomarker_codes.yaml")
+)
 
 
+# Only codes from the YAML vocabulary return (failures raise and are not
+# cached), so the cache is bounded by the number of known codes
+@lru_cache(maxsize=None)
 def validate_biomarker_code(v: str) -> str:
     """Validate biomarker code format and existence in YAML.
 
+    Results are cached, so repeated codes in an import skip the checks.
+
     Raises:
         ValueError: If code format is invalid or code is not in biomarker_codes.yaml.
     """
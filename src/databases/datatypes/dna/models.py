@@ -3,11 +3,15 @@
 from datetime import date, datetime
 from enum import Enum
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from pydantic import field_validator
+from sqlalchemy import Index
 from sqlmodel import SQLModel, Field
 
+from ..ids import uuid7
+from ..types import UUIDBlob
+
 
 class Repute(str, Enum):
     """SNP reputation indicating whether the variant is beneficial or harmful."""
@@ -21,10 +25,10 @@ class DnaTest(SQLModel, table=True):
 
     __tablename__ = "dna_tests"
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True, sa_type=UUIDBlob)
     source: str
     collected_date: date
-    source_file: str
+    source_file: str = Field(index=True)
     created_at: datetime = Field(default_factory=datetime.now)
 
 
@@ -32,9 +36,14 @@ class Snp(SQLModel, table=True):
     """A single nucleotide polymorphism from a DNA test."""
 
     __tablename__ = "snps"
-
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
-    dna_test_id: UUID = Field(foreign_key="dna_tests.id")
+    __table_args__ = (
+        # Gene lookups ordered by magnitude walk this index instead of sorting
+        Index("ix_snps_gene_magnitude", "gene", "magnitude"),
+        Index("ix_snps_rsid", "rsid"),
+    )
+
+    id: UUID = Field(default_factory=uuid7, primary_key=True, sa_type=UUIDBlob)
+    dna_test_id: UUID = Field(foreign_key="dna_tests.id", sa_type=UUIDBlob)
     rsid: str
     genotype: str
     magnitude: float
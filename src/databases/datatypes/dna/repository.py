@@ -1,33 +1,61 @@
 """Repository for DNA data access."""
 
+from collections.abc import Iterator
+
+from sqlalchemy import bindparam
 from sqlmodel import select
 
 from ..base import BaseRepository
 from .models import DnaTest, Snp
 
+# Hot statements built once and run with bound parameters, so each call
+# skips rebuilding the select and its compiled-cache key
+_TESTS = select(DnaTest).order_by(DnaTest.collected_date.desc())
+_SNP_BY_RSID = select(Snp).where(Snp.rsid == bindparam("rsid"))
+_SNPS_FOR_GENE = (
+    select(*Snp.__table__.columns)
+    .where(Snp.gene == bindparam("gene"))
+    .order_by(Snp.magnitude.desc())
+)
+_HIGH_IMPACT_SNPS = (
+    select(*Snp.__table__.columns)
+    .where(Snp.magnitude >= 3.0)
+    .order_by(Snp.magnitude.desc())
+)
+
 
 class DnaRepository(BaseRepository):
     """Repository for DNA database operations."""
 
     def list_tests(self) -> list[DnaTest]:
         """List all DNA tests ordered by collected_date descending."""
-        statement = select(DnaTest).order_by(DnaTest.collected_date.desc())
-        return list(self.session.exec(statement).all())
+        return list(self.session.exec(_TESTS).all())
 
     def get_snp_by_rsid(self, rsid: str) -> Snp | None:
         """Get a SNP by its rsid."""
-        statement = select(Snp).where(Snp.rsid == rsid)
-        return self.session.exec(statement).first()
+        return self.session.exec(_SNP_BY_RSID, params={"rsid": rsid}).first()
 
     def get_snps_for_gene(self, gene: str) -> list[Snp]:
-        """Get all SNPs for a gene, ordered by magnitude descending."""
-        statement = select(Snp).where(Snp.gene == gene).order_by(Snp.magnitude.desc())
-        return list(self.session.exec(statement).all())
+        """Get all SNPs for a gene, ordered by magnitude descending.
+
+        The returned SNPs are read-only and not attached to the session.
+        """
+        return self.construct_all(Snp, _SNPS_FOR_GENE, {"gene": gene})
 
     def get_high_impact_snps(self) -> list[Snp]:
-        """Get SNPs with magnitude >= 3, ordered by magnitude descending."""
-        statement = select(Snp).where(Snp.magnitude >= 3.0).order_by(Snp.magnitude.desc())
-        return list(self.session.exec(statement).all())
+        """Get SNPs with magnitude >= 3, ordered by magnitude descending.
+
+        The returned SNPs are read-only and not attached to the session.
+        """
+        return self.construct_all(Snp, _HIGH_IMPACT_SNPS)
+
+    def iter_high_impact_snps(self) -> Iterator[Snp]:
+        """Stream SNPs with magnitude >= 3, ordered by magnitude descending.
+
+        SNPs are built as the iterator advances rather than all at once.
+        The session must stay open until iteration finishes.
+        """
+        yield from self.construct_each(Snp, _HIGH_IMPACT_SNPS)
 
     def save_test(self, dna_test: DnaTest, snps: list[Snp]) -> bool:
         """Save a DNA test with its SNPs atomically.
@@ -35,14 +63,14 @@ class DnaRepository(BaseRepository):
         Returns:
             True if newly created, False if already imported.
         """
-        if self.get_existing_by_source_file(DnaTest, dna_test.source_file):
+        self.begin_immediate()
+        if self.source_file_exists(DnaTest, dna_test.source_file):
+            self.session.rollback()
             return False
 
-        self.session.add(dna_test)
-        self.session.flush()
-
-        for snp in snps:
-            self.session.add(snp)
+        # Core INSERTs in FK order: one statement per table
+        self.insert_all(DnaTest, [dna_test])
+        self.insert_all(Snp, snps)
 
         self.session.commit()
         return True
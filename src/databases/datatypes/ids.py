@@ -0,0 +1,25 @@
+"""Primary key generation for database datatypes."""
+
+import os
+import time
+from uuid import UUID
+
+_VERSION_7 = 0x7 << 76
+_VARIANT_RFC_4122 = 0x2 << 62
+_VERSION_MASK = 0xF << 76
+_VARIANT_MASK = 0x3 << 62
+
+
+def uuid7() -> UUID:
+    """Generate a time-ordered UUID version 7 (RFC 9562).
+
+    The first 48 bits are the Unix time in milliseconds, followed by random
+    bits. IDs created later sort after earlier ones, both as UUIDs and as the
+    16-byte blobs UUIDBlob stores, so new rows append to the right edge of
+    primary key b-trees instead of splitting pages at random positions.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10))
+    value = (value & ~_VERSION_MASK) | _VERSION_7
+    value = (value & ~_VARIANT_MASK) | _VARIANT_RFC_4122
+    return UUID(int=value)
@@ -3,14 +3,20 @@
 from datetime import datetime
 from enum import Enum
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from pydantic import field_validator
+from sqlalchemy import CheckConstraint, Index, text
 from sqlmodel import SQLModel, Field
 
+from ..ids import uuid7
+from ..types import EnumCode, UUIDBlob, enum_code
+
 
 class KnowledgeType(str, Enum):
-    """Type of knowledge entry."""
+    """Type of knowledge entry.
+
+    Stored by position (EnumCode): append new members, never reorder.
+    """
 
     INSIGHT = "insight"
     RECOMMENDATION = "recommendation"
@@ -19,14 +25,20 @@ class KnowledgeType(str, Enum):
 
 
 class KnowledgeStatus(str, Enum):
-    """Status of a knowledge entry."""
+    """Status of a knowledge entry.
+
+    Stored by position (EnumCode): append new members, never reorder.
+    """
 
     ACTIVE = "active"
     DEPRECATED = "deprecated"
 
 
 class LinkType(str, Enum):
-    """Type of entity a knowledge entry can be linked to."""
+    """Type of entity a knowledge entry can be linked to.
+
+    Stored by position (EnumCode): append new members, never reorder.
+    """
 
     SNP = "snp"
     BIOMARKER = "biomarker"
@@ -40,42 +52,72 @@ class Knowledge(SQLModel, table=True):
     """A knowledge entry storing insights, recommendations, or contraindications."""
 
     __tablename__ = "knowledge"
-
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
-    type: KnowledgeType
-    status: KnowledgeStatus = KnowledgeStatus.ACTIVE
+    __table_args__ = (
+        # Partial index for list_active(); deprecated entries are left out
+        Index(
+            "ix_knowledge_active_created_at",
+            "created_at",
+            sqlite_where=text(f"status = {enum_code(KnowledgeStatus.ACTIVE)}"),
+        ),
+        # Also enforced for rows built without validation, which table
+        # models skip on construction
+        CheckConstraint(
+            "confidence >= 0.0 AND confidence <= 1.0", name="ck_knowledge_confidence"
+        ),
+    )
+
+    id: UUID = Field(default_factory=uuid7, primary_key=True, sa_type=UUIDBlob)
+    type: KnowledgeType = Field(sa_type=EnumCode(KnowledgeType))
+    status: KnowledgeStatus = Field(
+        default=KnowledgeStatus.ACTIVE, sa_type=EnumCode(KnowledgeStatus)
+    )
     summary: str
     content: str
-    confidence: float
-    supersedes_id: Optional[UUID] = Field(default=None, foreign_key="knowledge.id")
+    confidence: float = Field(ge=0.0, le=1.0)
+    supersedes_id: Optional[UUID] = Field(
+        default=None, foreign_key="knowledge.id", sa_type=UUIDBlob
+    )
     supersession_reason: Optional[str] = None
     created_at: datetime = Field(default_factory=datetime.now)
 
-    @field_validator("confidence")
-    @classmethod
-    def validate_confidence(cls, v: float) -> float:
-        """Validate confidence is between 0.0 and 1.0."""
-        if v < 0.0 or v > 1.0:
-            raise ValueError("confidence must be between 0.0 and 1.0")
-        return v
-
 
 class KnowledgeLink(SQLModel, table=True):
     """A link between a knowledge entry and another entity."""
 
     __tablename__ = "knowledge_links"
-
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
-    knowledge_id: UUID = Field(foreign_key="knowledge.id")
-    link_type: LinkType
-    target_id: UUID  # Polymorphic reference, no FK constraint
+    __table_args__ = (
+        # Match the filter and sort of get_links_for_knowledge(), and cover
+        # the get_linked_to() subquery so it never reads the table
+        Index("ix_knowledge_links_knowledge_id_link_type", "knowledge_id", "link_type"),
+        Index(
+            "ix_knowledge_links_link_type_target_id_knowledge_id",
+            "link_type",
+            "target_id",
+            "knowledge_id",
+        ),
+        # WITHOUT ROWID: rows are stored in the primary key b-tree
+        {"sqlite_with_rowid": False},
+    )
+
+    id: UUID = Field(default_factory=uuid7, primary_key=True, sa_type=UUIDBlob)
+    knowledge_id: UUID = Field(foreign_key="knowledge.id", sa_type=UUIDBlob)
+    link_type: LinkType = Field(sa_type=EnumCode(LinkType))
+    target_id: UUID = Field(sa_type=UUIDBlob)  # Polymorphic reference, no FK
 
 
 class KnowledgeTag(SQLModel, table=True):
     """A tag associated with a knowledge entry."""
 
     __tablename__ = "knowledge_tags"
-
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
-    knowledge_id: UUID = Field(foreign_key="knowledge.id")
+    __table_args__ = (
+        # Match the filter and sort of get_tags_for_knowledge(), and cover
+        # the get_by_tag() subquery so it never reads the table
+        Index("ix_knowledge_tags_knowledge_id_tag", "knowledge_id", "tag"),
+        Index("ix_knowledge_tags_tag_knowledge_id", "tag", "knowledge_id"),
+        # WITHOUT ROWID: rows are stored in the primary key b-tree
+        {"sqlite_with_rowid": False},
+    )
+
+    id: UUID = Field(default_factory=uuid7, primary_key=True, sa_type=UUIDBlob)
+    knowledge_id: UUID = Field(foreign_key="knowledge.id", sa_type=UUIDBlob)
     tag: str
@@ -2,9 +2,11 @@
 
 from uuid import UUID
 
-from sqlalchemy import text
-from sqlmodel import Session, select
+from sqlalchemy import TableClause, bindparam, column, table
+from sqlmodel import exists, select, update
 
+from ..base import BaseRepository
+from ..types import UUIDBlob
 from .models import (
     Knowledge,
     KnowledgeLink,
@@ -13,92 +15,217 @@ from .models import (
     LinkType,
 )
 
+# Hot statements built once and run with bound parameters, so each call
+# skips rebuilding the select and its compiled-cache key
+_TAGS_FOR_KNOWLEDGE = (
+    select(KnowledgeTag)
+    .where(KnowledgeTag.knowledge_id == bindparam("knowledge_id"))
+    .order_by(KnowledgeTag.tag)
+)
+_LINKS_FOR_KNOWLEDGE = (
+    select(KnowledgeLink)
+    .where(KnowledgeLink.knowledge_id == bindparam("knowledge_id"))
+    .order_by(KnowledgeLink.link_type)
+)
+_ACTIVE_KNOWLEDGE = (
+    select(*Knowledge.__table__.columns)
+    .where(Knowledge.status == KnowledgeStatus.ACTIVE)
+    .order_by(Knowledge.created_at)
+)
+_KNOWLEDGE_BY_TAG = (
+    select(*Knowledge.__table__.columns)
+    .where(
+        Knowledge.id.in_(
+            select(KnowledgeTag.knowledge_id).where(
+                KnowledgeTag.tag == bindparam("tag")
+            )
+        )
+    )
+    .order_by(Knowledge.created_at)
+)
+_KNOWLEDGE_LINKED_TO = (
+    select(*Knowledge.__table__.columns)
+    .where(
+        Knowledge.id.in_(
+            select(KnowledgeLink.knowledge_id).where(
+                KnowledgeLink.link_type == bindparam("link_type"),
+                KnowledgeLink.target_id == bindparam("target_id"),
+            )
+        )
+    )
+    .order_by(Knowledge.created_at)
+)
+_DEPRECATE_KNOWLEDGE = (
+    update(Knowledge)
+    .where(Knowledge.id == bindparam("old_id"))
+    .values(status=KnowledgeStatus.DEPRECATED)
+)
 
-class KnowledgeRepository:
-    """Repository for knowledge database operations."""
 
-    def __init__(self, session: Session):
-        self.session = session
+def _id_table(name: str) -> TableClause:
+    """Describe just the id column of another domain's table.
+
+    Importing those domains' models would load every datatype package
+    whenever the knowledge CLI starts, only to check that an id exists.
+    """
+    return table(name, column("id", UUIDBlob))
+
+
+# Table holding each kind of link target
+_LINK_TARGET_TABLES: dict[LinkType, TableClause] = {
+    LinkType.SNP: _id_table("snps"),
+    LinkType.BIOMARKER: _id_table("biomarkers"),
+    LinkType.INGREDIENT: _id_table("ingredients"),
+    LinkType.SUPPLEMENT: _id_table("supplement_labels"),
+    LinkType.PROTOCOL: _id_table("supplement_protocols"),
+    LinkType.KNOWLEDGE: Knowledge.__table__,
+}
+_LINK_TARGET_EXISTS = {
+    link_type: select(exists().where(target.c.id == bindparam("target_id")))
+    for link_type, target in _LINK_TARGET_TABLES.items()
+}
+
+
+def _link_type_name(link: KnowledgeLink) -> str:
+    """Sort key listing an entry's links alphabetically by type.
+
+    link_type is stored as its definition-order code (EnumCode), so SQL
+    sorts by code to use the (knowledge_id, link_type) index and each
+    entry's few links are re-sorted by name in Python.
+    """
+    return link.link_type.name
+
+
+class KnowledgeRepository(BaseRepository):
+    """Repository for knowledge database operations."""
 
     def get_knowledge(self, knowledge_id: UUID) -> Knowledge | None:
         """Get a knowledge entry by ID."""
         return self.session.get(Knowledge, knowledge_id)
 
+    def get_knowledge_entries(self, knowledge_ids: set[UUID]) -> dict[UUID, Knowledge]:
+        """Get several knowledge entries in one query.
+
+        Returns:
+            Dict mapping each ID to its entry. IDs with no entry are omitted.
+        """
+        if not knowledge_ids:
+            return {}
+        statement = select(Knowledge).where(Knowledge.id.in_(knowledge_ids))
+        return {entry.id: entry for entry in self.session.exec(statement).all()}
+
     def get_tags_for_knowledge(self, knowledge_id: UUID) -> list[KnowledgeTag]:
         """Get all tags for a knowledge entry."""
+        params = {"knowledge_id": knowledge_id}
+        return list(self.session.exec(_TAGS_FOR_KNOWLEDGE, params=params).all())
+
+    def get_links_for_knowledge(self, knowledge_id: UUID) -> list[KnowledgeLink]:
+        """Get all links for a knowledge entry."""
+        params = {"knowledge_id": knowledge_id}
+        links = self.session.exec(_LINKS_FOR_KNOWLEDGE, params=params).all()
+        return sorted(links, key=_link_type_name)
+
+    def get_tags_for_entries(
+        self, knowledge_ids: list[UUID]
+    ) -> dict[UUID, list[KnowledgeTag]]:
+        """Get tags for several knowledge entries in one query.
+
+        Returns:
+            Dict mapping each knowledge ID to its tags ordered by tag.
+            Every requested ID is present, with an empty list if it has none.
+        """
+        tags_by_entry: dict[UUID, list[KnowledgeTag]] = {
+            knowledge_id: [] for knowledge_id in knowledge_ids
+        }
+        if not knowledge_ids:
+            return tags_by_entry
+
         statement = (
             select(KnowledgeTag)
-            .where(KnowledgeTag.knowledge_id == knowledge_id)
+            .where(KnowledgeTag.knowledge_id.in_(knowledge_ids))
             .order_by(KnowledgeTag.tag)
         )
-        return list(self.session.exec(statement).all())
+        for tag in self.session.exec(statement).all():
+            tags_by_entry[tag.knowledge_id].append(tag)
+        return tags_by_entry
+
+    def get_links_for_entries(
+        self, knowledge_ids: list[UUID]
+    ) -> dict[UUID, list[KnowledgeLink]]:
+        """Get links for several knowledge entries in one query.
+
+        Returns:
+            Dict mapping each knowledge ID to its links ordered by link type.
+            Every requested ID is present, with an empty list if it has none.
+        """
+        links_by_entry: dict[UUID, list[KnowledgeLink]] = {
+            knowledge_id: [] for knowledge_id in knowledge_ids
+        }
+        if not knowledge_ids:
+            return links_by_entry
 
-    def get_links_for_knowledge(self, knowledge_id: UUID) -> list[KnowledgeLink]:
-        """Get all links for a knowledge entry."""
         statement = (
             select(KnowledgeLink)
-            .where(KnowledgeLink.knowledge_id == knowledge_id)
-            .order_by(KnowledgeLink.link_type)
+            .where(KnowledgeLink.knowledge_id.in_(knowledge_ids))
+            .order_by(KnowledgeLink.knowledge_id, KnowledgeLink.link_type)
         )
-        return list(self.session.exec(statement).all())
+        for link in self.session.exec(statement).all():
+            links_by_entry[link.knowledge_id].append(link)
+        for links in links_by_entry.values():
+            links.sort(key=_link_type_name)
+        return links_by_entry
 
     def list_active(self) -> list[Knowledge]:
-        """List all active knowledge entries."""
-        statement = select(Knowledge).where(Knowledge.status == KnowledgeStatus.ACTIVE)
-        return list(self.session.exec(statement).all())
+        """List all active knowledge entries, oldest first.
+
+        The returned entries are read-only and not attached to the session.
+        """
+        return self.construct_all(Knowledge, _ACTIVE_KNOWLEDGE)
 
     def get_by_tag(self, tag: str) -> list[Knowledge]:
-        """Get knowledge entries by tag."""
-        tag_results = self.session.exec(
-            select(KnowledgeTag.knowledge_id)
-            .where(KnowledgeTag.tag == tag)
-            .distinct()
-        ).all()
-
-        entries = []
-        for knowledge_id in tag_results:
-            knowledge = self.session.get(Knowledge, knowledge_id)
-            if knowledge:
-                entries.append(knowledge)
-        return entries
+        """Get knowledge entries by tag, oldest first.
+
+        The returned entries are read-only and not attached to the session.
+        """
+        return self.construct_all(Knowledge, _KNOWLEDGE_BY_TAG, {"tag": tag})
 
     def get_linked_to(self, link_type: LinkType, target_id: UUID) -> list[Knowledge]:
-        """Get knowledge entries linked to a target."""
-        link_results = self.session.exec(
-            select(KnowledgeLink.knowledge_id)
-            .where(
-                KnowledgeLink.link_type == link_type,
-                KnowledgeLink.target_id == target_id,
-            )
-            .distinct()
-        ).all()
+        """Get knowledge entries linked to a target, oldest first.
 
-        entries = []
-        for knowledge_id in link_results:
-            knowledge = self.session.get(Knowledge, knowledge_id)
-            if knowledge:
-                entries.append(knowledge)
-        return entries
+        The returned entries are read-only and not attached to the session.
+        """
+        params = {"link_type": link_type, "target_id": target_id}
+        return self.construct_all(Knowledge, _KNOWLEDGE_LINKED_TO, params)
 
     def validate_link_target_exists(self, link_type: LinkType, target_id: UUID) -> bool:
         """Check if a link target exists in the database."""
-        table_map = {
-            LinkType.SNP: "snps",
-            LinkType.BIOMARKER: "biomarkers",
-            LinkType.INGREDIENT: "ingredients",
-            LinkType.SUPPLEMENT: "supplement_labels",
-            LinkType.PROTOCOL: "supplement_protocols",
-            LinkType.KNOWLEDGE: "knowledge",
-        }
-
-        table = table_map.get(link_type)
-        if table is None:
+        statement = _LINK_TARGET_EXISTS.get(link_type)
+        if statement is None:
             return False
+        return self.session.scalar(statement, params={"target_id": target_id})
 
-        result = self.session.exec(
-            text(f"SELECT 1 FROM {table} WHERE id = :id"), {"id": str(target_id)}
-        )
-        return result.first() is not None
+    def validate_link_targets_exist(
+        self, targets: list[tuple[LinkType, UUID]]
+    ) -> dict[tuple[LinkType, UUID], bool]:
+        """Check several link targets with one query per link type.
+
+        Returns:
+            Dict mapping each (link_type, target_id) pair to whether the
+            target exists. Every requested pair is present.
+        """
+        found = {target: False for target in targets}
+        ids_by_type: dict[LinkType, set[UUID]] = {}
+        for link_type, target_id in targets:
+            ids_by_type.setdefault(link_type, set()).add(target_id)
+
+        for link_type, target_ids in ids_by_type.items():
+            target = _LINK_TARGET_TABLES.get(link_type)
+            if target is None:
+                continue
+            statement = select(target.c.id).where(target.c.id.in_(target_ids))
+            for target_id in self.session.exec(statement).all():
+                found[(link_type, target_id)] = True
+        return found
 
     def save_knowledge(
         self,
@@ -107,11 +234,11 @@ class KnowledgeRepository:
         links: list[KnowledgeLink],
     ) -> None:
         """Save a knowledge entry with its tags and links."""
+        self.begin_immediate()
+        # One commit flushes each table's new rows as a single executemany
         self.session.add(knowledge)
-        for tag in tags:
-            self.session.add(tag)
-        for link in links:
-            self.session.add(link)
+        self.session.add_all(tags)
+        self.session.add_all(links)
         self.session.commit()
 
     def supersede(
@@ -122,30 +249,28 @@ class KnowledgeRepository:
         links: list[KnowledgeLink],
     ) -> None:
         """Supersede an existing knowledge entry with a new one."""
-        old_knowledge = self.session.get(Knowledge, old_id)
-        if old_knowledge is None:
+        self.begin_immediate()
+        # Deprecate the old entry in one UPDATE; no matched row means it
+        # does not exist, which saves loading it first
+        deprecated = self.session.execute(_DEPRECATE_KNOWLEDGE, {"old_id": old_id})
+        if deprecated.rowcount == 0:
+            self.session.rollback()
             raise ValueError(f"Knowledge entry not found: {old_id}")
 
         # Set supersedes reference
         new_knowledge.supersedes_id = old_id
 
-        # Mark old entry as deprecated
-        old_knowledge.status = KnowledgeStatus.DEPRECATED
-
         # Save new knowledge with tags and links
         self.session.add(new_knowledge)
-        self.session.add(old_knowledge)
-
-        for tag in tags:
-            new_tag = KnowledgeTag(knowledge_id=new_knowledge.id, tag=tag.tag)
-            self.session.add(new_tag)
-
-        for link in links:
-            new_link = KnowledgeLink(
+        self.session.add_all(
+            KnowledgeTag(knowledge_id=new_knowledge.id, tag=tag.tag) for tag in tags
+        )
+        self.session.add_all(
+            KnowledgeLink(
                 knowledge_id=new_knowledge.id,
                 link_type=link.link_type,
                 target_id=link.target_id,
             )
-            self.session.add(new_link)
-
+            for link in links
+        )
         self.session.commit()
@@ -3,16 +3,21 @@
 from datetime import datetime
 from enum import Enum
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import Column, JSON
+from sqlalchemy import Column, Index, JSON
 from sqlmodel import SQLModel, Field
 
+from ..ids import uuid7
+from ..types import EnumCode, UUIDBlob
 from .validators import IngredientCode
 
 
 class SupplementForm(str, Enum):
-    """Physical form of the supplement."""
+    """Physical form of the supplement.
+
+    Stored by position (EnumCode): append new members, never reorder.
+    """
 
     CAPSULE = "capsule"
     TABLET = "tablet"
@@ -24,7 +29,10 @@ class SupplementForm(str, Enum):
 
 
 class IngredientType(str, Enum):
-    """Type of ingredient."""
+    """Type of ingredient.
+
+    Stored by position (EnumCode): append new members, never reorder.
+    """
 
     ACTIVE = "active"
     BLEND = "blend"
@@ -35,13 +43,17 @@ class SupplementLabel(SQLModel, table=True):
     """Complete supplement label data."""
 
     __tablename__ = "supplement_labels"
+    # Matches the sort of list_labels()
+    __table_args__ = (
+        Index("ix_supplement_labels_brand_product_name", "brand", "product_name"),
+    )
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
-    source_file: Optional[str] = None
+    id: UUID = Field(default_factory=uuid7, primary_key=True, sa_type=UUIDBlob)
+    source_file: Optional[str] = Field(default=None, index=True)
     created_at: datetime = Field(default_factory=datetime.now)
     brand: str
     product_name: str
-    form: SupplementForm
+    form: SupplementForm = Field(sa_type=EnumCode(SupplementForm))
     serving_size: str
     servings_per_container: Optional[int] = None
     suggested_use: Optional[str] = None
@@ -49,13 +61,43 @@ class SupplementLabel(SQLModel, table=True):
     allergen_info: Optional[str] = None
 
 
+# Trigram full-text index over label names, so substring searches use an
+# index instead of scanning with LIKE '%term%'. SQLAlchemy cannot declare
+# FTS5 tables, so DatabaseClient.init_schema() runs this DDL, and triggers
+# keep the index in step with supplement_labels.
+LABEL_SEARCH_TABLE = "supplement_labels_fts"
+LABEL_SEARCH_DDL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {LABEL_SEARCH_TABLE} "
+    "USING fts5(id UNINDEXED, brand, product_name, tokenize = 'trigram')",
+    f"CREATE TRIGGER IF NOT EXISTS {LABEL_SEARCH_TABLE}_insert "
+    "AFTER INSERT ON supplement_labels BEGIN "
+    f"INSERT INTO {LABEL_SEARCH_TABLE} (id, brand, product_name) "
+    "VALUES (new.id, new.brand, new.product_name); END",
+    f"CREATE TRIGGER IF NOT EXISTS {LABEL_SEARCH_TABLE}_update "
+    "AFTER UPDATE OF id, brand, product_name ON supplement_labels BEGIN "
+    f"UPDATE {LABEL_SEARCH_TABLE} SET id = new.id, brand = new.brand, "
+    "product_name = new.product_name WHERE id = old.id; END",
+    f"CREATE TRIGGER IF NOT EXISTS {LABEL_SEARCH_TABLE}_delete "
+    "AFTER DELETE ON supplement_labels BEGIN "
+    f"DELETE FROM {LABEL_SEARCH_TABLE} WHERE id = old.id; END",
+)
+# Refills the index from supplement_labels, for databases created before it
+LABEL_SEARCH_REBUILD = (
+    f"DELETE FROM {LABEL_SEARCH_TABLE}",
+    f"INSERT INTO {LABEL_SEARCH_TABLE} (id, brand, product_name) "
+    "SELECT id, brand, product_name FROM supplement_labels",
+)
+
+
 class ProprietaryBlend(SQLModel, table=True):
     """A proprietary blend containing multiple ingredients."""
 
     __tablename__ = "proprietary_blends"
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
-    supplement_label_id: UUID = Field(foreign_key="supplement_labels.id")
+    id: UUID = Field(default_factory=uuid7, primary_key=True, sa_type=UUIDBlob)
+    supplement_label_id: UUID = Field(
+        foreign_key="supplement_labels.id", index=True, sa_type=UUIDBlob
+    )
     name: str
     total_amount: Optional[float] = None
     total_unit: Optional[str] = None
@@ -65,15 +107,28 @@ class Ingredient(SQLModel, table=True):
     """A unified ingredient model that can represent active, blend, or other ingredients."""
 
     __tablename__ = "ingredients"
+    __table_args__ = (
+        # Declared here because Field(index=True) is lost on the Annotated code type
+        Index("ix_ingredients_code", "code"),
+        # Match the filter and sort of get_ingredients_for_label() and
+        # get_ingredients_for_blend(); they also index the foreign keys
+        Index(
+            "ix_ingredients_supplement_label_id_type_name",
+            "supplement_label_id",
+            "type",
+            "name",
+        ),
+        Index("ix_ingredients_blend_id_name", "blend_id", "name"),
+    )
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True, sa_type=UUIDBlob)
     supplement_label_id: Optional[UUID] = Field(
-        default=None, foreign_key="supplement_labels.id"
+        default=None, foreign_key="supplement_labels.id", sa_type=UUIDBlob
     )
     blend_id: Optional[UUID] = Field(
-        default=None, foreign_key="proprietary_blends.id"
+        default=None, foreign_key="proprietary_blends.id", sa_type=UUIDBlob
     )
-    type: IngredientType
+    type: IngredientType = Field(sa_type=EnumCode(IngredientType))
     name: str
     code: IngredientCode
     amount: Optional[float] = None
@@ -1,11 +1,56 @@
 """Repository for supplement data access."""
 
+from collections.abc import Iterator
 from uuid import UUID
 
+from sqlalchemy import bindparam, column, literal_column, table
 from sqlmodel import or_, select
 
-from ..base import BaseRepository
-from .models import Ingredient, ProprietaryBlend, SupplementLabel
+from ..base import STREAM_CHUNK_SIZE, BaseRepository
+from ..types import UUIDBlob
+from .models import LABEL_SEARCH_TABLE, Ingredient, ProprietaryBlend, SupplementLabel
+
+# The trigram tokenizer indexes three-character sequences, so shorter
+# search terms cannot match through it and fall back to LIKE
+_TRIGRAM_LENGTH = 3
+
+_label_search = table(LABEL_SEARCH_TABLE, column("id", UUIDBlob))
+
+# Hot statements built once and run with bound parameters, so each call
+# skips rebuilding the select and its compiled-cache key
+_LABELS = select(SupplementLabel).order_by(
+    SupplementLabel.brand, SupplementLabel.product_name
+)
+_LABELS_STREAMED = _LABELS.execution_options(yield_per=STREAM_CHUNK_SIZE)
+_INGREDIENTS_FOR_LABEL = (
+    select(Ingredient)
+    .where(Ingredient.supplement_label_id == bindparam("label_id"))
+    .order_by(Ingredient.type, Ingredient.name)
+)
+_BLENDS_FOR_LABEL = (
+    select(ProprietaryBlend)
+    .where(ProprietaryBlend.supplement_label_id == bindparam("label_id"))
+    .order_by(ProprietaryBlend.name)
+)
+_INGREDIENTS_FOR_BLEND = (
+    select(Ingredient)
+    .where(Ingredient.blend_id == bindparam("blend_id"))
+    .order_by(Ingredient.name)
+)
+_INGREDIENTS_BY_CODE = select(Ingredient).where(Ingredient.code == bindparam("code"))
+_LABELS_MATCHING = select(SupplementLabel).where(
+    or_(
+        SupplementLabel.brand.like(bindparam("pattern")),
+        SupplementLabel.product_name.like(bindparam("pattern")),
+    )
+)
+_LABELS_SEARCHED = select(SupplementLabel).where(
+    SupplementLabel.id.in_(
+        select(_label_search.c.id).where(
+            literal_column(LABEL_SEARCH_TABLE).match(bindparam("query"))
+        )
+    )
+)
 
 
 class SupplementRepository(BaseRepository):
@@ -13,57 +58,86 @@ class SupplementRepository(BaseRepository):
 
     def list_labels(self) -> list[SupplementLabel]:
         """List all supplement labels ordered by brand and product name."""
-        statement = select(SupplementLabel).order_by(
-            SupplementLabel.brand, SupplementLabel.product_name
-        )
-        return list(self.session.exec(statement).all())
+        return list(self.session.exec(_LABELS).all())
+
+    def iter_labels(self) -> Iterator[SupplementLabel]:
+        """Stream all supplement labels ordered by brand and product name.
+
+        Labels are loaded in chunks as the iterator advances rather than all
+        at once. The session must stay open until iteration finishes.
+        """
+        yield from self.session.exec(_LABELS_STREAMED)
 
     def get_label(self, label_id: UUID) -> SupplementLabel | None:
         """Get a supplement label by ID."""
         return self.session.get(SupplementLabel, label_id)
 
+    def get_labels(self, label_ids: set[UUID]) -> dict[UUID, SupplementLabel]:
+        """Get several supplement labels in one query.
+
+        Returns:
+            Dict mapping each ID to its label. IDs with no label are omitted.
+        """
+        if not label_ids:
+            return {}
+        statement = select(SupplementLabel).where(SupplementLabel.id.in_(label_ids))
+        return {label.id: label for label in self.session.exec(statement).all()}
+
     def get_ingredients_for_label(self, label_id: UUID) -> list[Ingredient]:
         """Get all ingredients directly linked to a label."""
-        statement = (
-            select(Ingredient)
-            .where(Ingredient.supplement_label_id == label_id)
-            .order_by(Ingredient.type, Ingredient.name)
-        )
-        return list(self.session.exec(statement).all())
+        params = {"label_id": label_id}
+        return list(self.session.exec(_INGREDIENTS_FOR_LABEL, params=params).all())
 
     def get_blends_for_label(self, label_id: UUID) -> list[ProprietaryBlend]:
         """Get all proprietary blends for a label."""
-        statement = (
-            select(ProprietaryBlend)
-            .where(ProprietaryBlend.supplement_label_id == label_id)
-            .order_by(ProprietaryBlend.name)
-        )
-        return list(self.session.exec(statement).all())
+        params = {"label_id": label_id}
+        return list(self.session.exec(_BLENDS_FOR_LABEL, params=params).all())
 
     def get_ingredients_for_blend(self, blend_id: UUID) -> list[Ingredient]:
         """Get all ingredients for a proprietary blend."""
+        params = {"blend_id": blend_id}
+        return list(self.session.exec(_INGREDIENTS_FOR_BLEND, params=params).all())
+
+    def get_ingredients_for_blends(
+        self, blend_ids: list[UUID]
+    ) -> dict[UUID, list[Ingredient]]:
+        """Get ingredients for several proprietary blends in one query.
+
+        Returns:
+            Dict mapping each blend ID to its ingredients ordered by name.
+            Every requested ID is present, with an empty list if it has none.
+        """
+        ingredients_by_blend: dict[UUID, list[Ingredient]] = {
+            blend_id: [] for blend_id in blend_ids
+        }
+        if not blend_ids:
+            return ingredients_by_blend
+
         statement = (
             select(Ingredient)
-            .where(Ingredient.blend_id == blend_id)
+            .where(Ingredient.blend_id.in_(blend_ids))
             .order_by(Ingredient.name)
         )
-        return list(self.session.exec(statement).all())
+        for ingredient in self.session.exec(statement).all():
+            ingredients_by_blend[ingredient.blend_id].append(ingredient)
+        return ingredients_by_blend
 
     def get_ingredients_by_code(self, code: str) -> list[Ingredient]:
         """Get all ingredients matching a code."""
-        statement = select(Ingredient).where(Ingredient.code == code)
-        return list(self.session.exec(statement).all())
+        params = {"code": code}
+        return list(self.session.exec(_INGREDIENTS_BY_CODE, params=params).all())
 
     def search_labels(self, term: str) -> list[SupplementLabel]:
-        """Search labels by brand or product name."""
-        search_term = f"%{term}%"
-        statement = select(SupplementLabel).where(
-            or_(
-                SupplementLabel.brand.like(search_term),
-                SupplementLabel.product_name.like(search_term),
-            )
-        )
-        return list(self.session.exec(statement).all())
+        """Search labels by brand or product name.
+
+        Matches case-insensitive substrings through the trigram search index.
+        """
+        if len(term) < _TRIGRAM_LENGTH:
+            params = {"pattern": f"%{term}%"}
+            return list(self.session.exec(_LABELS_MATCHING, params=params).all())
+        # Quoted as an FTS5 string, so the term is matched literally
+        params = {"query": '"' + term.replace('"', '""') + '"'}
+        return list(self.session.exec(_LABELS_SEARCHED, params=params).all())
 
     def save_label(
         self,
@@ -76,18 +150,15 @@ class SupplementRepository(BaseRepository):
         Returns:
             True if newly created, False if already imported.
         """
-        if self.get_existing_by_source_file(SupplementLabel, label.source_file):
+        self.begin_immediate()
+        if self.source_file_exists(SupplementLabel, label.source_file):
+            self.session.rollback()
             return False
 
-        self.session.add(label)
-        self.session.flush()  # Ensure label exists before blends/ingredients
-
-        for blend in blends:
-            self.session.add(blend)
-        self.session.flush()  # Ensure blends exist before blend ingredients
-
-        for ingredient in ingredients:
-            self.session.add(ingredient)
+        # Core INSERTs in FK order: one statement per table
+        self.insert_all(SupplementLabel, [label])
+        self.insert_all(ProprietaryBlend, blends)
+        self.insert_all(Ingredient, ingredients)
 
         self.session.commit()
         return True
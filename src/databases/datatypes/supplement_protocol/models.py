@@ -3,11 +3,16 @@
 from datetime import date, datetime
 from enum import Enum
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import Column, JSON
+from sqlalchemy import Column, Index, JSON
 from sqlmodel import SQLModel, Field
 
+# Registers the supplement_labels table targeted by ProtocolSupplement's foreign key
+from ..supplement.models import SupplementLabel  # noqa: F401
+from ..ids import uuid7
+from ..types import UUIDBlob
+
 
 class Frequency(str, Enum):
     """Frequency of supplement intake."""
@@ -30,11 +35,11 @@ class SupplementProtocol(SQLModel, table=True):
 
     __tablename__ = "supplement_protocols"
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
-    protocol_date: date
+    id: UUID = Field(default_factory=uuid7, primary_key=True, sa_type=UUIDBlob)
+    protocol_date: date = Field(index=True)
     prescriber: Optional[str] = None
     next_visit: Optional[str] = None
-    source_file: Optional[str] = None
+    source_file: Optional[str] = Field(default=None, index=True)
     created_at: datetime = Field(default_factory=datetime.now)
     protein_goal: Optional[str] = None
     lifestyle_notes: list[str] = Field(default_factory=list, sa_column=Column(JSON))
@@ -44,11 +49,14 @@ class ProtocolSupplement(SQLModel, table=True):
     """A supplement entry in a protocol (either scheduled or own)."""
 
     __tablename__ = "protocol_supplements"
+    __table_args__ = (
+        Index("ix_protocol_supplements_protocol_id_name", "protocol_id", "name"),
+    )
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
-    protocol_id: UUID = Field(foreign_key="supplement_protocols.id")
+    id: UUID = Field(default_factory=uuid7, primary_key=True, sa_type=UUIDBlob)
+    protocol_id: UUID = Field(foreign_key="supplement_protocols.id", sa_type=UUIDBlob)
     supplement_label_id: Optional[UUID] = Field(
-        default=None, foreign_key="supplement_labels.id"
+        default=None, foreign_key="supplement_labels.id", sa_type=UUIDBlob
     )
     type: ProtocolSupplementType
     name: str
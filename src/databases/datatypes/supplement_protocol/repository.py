@@ -1,22 +1,53 @@
 """Repository for supplement protocol data access."""
 
+from typing import Any
 from uuid import UUID
 
+from sqlalchemy import bindparam
 from sqlmodel import select
+from sqlmodel.sql.expression import Select
 
-from ..base import BaseRepository
+from ..base import BaseRepository, insertion_order
 from .models import ProtocolSupplement, SupplementProtocol
 
+# Hot statements built once and run with bound parameters, so each call
+# skips rebuilding the select and its compiled-cache key
+_PROTOCOLS = select(SupplementProtocol).order_by(
+    SupplementProtocol.protocol_date.desc()
+)
+_CURRENT_PROTOCOL = _PROTOCOLS.limit(1)
+# Supplements list in import order, which the protocol file follows
+_SUPPLEMENTS_FOR_PROTOCOL = (
+    select(ProtocolSupplement)
+    .where(ProtocolSupplement.protocol_id == bindparam("protocol_id"))
+    .order_by(insertion_order(ProtocolSupplement))
+)
+# One protocol and its supplements via a LEFT OUTER JOIN
+_WITH_SUPPLEMENTS = (
+    select(SupplementProtocol, ProtocolSupplement)
+    .outerjoin(
+        ProtocolSupplement, ProtocolSupplement.protocol_id == SupplementProtocol.id
+    )
+    .order_by(insertion_order(ProtocolSupplement))
+)
+_PROTOCOL_WITH_SUPPLEMENTS = _WITH_SUPPLEMENTS.where(
+    SupplementProtocol.id == bindparam("protocol_id")
+)
+_CURRENT_PROTOCOL_WITH_SUPPLEMENTS = _WITH_SUPPLEMENTS.where(
+    SupplementProtocol.id
+    == select(SupplementProtocol.id)
+    .order_by(SupplementProtocol.protocol_date.desc())
+    .limit(1)
+    .scalar_subquery()
+)
+
 
 class SupplementProtocolRepository(BaseRepository):
     """Repository for supplement protocol database operations."""
 
     def list_protocols(self) -> list[SupplementProtocol]:
         """List all protocols ordered by date descending."""
-        statement = select(SupplementProtocol).order_by(
-            SupplementProtocol.protocol_date.desc()
-        )
-        return list(self.session.exec(statement).all())
+        return list(self.session.exec(_PROTOCOLS).all())
 
     def get_protocol(self, protocol_id: UUID) -> SupplementProtocol | None:
         """Get a protocol by ID."""
@@ -24,21 +55,71 @@ class SupplementProtocolRepository(BaseRepository):
 
     def get_current_protocol(self) -> SupplementProtocol | None:
         """Get the most recent protocol."""
-        statement = (
-            select(SupplementProtocol)
-            .order_by(SupplementProtocol.protocol_date.desc())
-            .limit(1)
-        )
-        return self.session.exec(statement).first()
+        return self.session.exec(_CURRENT_PROTOCOL).first()
+
+    def get_protocol_with_supplements(
+        self, protocol_id: UUID
+    ) -> tuple[SupplementProtocol, list[ProtocolSupplement]] | None:
+        """Get a protocol and its supplements in one query.
+
+        Returns:
+            Tuple of (protocol, supplements), or None if not found.
+        """
+        params = {"protocol_id": protocol_id}
+        return self._get_with_supplements(_PROTOCOL_WITH_SUPPLEMENTS, params)
+
+    def get_current_protocol_with_supplements(
+        self,
+    ) -> tuple[SupplementProtocol, list[ProtocolSupplement]] | None:
+        """Get the most recent protocol and its supplements in one query.
+
+        Returns:
+            Tuple of (protocol, supplements), or None if no protocols exist.
+        """
+        return self._get_with_supplements(_CURRENT_PROTOCOL_WITH_SUPPLEMENTS)
+
+    def _get_with_supplements(
+        self,
+        statement: Select[Any],
+        params: dict[str, Any] | None = None,
+    ) -> tuple[SupplementProtocol, list[ProtocolSupplement]] | None:
+        """Fetch one protocol and its supplements from a joined statement."""
+        rows = self.session.exec(statement, params=params).all()
+        if not rows:
+            return None
+        # A protocol without supplements comes back as a single row with None
+        return rows[0][0], [supplement for _, supplement in rows if supplement]
 
     def get_supplements_for_protocol(
         self, protocol_id: UUID
     ) -> list[ProtocolSupplement]:
         """Get all supplements for a protocol."""
-        statement = select(ProtocolSupplement).where(
-            ProtocolSupplement.protocol_id == protocol_id
+        params = {"protocol_id": protocol_id}
+        return list(self.session.exec(_SUPPLEMENTS_FOR_PROTOCOL, params=params).all())
+
+    def get_supplements_for_protocols(
+        self, protocol_ids: list[UUID]
+    ) -> dict[UUID, list[ProtocolSupplement]]:
+        """Get supplements for several protocols in one query.
+
+        Returns:
+            Dict mapping each protocol ID to its supplements in import order.
+            Every requested ID is present, with an empty list if it has none.
+        """
+        supplements_by_protocol: dict[UUID, list[ProtocolSupplement]] = {
+            protocol_id: [] for protocol_id in protocol_ids
+        }
+        if not protocol_ids:
+            return supplements_by_protocol
+
+        statement = (
+            select(ProtocolSupplement)
+            .where(ProtocolSupplement.protocol_id.in_(protocol_ids))
+            .order_by(insertion_order(ProtocolSupplement))
         )
-        return list(self.session.exec(statement).all())
+        for supplement in self.session.exec(statement).all():
+            supplements_by_protocol[supplement.protocol_id].append(supplement)
+        return supplements_by_protocol
 
     def save_protocol(
         self,
@@ -50,14 +131,14 @@ class SupplementProtocolRepository(BaseRepository):
         Returns:
             True if newly created, False if already imported.
         """
-        if self.get_existing_by_source_file(SupplementProtocol, protocol.source_file):
+        self.begin_immediate()
+        if self.source_file_exists(SupplementProtocol, protocol.source_file):
+            self.session.rollback()
             return False
 
-        self.session.add(protocol)
-        self.session.flush()  # Ensure protocol exists before supplements
-
-        for supplement in supplements:
-            self.session.add(supplement)
+        # Core INSERTs in FK order: one statement per table
+        self.insert_all(SupplementProtocol, [protocol])
+        self.insert_all(ProtocolSupplement, supplements)
 
         self.session.commit()
         return True
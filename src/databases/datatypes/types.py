@@ -0,0 +1,81 @@
+"""Shared SQLAlchemy column types for database datatypes."""
+
+from enum import Enum
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import LargeBinary, SmallInteger
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator
+
+
+class UUIDBlob(TypeDecorator):
+    """UUID stored as its 16 raw bytes.
+
+    SQLAlchemy's default Uuid type stores 32 hex characters on SQLite, twice
+    the size of the value, which inflates every primary key, foreign key,
+    and the indexes built on them.
+    """
+
+    impl = LargeBinary(16)
+    cache_ok = True
+
+    def process_bind_param(
+        self, value: Optional[UUID], dialect: Dialect
+    ) -> Optional[bytes]:
+        """Convert a UUID to its 16-byte form for storage."""
+        if value is None:
+            return None
+        return value.bytes
+
+    def process_result_value(
+        self, value: Optional[bytes], dialect: Dialect
+    ) -> Optional[UUID]:
+        """Convert stored bytes back to a UUID."""
+        if value is None:
+            return None
+        return UUID(bytes=value)
+
+
+def enum_code(member: Enum) -> int:
+    """Return the integer EnumCode stores for an enum member."""
+    return list(type(member)).index(member)
+
+
+class EnumCode(TypeDecorator):
+    """Enum stored as the member's position in its class, as a small integer.
+
+    SQLAlchemy's Enum type stores the member name as text, repeated in every
+    row and in every index on the column. SQLite stores the codes 0 and 1 in
+    no bytes and others up to 127 in one. Codes follow definition order, so
+    new members must be appended and existing ones never reordered.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class: type[Enum]):
+        super().__init__()
+        self.enum_class = enum_class
+        self._members = tuple(enum_class)
+        self._codes = {member: code for code, member in enumerate(self._members)}
+
+    def process_bind_param(
+        self, value: Optional[Enum], dialect: Dialect
+    ) -> Optional[int]:
+        """Convert an enum member, or its value, to its code for storage."""
+        if value is None:
+            return None
+        try:
+            return self._codes[value]
+        except KeyError:
+            # A raw value rather than a member: look the member up first
+            return self._codes[self.enum_class(value)]
+
+    def process_result_value(
+        self, value: Optional[int], dialect: Dialect
+    ) -> Optional[Enum]:
+        """Convert a stored code back to its enum member."""
+        if value is None:
+            return None
+        return self._members[value]
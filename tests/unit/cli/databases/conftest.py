@@ -1,9 +1,25 @@
 """Shared fixtures for CLI database tests."""
 
+import os
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 
 from src.databases.clients.sqlite import DatabaseClient
 
+# Runs a CLI's main() against the database path in argv[1], with the rest of
+# argv as its arguments
+_RUN_CLI = (
+    "import functools, sys\n"
+    "from pathlib import Path\n"
+    "from src.databases.clients.sqlite import DatabaseClient\n"
+    "import cli.databases.{module} as cli\n"
+    "cli.DatabaseClient = functools.partial(DatabaseClient, db_path=Path(sys.argv[1]))\n"
+    "cli.main(sys.argv[2:])\n"
+)
+
 
 @pytest.fixture
 def db_client(tmp_path):
@@ -20,3 +36,32 @@ def db_session(db_client):
     """Create a database session for testing."""
     with db_client.get_session() as session:
         yield session
+
+
+@pytest.fixture
+def run_cli(db_client):
+    """Return a runner for a database CLI in a fresh interpreter.
+
+    A new process starts with nothing imported or configured, as a real
+    invocation does, so it catches state that earlier tests would set up.
+    The CLI reads and writes the test database.
+    """
+
+    def run(
+        module: str, *args: str, env: dict[str, str] | None = None
+    ) -> subprocess.CompletedProcess[str]:
+        return subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                _RUN_CLI.format(module=module),
+                str(db_client.db_path),
+                *args,
+            ],
+            capture_output=True,
+            text=True,
+            cwd=Path(__file__).resolve().parents[4],
+            env={**os.environ, **(env or {})},
+        )
+
+    return run
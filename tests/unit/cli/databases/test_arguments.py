@@ -0,0 +1,25 @@
+"""Tests for shared CLI argument helpers."""
+
+from uuid import uuid4
+
+import pytest
+
+from cli.databases.arguments import parse_uuid_or_exit
+
+
+class TestParseUuidOrExit:
+    """Tests for parse_uuid_or_exit function."""
+
+    def test_returns_parsed_uuid(self):
+        """A valid UUID string should be parsed."""
+        value = uuid4()
+
+        assert parse_uuid_or_exit(str(value), "label ID") == value
+
+    def test_exits_with_message_on_invalid_id(self, capsys):
+        """An invalid ID should print an error and exit with status 1."""
+        with pytest.raises(SystemExit) as exc_info:
+            parse_uuid_or_exit("not-a-uuid", "label ID")
+
+        assert exc_info.value.code == 1
+        assert capsys.readouterr().err == "Invalid label ID: not-a-uuid\n"
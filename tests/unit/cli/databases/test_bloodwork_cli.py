@@ -2,6 +2,7 @@
 
 import argparse
 import json
+from datetime import date
 from io import StringIO
 
 import pytest
@@ -346,3 +347,90 @@ class TestBloodworkImport:
         # Verify only one record exists
         reports = repo.list_reports()
         assert len(reports) == 1
+
+
+class TestBloodworkListings:
+    """Tests for the bloodwork listing commands in a fresh process."""
+
+    @pytest.fixture
+    def report(self, db_session):
+        """Save a report with one normal and one flagged biomarker."""
+        report = LabReport(
+            lab_provider="Quest",
+            collected_date=date(2024, 1, 15),
+            source_file="labs.json",
+        )
+        panel = Panel(lab_report_id=report.id, name="Metabolic Panel")
+        biomarkers = [
+            Biomarker(
+                panel_id=panel.id,
+                name="Glucose",
+                code="GLUCOSE",
+                value=95.0,
+                unit="mg/dL",
+            ),
+            Biomarker(
+                panel_id=panel.id,
+                name="LDL",
+                code="LDL",
+                value=150.0,
+                unit="mg/dL",
+                flag=Flag.HIGH,
+            ),
+        ]
+        BloodworkRepository(db_session).save_report(report, [panel], biomarkers)
+        return report
+
+    @pytest.mark.parametrize("json_flag", [[], ["--json"]])
+    def test_list(self, run_cli, report, json_flag):
+        """List should print saved reports in text and JSON mode."""
+        result = run_cli("bloodwork", *json_flag, "list")
+
+        assert result.returncode == 0, result.stderr
+        assert str(report.id) in result.stdout
+
+    def test_biomarker_history(self, run_cli, report):
+        """Biomarker should print the history for a code."""
+        result = run_cli("bloodwork", "biomarker", "GLUCOSE")
+
+        assert result.returncode == 0, result.stderr
+        assert "History for GLUCOSE:" in result.stdout
+        assert "Glucose\t95.00\tmg/dL\tnormal" in result.stdout
+
+    def test_flagged(self, run_cli, report):
+        """Flagged should print only the abnormal biomarker."""
+        result = run_cli("bloodwork", "flagged")
+
+        assert result.returncode == 0, result.stderr
+        assert "LDL\t150.00\tmg/dL\thigh" in result.stdout
+        assert "Glucose" not in result.stdout
+
+    def test_flagged_json(self, run_cli, report):
+        """Flagged should stream only the abnormal biomarker as JSON."""
+        result = run_cli("bloodwork", "--json", "flagged")
+
+        assert result.returncode == 0, result.stderr
+        [biomarker] = json.loads(result.stdout)
+        assert (biomarker["code"], biomarker["flag"]) == ("LDL", "high")
+
+    def test_recent_json_on_ascii_stdout(self, run_cli, db_session):
+        """Non-ASCII units should be escaped so an ASCII stdout can print them."""
+        report = LabReport(
+            lab_provider="Quest",
+            collected_date=date(2024, 1, 15),
+            source_file="zinc.json",
+        )
+        panel = Panel(lab_report_id=report.id, name="Minerals")
+        zinc = Biomarker(
+            panel_id=panel.id, name="Zinc", code="ZINC", value=90.0, unit="µg/dL"
+        )
+        BloodworkRepository(db_session).save_report(report, [panel], [zinc])
+
+        result = run_cli(
+            "bloodwork", "--json", "recent", env={"PYTHONIOENCODING": "ascii"}
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert '"unit": "\\u00b5g/dL"' in result.stdout
+        [biomarker] = json.loads(result.stdout)
+        assert biomarker["unit"] == "µg/dL"
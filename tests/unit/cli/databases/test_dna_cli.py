@@ -2,6 +2,7 @@
 
 import argparse
 import json
+from datetime import date
 from io import StringIO
 
 import pytest
@@ -264,3 +265,58 @@ class TestDnaImport:
         # Verify only one record exists
         tests = repo.list_tests()
         assert len(tests) == 1
+
+
+class TestDnaListings:
+    """Tests for the DNA listing commands in a fresh process."""
+
+    @pytest.fixture
+    def dna_test(self, db_session):
+        """Save a test with one high-impact and one low-impact SNP."""
+        dna_test = DnaTest(
+            source="23andMe",
+            collected_date=date(2024, 1, 15),
+            source_file="dna.json",
+        )
+        snps = [
+            Snp(
+                dna_test_id=dna_test.id,
+                rsid="rs1801133",
+                genotype="CT",
+                magnitude=3.0,
+                repute=Repute.BAD,
+                gene="MTHFR",
+            ),
+            Snp(
+                dna_test_id=dna_test.id,
+                rsid="rs4680",
+                genotype="AG",
+                magnitude=2.0,
+                gene="COMT",
+            ),
+        ]
+        DnaRepository(db_session).save_test(dna_test, snps)
+        return dna_test
+
+    def test_gene(self, run_cli, dna_test):
+        """Gene should print the SNPs for a gene."""
+        result = run_cli("dna", "gene", "MTHFR")
+
+        assert result.returncode == 0, result.stderr
+        assert "rs1801133\tCT\tMTHFR\t3.0\tbad" in result.stdout
+
+    def test_gene_json(self, run_cli, dna_test):
+        """Gene should print the SNPs for a gene as JSON."""
+        result = run_cli("dna", "--json", "gene", "MTHFR")
+
+        assert result.returncode == 0, result.stderr
+        [snp] = json.loads(result.stdout)
+        assert snp["rsid"] == "rs1801133"
+        assert snp["dna_test_id"] == str(dna_test.id)
+
+    def test_high_impact_json(self, run_cli, dna_test):
+        """High-impact should stream only SNPs with magnitude >= 3 as JSON."""
+        result = run_cli("dna", "--json", "high-impact")
+
+        assert result.returncode == 0, result.stderr
+        assert [snp["rsid"] for snp in json.loads(result.stdout)] == ["rs1801133"]
@@ -0,0 +1,23 @@
+"""Tests for the database CLI console script entry points."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+
+class TestEntrypointImports:
+    """Tests for keeping the completion path light."""
+
+    def test_import_does_not_load_database_layer(self):
+        """Importing the entry points should not import SQLAlchemy or the CLIs."""
+        code = (
+            "import sys\n"
+            "import cli.databases.entrypoints\n"
+            "print(any(m == 'sqlalchemy' or m.startswith('src.') for m in sys.modules))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True, text=True, check=True,
+            cwd=Path(__file__).resolve().parents[4],
+        )
+        assert result.stdout.strip() == "False"
@@ -0,0 +1,73 @@
+"""Tests for knowledge CLI commands."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.databases.datatypes.knowledge import (
+    Knowledge,
+    KnowledgeRepository,
+    KnowledgeTag,
+    KnowledgeType,
+)
+
+
+class TestKnowledgeImports:
+    """Tests for the modules the knowledge CLI loads."""
+
+    def test_import_does_not_load_other_domains(self):
+        """Importing the CLI should not load the models of link target domains."""
+        code = (
+            "import sys\n"
+            "import cli.databases.knowledge\n"
+            "print(sorted(m for m in sys.modules if m.endswith('.models')))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True, text=True, check=True,
+            cwd=Path(__file__).resolve().parents[4],
+        )
+        assert result.stdout.strip() == "['src.databases.datatypes.knowledge.models']"
+
+
+class TestKnowledgeListings:
+    """Tests for the knowledge listing commands in a fresh process."""
+
+    @pytest.fixture
+    def entry(self, db_session):
+        """Save one tagged knowledge entry."""
+        entry = Knowledge(
+            type=KnowledgeType.INSIGHT,
+            summary="Magnesium helps sleep",
+            content="Content",
+            confidence=0.8,
+        )
+        tags = [KnowledgeTag(knowledge_id=entry.id, tag="sleep")]
+        KnowledgeRepository(db_session).save_knowledge(entry, tags, [])
+        return entry
+
+    def test_list(self, run_cli, entry):
+        """List should print active entries."""
+        result = run_cli("knowledge", "list")
+
+        assert result.returncode == 0, result.stderr
+        assert f"{entry.id}\tinsight\t0.80\tMagnesium helps sleep" in result.stdout
+
+    def test_list_json(self, run_cli, entry):
+        """List should print active entries with their tags as JSON."""
+        result = run_cli("knowledge", "--json", "list")
+
+        assert result.returncode == 0, result.stderr
+        [listed] = json.loads(result.stdout)
+        assert listed["id"] == str(entry.id)
+        assert [tag["tag"] for tag in listed["tags"]] == ["sleep"]
+
+    def test_tag(self, run_cli, entry):
+        """Tag should print the entries with a tag."""
+        result = run_cli("knowledge", "tag", "sleep")
+
+        assert result.returncode == 0, result.stderr
+        assert str(entry.id) in result.stdout
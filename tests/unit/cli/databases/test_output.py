@@ -0,0 +1,152 @@
+"""Tests for shared CLI JSON output helpers."""
+
+import json
+from datetime import date, datetime
+from io import BytesIO, StringIO, TextIOWrapper
+from uuid import uuid4
+
+import pytest
+
+from cli.databases import output
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def serializer(request, monkeypatch):
+    """Run each test with orjson (when installed) and the stdlib fallback."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(output, "orjson", None)
+    return output.dumps
+
+
+class TestDumps:
+    """Tests for dumps function."""
+
+    def test_matches_stdlib_indented_output(self, serializer):
+        """Output should match json.dumps(indent=2) on pre-stringified values."""
+        record_id = uuid4()
+        created_at = datetime(2024, 1, 15, 8, 30, 0, 123456)
+        record = {
+            "id": record_id,
+            "collected_date": date(2024, 1, 15),
+            "created_at": created_at,
+            "value": 5.0,
+            "tags": [],
+            "comment": None,
+        }
+        expected = json.dumps({
+            "id": str(record_id),
+            "collected_date": "2024-01-15",
+            "created_at": created_at.isoformat(),
+            "value": 5.0,
+            "tags": [],
+            "comment": None,
+        }, indent=2)
+
+        assert serializer(record) == expected
+
+    def test_rejects_unknown_types(self, serializer):
+        """Unsupported objects should raise TypeError."""
+        with pytest.raises(TypeError):
+            serializer({"value": object()})
+
+
+class TestDump:
+    """Tests for dump function."""
+
+    def test_matches_print_of_dumps(self, serializer, capsys):
+        """Streamed output should equal printing the serialized object."""
+        record = {"id": uuid4(), "nested": {"values": [1, 2]}, "name": "Café"}
+
+        output.dump(record)
+
+        assert capsys.readouterr().out == serializer(record) + "\n"
+
+    def test_preserves_order_with_printed_text(self, serializer, capsys):
+        """Text printed before and after should stay in order around the JSON."""
+        print("before")
+        output.dump({"id": uuid4()})
+        print("after")
+
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[0] == "before"
+        assert lines[-1] == "after"
+
+    def test_writes_to_text_only_stream(self, serializer, monkeypatch):
+        """Streams without a binary buffer should receive the same text."""
+        stream = StringIO()
+        monkeypatch.setattr("sys.stdout", stream)
+        record = {"id": uuid4(), "name": "Café"}
+
+        output.dump(record)
+        output.dump_array([record])
+
+        assert stream.getvalue() == (
+            serializer(record) + "\n" + serializer([record]) + "\n"
+        )
+
+    @pytest.mark.parametrize("encoding", ["ascii", "utf-8"])
+    def test_escapes_non_ascii_text(self, serializer, monkeypatch, encoding):
+        """Non-ASCII text should be escaped so any stdout encoding can take it."""
+        raw = BytesIO()
+        stream = TextIOWrapper(raw, encoding=encoding)
+        monkeypatch.setattr("sys.stdout", stream)
+        record = {"unit": "µg/dL"}
+
+        output.dump(record)
+        output.dump_array([record])
+        stream.flush()
+
+        expected = json.dumps(record, indent=2) + "\n"
+        expected += json.dumps([record], indent=2) + "\n"
+        assert raw.getvalue().decode("ascii") == expected
+        assert serializer(record) == json.dumps(record, indent=2)
+
+
+class TestDumpArray:
+    """Tests for dump_array function."""
+
+    def test_matches_dumps_of_full_list(self, serializer, capsys):
+        """Streamed output should equal printing the serialized list."""
+        items = [{"id": uuid4(), "tags": ["a", "b"]}, {"id": uuid4(), "tags": []}]
+
+        output.dump_array(iter(items))
+
+        assert capsys.readouterr().out == serializer(items) + "\n"
+
+    def test_empty_iterable_writes_empty_array(self, serializer, capsys):
+        """An empty iterable should produce an empty JSON array."""
+        output.dump_array(iter([]))
+
+        assert capsys.readouterr().out == "[]\n"
+
+
+class TestCompactMode:
+    """Tests for compact output enabled by set_compact."""
+
+    @pytest.fixture(autouse=True)
+    def compact(self, monkeypatch):
+        """Enable compact mode for the test, restoring the default afterwards."""
+        monkeypatch.setattr(output, "_compact", False)
+        output.set_compact(True)
+
+    def test_dumps_matches_stdlib_compact_output(self, serializer):
+        """Output should match json.dumps with compact separators."""
+        record_id = uuid4()
+        record = {"id": record_id, "date": date(2024, 1, 15), "tags": ["a", "b"]}
+
+        expected = json.dumps(
+            {"id": str(record_id), "date": "2024-01-15", "tags": ["a", "b"]},
+            separators=(",", ":"),
+        )
+
+        assert serializer(record) == expected
+
+    def test_dump_array_matches_dumps_of_full_list(self, serializer, capsys):
+        """Streamed compact output should equal printing the serialized list."""
+        items = [{"id": uuid4(), "nested": {"values": [1, 2]}}, {"id": uuid4()}]
+
+        output.dump_array(iter(items))
+
+        assert capsys.readouterr().out == serializer(items) + "\n"
@@ -8,7 +8,8 @@ import pytest
 from pydantic import ValidationError
 from sqlmodel import select
 
-from cli.databases.supplement import cmd_import, parse_supplement_json
+from cli.databases.parsers import create_supplement_parser
+from cli.databases.supplement import _COMMANDS, cmd_import, parse_supplement_json
 from src.databases.datatypes.supplement import (
     Ingredient,
     IngredientType,
@@ -361,3 +362,17 @@ class TestSupplementImport:
         # Verify only one record exists
         labels = db_session.exec(select(SupplementLabel)).all()
         assert len(labels) == 1
+
+
+class TestCommandDispatch:
+    """Tests for the command dispatch table."""
+
+    def test_every_subcommand_has_a_handler(self):
+        """Each subcommand the parser accepts should map to a handler."""
+        subparsers = next(
+            action
+            for action in create_supplement_parser()._actions
+            if isinstance(action, argparse._SubParsersAction)
+        )
+
+        assert set(_COMMANDS) == set(subparsers.choices)
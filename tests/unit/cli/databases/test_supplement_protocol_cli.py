@@ -7,7 +7,9 @@ from io import StringIO
 import pytest
 from sqlmodel import select
 
-from cli.databases.supplement_protocol import cmd_import, parse_protocol_json
+from cli.databases import output
+from cli.databases.parsers import create_protocol_parser
+from cli.databases.supplement_protocol import _COMMANDS, cmd_import, parse_protocol_json
 from src.databases.datatypes.supplement_protocol import (
     Frequency,
     ProtocolSupplement,
@@ -298,3 +300,33 @@ class TestProtocolImport:
         # Verify only one record exists
         protocols = repo.list_protocols()
         assert len(protocols) == 1
+
+    def test_already_imported_honors_compact_mode(
+        self, tmp_path, repo, sample_json, capsys, monkeypatch
+    ):
+        """Already-imported status should go through the shared JSON output."""
+        monkeypatch.setattr(output, "_compact", False)
+        json_file = tmp_path / "protocol.json"
+        json_file.write_text(json.dumps(sample_json))
+        args = argparse.Namespace(file=str(json_file), json=True)
+        cmd_import(repo, args)
+        capsys.readouterr()
+
+        output.set_compact(True)
+        cmd_import(repo, args)
+
+        assert capsys.readouterr().out == '{"status":"already_imported"}\n'
+
+
+class TestCommandDispatch:
+    """Tests for the command dispatch table."""
+
+    def test_every_subcommand_has_a_handler(self):
+        """Each subcommand the parser accepts should map to a handler."""
+        subparsers = next(
+            action
+            for action in create_protocol_parser()._actions
+            if isinstance(action, argparse._SubParsersAction)
+        )
+
+        assert set(_COMMANDS) == set(subparsers.choices)
@@ -1,15 +1,27 @@
 """Tests for SQLite DatabaseClient with SQLModel."""
 
+import re
 import sqlite3
+import subprocess
+import sys
 import tempfile
+import threading
+from datetime import date
 from pathlib import Path
 from uuid import uuid4
 
 import pytest
 from sqlalchemy import text
-from sqlmodel import Session
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlmodel import Session, SQLModel
 
 from src.databases.clients.sqlite import DatabaseClient, DEFAULT_DB_PATH
+from src.databases.clients.sqlite.client import SCHEMA_VERSION
+from src.databases.datatypes.knowledge import KnowledgeStatus, LinkType
+from src.databases.datatypes.types import EnumCode, enum_code
+
+# 13 model tables plus the FTS5 label search table and its 5 shadow tables
+TABLE_COUNT = 19
 
 
 class TestDatabaseClientInit:
@@ -61,6 +73,25 @@ class TestDatabaseClientEngine:
             assert row[0] == 1  # Foreign keys enabled
         client.close()
 
+    def test_engine_enables_wal_journal_mode(self, tmp_path):
+        """Test engine switches file databases to WAL journaling."""
+        db_path = tmp_path / "test.db"
+        client = DatabaseClient(db_path=db_path)
+        with client.engine.connect() as conn:
+            result = conn.execute(text("PRAGMA journal_mode"))
+            assert result.fetchone()[0] == "wal"
+        client.close()
+
+    def test_engine_applies_performance_pragmas(self, tmp_path):
+        """Test engine applies synchronous, temp_store, and cache PRAGMAs."""
+        db_path = tmp_path / "test.db"
+        client = DatabaseClient(db_path=db_path)
+        with client.engine.connect() as conn:
+            assert conn.execute(text("PRAGMA synchronous")).fetchone()[0] == 1  # NORMAL
+            assert conn.execute(text("PRAGMA temp_store")).fetchone()[0] == 2  # MEMORY
+            assert conn.execute(text("PRAGMA cache_size")).fetchone()[0] == -65536
+        client.close()
+
     def test_close_disposes_engine(self, tmp_path):
         """Test close() disposes the engine."""
         db_path = tmp_path / "test.db"
@@ -78,6 +109,106 @@ class TestDatabaseClientEngine:
         assert client._engine is None
 
 
+class TestDatabaseClientPooling:
+    """Tests for connection reuse through the engine's pool."""
+
+    def test_sessions_reuse_pooled_connection(self, tmp_path):
+        """Test sequential sessions share one DBAPI connection."""
+        client = DatabaseClient(db_path=tmp_path / "test.db")
+        with client.get_session() as session:
+            first = session.connection().connection.dbapi_connection
+        with client.get_session() as session:
+            second = session.connection().connection.dbapi_connection
+        assert first is second
+        client.close()
+
+    def test_connections_from_other_threads_get_pragmas(self, tmp_path):
+        """Test connections opened on worker threads are configured too."""
+        client = DatabaseClient(db_path=tmp_path / "test.db")
+        _ = client.engine
+        results = []
+
+        def worker():
+            with client.engine.connect() as conn:
+                results.append(conn.execute(text("PRAGMA foreign_keys")).scalar())
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [1, 1, 1, 1]
+        client.close()
+
+
+class TestDatabaseClientReadOnly:
+    """Tests for read-only DatabaseClient connections."""
+
+    def test_read_only_client_can_query(self, tmp_path):
+        """Test a read-only client reads an existing database."""
+        db_path = tmp_path / "test.db"
+        DatabaseClient(db_path=db_path).init_schema()
+
+        client = DatabaseClient(db_path=db_path, read_only=True)
+        with client.engine.connect() as conn:
+            assert conn.execute(text("SELECT COUNT(*) FROM lab_reports")).scalar() == 0
+            assert conn.execute(text("PRAGMA query_only")).scalar() == 1
+        client.close()
+
+    def test_read_only_client_rejects_writes(self, tmp_path):
+        """Test a read-only client cannot modify the database."""
+        db_path = tmp_path / "test.db"
+        DatabaseClient(db_path=db_path).init_schema()
+
+        client = DatabaseClient(db_path=db_path, read_only=True)
+        with client.engine.connect() as conn:
+            with pytest.raises(OperationalError, match="readonly"):
+                conn.execute(text("DELETE FROM lab_reports"))
+        client.close()
+
+    def test_read_only_client_rejects_older_schema(self, tmp_path):
+        """Test a read-only client refuses a database it would need to migrate."""
+        db_path = tmp_path / "test.db"
+        DatabaseClient(db_path=db_path).init_schema()
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION - 1}")
+
+        client = DatabaseClient(db_path=db_path, read_only=True)
+        with pytest.raises(sqlite3.DatabaseError, match="older than"):
+            client.get_session()
+        assert client._engine is None
+
+    def test_read_only_client_does_not_create_database(self, tmp_path):
+        """Test a read-only client does not create a missing database."""
+        db_path = tmp_path / "missing" / "test.db"
+        client = DatabaseClient(db_path=db_path, read_only=True)
+
+        with pytest.raises(OperationalError, match="unable to open"):
+            with client.engine.connect():
+                pass
+        assert not db_path.parent.exists()
+        client.close()
+
+
+class TestDatabaseClientImports:
+    """Tests for lazy model registration."""
+
+    def test_import_does_not_load_datatype_models(self):
+        """Test importing the client leaves model modules to init_schema()."""
+        code = (
+            "import sys\n"
+            "import src.databases.clients.sqlite\n"
+            "print(any(m.endswith('.models') for m in sys.modules))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True, text=True, check=True,
+            cwd=Path(__file__).resolve().parents[5],
+        )
+        assert result.stdout.strip() == "False"
+
+
 class TestDatabaseClientSession:
     """Tests for DatabaseClient session management."""
 
@@ -113,7 +244,7 @@ class TestDatabaseClientSchema:
         client.close()
 
     def test_init_schema_creates_all_tables(self, client):
-        """Test init_schema() creates all 13 tables."""
+        """Test init_schema() creates all 13 tables plus the label search index."""
         client.init_schema()
         with client.engine.connect() as conn:
             result = conn.execute(
@@ -134,6 +265,12 @@ class TestDatabaseClientSchema:
             "protocol_supplements",
             "snps",
             "supplement_labels",
+            "supplement_labels_fts",
+            "supplement_labels_fts_config",
+            "supplement_labels_fts_content",
+            "supplement_labels_fts_data",
+            "supplement_labels_fts_docsize",
+            "supplement_labels_fts_idx",
             "supplement_protocols",
         ]
         assert tables == expected_tables
@@ -147,7 +284,7 @@ class TestDatabaseClientSchema:
                 text("SELECT COUNT(*) FROM sqlite_master WHERE type='table'")
             )
             count = result.fetchone()[0]
-        assert count == 13
+        assert count == TABLE_COUNT
 
     def test_tables_are_empty(self, client):
         """Test tables are created empty (no seed data)."""
@@ -211,7 +348,7 @@ class TestDatabaseClientAutoInit:
             )
             count = result.fetchone()[0]
 
-        assert count == 13  # All tables created
+        assert count == TABLE_COUNT  # All tables created
         client.close()
 
     def test_schema_only_initialized_once(self, tmp_path):
@@ -224,17 +361,631 @@ class TestDatabaseClientAutoInit:
         _ = client.engine
         _ = client.engine
 
-        # Schema should still only have 13 tables (not duplicated)
+        # Schema should still only have its tables once (not duplicated)
         with client.engine.connect() as conn:
             result = conn.execute(
                 text("SELECT COUNT(*) FROM sqlite_master WHERE type='table'")
             )
             count = result.fetchone()[0]
 
-        assert count == 13
+        assert count == TABLE_COUNT
         client.close()
 
 
+    def test_init_schema_stamps_user_version(self, tmp_path):
+        """Test init_schema() records SCHEMA_VERSION in PRAGMA user_version."""
+        db_path = tmp_path / "test.db"
+        client = DatabaseClient(db_path=db_path)
+        with client.engine.connect() as conn:
+            version = conn.execute(text("PRAGMA user_version")).fetchone()[0]
+        assert version == SCHEMA_VERSION
+        client.close()
+
+    def test_current_schema_skips_create_all(self, tmp_path, monkeypatch):
+        """Test a database already at SCHEMA_VERSION is not re-initialized."""
+        db_path = tmp_path / "test.db"
+        first = DatabaseClient(db_path=db_path)
+        _ = first.engine  # First run creates the schema
+        first.close()
+
+        calls = []
+        monkeypatch.setattr(
+            SQLModel.metadata, "create_all", lambda *args, **kwargs: calls.append(args)
+        )
+        client = DatabaseClient(db_path=db_path)
+        _ = client.engine
+
+        assert calls == []
+        assert client._schema_initialized
+        client.close()
+
+    def test_newer_schema_is_not_downgraded(self, tmp_path):
+        """Test a database from a newer build keeps its user_version."""
+        db_path = tmp_path / "test.db"
+        DatabaseClient(db_path=db_path).init_schema()
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION + 1}")
+
+        client = DatabaseClient(db_path=db_path)
+        _ = client.engine
+        assert client._schema_initialized
+        with pytest.raises(sqlite3.DatabaseError, match="refusing to downgrade"):
+            client.init_schema()
+        client.close()
+
+        with sqlite3.connect(db_path) as conn:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+        assert version == SCHEMA_VERSION + 1
+
+    def test_outdated_schema_is_reinitialized(self, tmp_path):
+        """Test a database with an older user_version gets create_all again."""
+        db_path = tmp_path / "test.db"
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("PRAGMA user_version = 0")
+
+        client = DatabaseClient(db_path=db_path)
+        with client.engine.connect() as conn:
+            count = conn.execute(
+                text("SELECT COUNT(*) FROM sqlite_master WHERE type='table'")
+            ).fetchone()[0]
+        assert count == TABLE_COUNT
+        client.close()
+
+    def test_init_schema_adds_indexes_to_existing_tables(self, tmp_path):
+        """Test init_schema() creates indexes missing from existing tables."""
+        db_path = tmp_path / "test.db"
+        client = DatabaseClient(db_path=db_path)
+        client.init_schema()
+        with client.engine.begin() as conn:
+            conn.execute(text("DROP INDEX ix_ingredients_code"))
+
+        client.init_schema()
+
+        with client.engine.connect() as conn:
+            indexes = {row[1] for row in conn.execute(text("PRAGMA index_list(ingredients)"))}
+        assert "ix_ingredients_code" in indexes
+        client.close()
+
+    def test_init_schema_rejects_foreign_key_violations(self, tmp_path):
+        """Test a migration that would leave orphaned rows is rolled back."""
+        db_path = tmp_path / "test.db"
+        client = DatabaseClient(db_path=db_path)
+        client.init_schema()
+        client.close()
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("PRAGMA foreign_keys = OFF")
+            conn.execute(
+                "INSERT INTO panels (id, lab_report_id, name) VALUES (?, ?, 'Orphan')",
+                (uuid4().bytes, uuid4().bytes),
+            )
+            conn.execute("PRAGMA user_version = 8")
+
+        client = DatabaseClient(db_path=db_path, auto_init_schema=False)
+        with pytest.raises(sqlite3.IntegrityError):
+            client.init_schema()
+
+        with client.engine.connect() as conn:
+            assert conn.exec_driver_sql("PRAGMA user_version").scalar() == 8
+            assert conn.exec_driver_sql("PRAGMA foreign_keys").scalar() == 1
+        client.close()
+
+    def test_init_schema_is_one_transaction(self, tmp_path, monkeypatch):
+        """Test a failure part way through init_schema() leaves no tables behind."""
+        db_path = tmp_path / "test.db"
+        client = DatabaseClient(db_path=db_path, auto_init_schema=False)
+
+        def fail(*args, **kwargs):
+            raise RuntimeError("index creation failed")
+
+        monkeypatch.setattr("sqlalchemy.Index.create", fail)
+        with pytest.raises(RuntimeError):
+            client.init_schema()
+
+        with client.engine.connect() as conn:
+            count = conn.execute(
+                text("SELECT COUNT(*) FROM sqlite_master WHERE type='table'")
+            ).fetchone()[0]
+        assert count == 0
+        assert not client._schema_initialized
+        client.close()
+
+
+class TestSourceFileIndexes:
+    """Tests for the source_file indexes used by import de-duplication."""
+
+    @pytest.mark.parametrize(
+        "table",
+        ["dna_tests", "lab_reports", "supplement_labels", "supplement_protocols"],
+    )
+    def test_source_file_is_indexed(self, tmp_path, table):
+        """Test each imported table indexes its source_file column."""
+        client = DatabaseClient(db_path=tmp_path / "test.db")
+        client.init_schema()
+        with client.engine.connect() as conn:
+            indexes = {row[1] for row in conn.execute(text(f"PRAGMA index_list({table})"))}
+        assert f"ix_{table}_source_file" in indexes
+        client.close()
+
+
+class TestUuidStorage:
+    """Tests for storing UUID columns as 16-byte blobs."""
+
+    def test_ids_are_stored_as_blobs(self, tmp_path):
+        """Test primary and foreign keys are written as 16-byte blobs."""
+        from src.databases.datatypes.dna import DnaTest, Snp
+
+        client = DatabaseClient(db_path=tmp_path / "test.db")
+        dna_test = DnaTest(
+            source="23andMe", collected_date=date(2024, 1, 15), source_file="test.txt"
+        )
+        snp = Snp(
+            dna_test_id=dna_test.id, rsid="rs1234", genotype="AG", magnitude=2.5, gene="MTHFR"
+        )
+        dna_test_id, snp_id = dna_test.id, snp.id
+        with client.get_session() as session:
+            session.add(dna_test)
+            session.flush()
+            session.add(snp)
+            session.commit()
+
+        with client.engine.connect() as conn:
+            row = conn.execute(
+                text("SELECT typeof(id), length(id), typeof(dna_test_id), id FROM snps")
+            ).fetchone()
+        assert row[:3] == ("blob", 16, "blob")
+        assert row[3] == snp_id.bytes
+
+        with client.get_session() as session:
+            assert session.get(Snp, snp_id).dna_test_id == dna_test_id
+        client.close()
+
+    def test_text_uuids_from_older_schema_are_converted(self, tmp_path):
+        """Test init_schema() rewrites hex text UUIDs left by schema version 6."""
+        from src.databases.datatypes.dna import DnaTest, Snp
+
+        db_path = tmp_path / "test.db"
+        client = DatabaseClient(db_path=db_path)
+        client.init_schema()
+        client.close()
+
+        dna_test_id, snp_id = uuid4(), uuid4()
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(
+                "INSERT INTO dna_tests (id, source, collected_date, source_file, created_at) "
+                "VALUES (?, '23andMe', '2024-01-15', 'test.txt', '2024-01-20T10:00:00')",
+                (dna_test_id.hex,),
+            )
+            conn.execute(
+                "INSERT INTO snps (id, dna_test_id, rsid, genotype, magnitude, gene) "
+                "VALUES (?, ?, 'rs1234', 'AG', 2.5, 'MTHFR')",
+                (snp_id.hex, dna_test_id.hex),
+            )
+            conn.execute("PRAGMA user_version = 6")
+
+        client = DatabaseClient(db_path=db_path)
+        with client.engine.connect() as conn:
+            types = conn.execute(
+                text("SELECT typeof(id), typeof(dna_test_id) FROM snps")
+            ).fetchone()
+            violations = conn.execute(text("PRAGMA foreign_key_check")).fetchall()
+        assert types == ("blob", "blob")
+        assert violations == []
+
+        with client.get_session() as session:
+            assert session.get(DnaTest, dna_test_id) is not None
+            assert session.get(Snp, snp_id).dna_test_id == dna_test_id
+        client.close()
+
+
+class TestEnumStorage:
+    """Tests for storing enum columns as integer codes."""
+
+    TABLES = ["knowledge", "knowledge_links", "supplement_labels", "ingredients"]
+
+    def test_enum_codes_follow_definition_order(self):
+        """Test stored codes are pinned: members may only be appended."""
+        from src.databases.datatypes.knowledge import KnowledgeType
+        from src.databases.datatypes.supplement import IngredientType, SupplementForm
+
+        assert [m.name for m in KnowledgeType] == [
+            "INSIGHT", "RECOMMENDATION", "CONTRAINDICATION", "MEMORY"
+        ]
+        assert [m.name for m in KnowledgeStatus] == ["ACTIVE", "DEPRECATED"]
+        assert [m.name for m in LinkType] == [
+            "SNP", "BIOMARKER", "INGREDIENT", "SUPPLEMENT", "PROTOCOL", "KNOWLEDGE"
+        ]
+        assert [m.name for m in SupplementForm] == [
+            "CAPSULE", "TABLET", "POWDER", "LIQUID", "SOFTGEL", "GUMMY", "LOZENGE"
+        ]
+        assert [m.name for m in IngredientType] == ["ACTIVE", "BLEND", "OTHER"]
+
+    def test_codes_bind_from_members_and_values(self):
+        """Test a member and its raw value bind to the same code."""
+        column_type = EnumCode(LinkType)
+
+        assert column_type.process_bind_param(LinkType.PROTOCOL, None) == 4
+        assert column_type.process_bind_param("protocol", None) == 4
+        with pytest.raises(ValueError):
+            column_type.process_bind_param("unknown", None)
+
+    def test_enums_are_stored_as_codes(self, tmp_path):
+        """Test enum columns are written as integers and read back as members."""
+        from src.databases.datatypes.knowledge import (
+            Knowledge,
+            KnowledgeLink,
+            KnowledgeType,
+        )
+
+        client = DatabaseClient(db_path=tmp_path / "test.db")
+        knowledge = Knowledge(
+            type=KnowledgeType.RECOMMENDATION,
+            status=KnowledgeStatus.DEPRECATED,
+            summary="Summary",
+            content="Content",
+            confidence=0.5,
+        )
+        link = KnowledgeLink(
+            knowledge_id=knowledge.id, link_type=LinkType.PROTOCOL, target_id=uuid4()
+        )
+        knowledge_id = knowledge.id
+        with client.get_session() as session:
+            session.add(knowledge)
+            session.flush()
+            session.add(link)
+            session.commit()
+
+        with client.engine.connect() as conn:
+            row = conn.execute(
+                text(
+                    "SELECT typeof(type), type, status, link_type "
+                    "FROM knowledge JOIN knowledge_links ON knowledge_id = knowledge.id"
+                )
+            ).fetchone()
+        assert row == ("integer", 1, 1, 4)
+
+        with client.get_session() as session:
+            stored = session.get(Knowledge, knowledge_id)
+            assert stored.type is KnowledgeType.RECOMMENDATION
+            assert stored.status is KnowledgeStatus.DEPRECATED
+        client.close()
+
+    def test_enum_names_from_older_schema_are_converted(self, tmp_path):
+        """Test init_schema() rebuilds text enum columns from schema version 12."""
+        from src.databases.datatypes.supplement.repository import SupplementRepository
+
+        db_path = tmp_path / "test.db"
+        DatabaseClient(db_path=db_path).init_schema()
+        knowledge_id, label_id = uuid4(), uuid4()
+        with sqlite3.connect(db_path) as conn:
+            for table in self.TABLES:
+                (sql,) = conn.execute(
+                    "SELECT sql FROM sqlite_master WHERE name = ?", (table,)
+                ).fetchone()
+                conn.execute(f"DROP TABLE {table}")
+                conn.execute(sql.replace("SMALLINT", "VARCHAR(16)"))
+            conn.execute(
+                "CREATE INDEX ix_knowledge_active_created_at ON knowledge (created_at) "
+                "WHERE status = 'ACTIVE'"
+            )
+            conn.execute(
+                "INSERT INTO knowledge (id, type, status, summary, content, "
+                "confidence, created_at) VALUES (?, 'MEMORY', 'ACTIVE', 'Summary', "
+                "'Content', 0.5, '2024-01-20 10:00:00')",
+                (knowledge_id.bytes,),
+            )
+            conn.execute(
+                "INSERT INTO supplement_labels "
+                "(id, created_at, brand, product_name, form, serving_size, warnings) "
+                "VALUES (?, '2024-01-20 10:00:00', 'Thorne', 'Zinc', 'TABLET', "
+                "'1 tablet', '[]')",
+                (label_id.bytes,),
+            )
+            conn.execute(
+                "INSERT INTO supplement_labels_fts (id, brand, product_name) "
+                "VALUES (?, 'Thorne', 'Zinc')",
+                (label_id.bytes,),
+            )
+            conn.execute(
+                "INSERT INTO ingredients (id, supplement_label_id, type, name, code) "
+                "VALUES (?, ?, 'OTHER', 'Cellulose', 'MICROCRYSTALLINE_CELLULOSE')",
+                (uuid4().bytes, label_id.bytes),
+            )
+            conn.execute("PRAGMA user_version = 12")
+
+        client = DatabaseClient(db_path=db_path)
+        with client.engine.connect() as conn:
+            codes = conn.execute(
+                text(
+                    "SELECT knowledge.type, knowledge.status, supplement_labels.form, "
+                    "ingredients.type "
+                    "FROM knowledge, supplement_labels JOIN ingredients "
+                    "ON supplement_label_id = supplement_labels.id"
+                )
+            ).fetchone()
+            index_sql = conn.execute(
+                text(
+                    "SELECT sql FROM sqlite_master "
+                    "WHERE name = 'ix_knowledge_active_created_at'"
+                )
+            ).scalar()
+        assert codes == (3, 0, 1, 2)
+        assert index_sql.endswith("WHERE status = 0")
+
+        # The rebuilt supplement_labels table keeps the search index triggers
+        with client.get_session() as session:
+            repo = SupplementRepository(session)
+            label = repo.get_label(label_id)
+            label.brand = "Pure Encapsulations"
+            session.commit()
+            assert [found.id for found in repo.search_labels("Encaps")] == [label_id]
+        client.close()
+
+
+class TestWithoutRowidTables:
+    """Tests for child tables stored WITHOUT ROWID."""
+
+    TABLES = ["knowledge_links", "knowledge_tags"]
+
+    # Listed in import order, so they keep the rowid that records it
+    ROWID_TABLES = ["biomarkers", "panels", "protocol_supplements"]
+
+    # The FTS5 search index keeps some shadow tables WITHOUT ROWID itself
+    MODEL_TABLES = (
+        "SELECT name, sql FROM sqlite_master "
+        "WHERE type = 'table' AND name NOT LIKE 'supplement_labels_fts%'"
+    )
+
+    @staticmethod
+    def without_rowid_tables(conn) -> set[str]:
+        """Return the names of tables created WITHOUT ROWID."""
+        return {
+            name
+            for name, sql in conn.execute(TestWithoutRowidTables.MODEL_TABLES)
+            if sql.rstrip().endswith("WITHOUT ROWID")
+        }
+
+    def test_child_tables_are_created_without_rowid(self, tmp_path):
+        """Test new databases create the child tables WITHOUT ROWID."""
+        db_path = tmp_path / "test.db"
+        DatabaseClient(db_path=db_path).init_schema()
+
+        with sqlite3.connect(db_path) as conn:
+            assert self.without_rowid_tables(conn) == set(self.TABLES)
+
+    def test_rowid_tables_from_older_schema_are_rebuilt(self, tmp_path):
+        """Test init_schema() rebuilds rowid tables left by schema version 8."""
+        reference_path = tmp_path / "reference.db"
+        DatabaseClient(db_path=reference_path).init_schema()
+        with sqlite3.connect(reference_path) as conn:
+            tables = conn.execute(self.MODEL_TABLES).fetchall()
+
+        db_path = tmp_path / "test.db"
+        report_id, panel_id, biomarker_id = uuid4(), uuid4(), uuid4()
+        with sqlite3.connect(db_path) as conn:
+            for _, sql in tables:
+                conn.execute(sql.replace("WITHOUT ROWID", ""))
+            conn.execute(
+                "INSERT INTO lab_reports (id, lab_provider, collected_date, created_at) "
+                "VALUES (?, 'Quest', '2024-01-15', '2024-01-20 10:00:00')",
+                (report_id.bytes,),
+            )
+            conn.execute(
+                "INSERT INTO panels (id, lab_report_id, name) VALUES (?, ?, 'Panel')",
+                (panel_id.bytes, report_id.bytes),
+            )
+            conn.execute(
+                "INSERT INTO biomarkers (id, panel_id, name, code, value, unit, flag) "
+                "VALUES (?, ?, 'Glucose', 'GLUCOSE', 95.0, 'mg/dL', 'NORMAL')",
+                (biomarker_id.bytes, panel_id.bytes),
+            )
+            conn.execute("PRAGMA user_version = 8")
+
+        client = DatabaseClient(db_path=db_path)
+        with client.engine.connect() as conn:
+            foreign_keys = conn.exec_driver_sql("PRAGMA foreign_keys").scalar()
+            biomarker_indexes = {
+                row[1] for row in conn.exec_driver_sql("PRAGMA index_list(biomarkers)")
+            }
+        client.close()
+
+        with sqlite3.connect(db_path) as conn:
+            assert self.without_rowid_tables(conn) == set(self.TABLES)
+            row = conn.execute("SELECT id, panel_id, code FROM biomarkers").fetchone()
+        assert row == (biomarker_id.bytes, panel_id.bytes, "GLUCOSE")
+        assert "ix_biomarkers_code_panel_id" in biomarker_indexes
+        assert foreign_keys == 1
+
+    def test_ordered_tables_from_older_schema_regain_rowid(self, tmp_path):
+        """Test init_schema() gives back the rowid dropped by schema version 14."""
+        db_path = tmp_path / "test.db"
+        DatabaseClient(db_path=db_path).init_schema()
+        report_id, panel_id = uuid4(), uuid4()
+        with sqlite3.connect(db_path) as conn:
+            for table in self.ROWID_TABLES:
+                (sql,) = conn.execute(
+                    "SELECT sql FROM sqlite_master WHERE name = ?", (table,)
+                ).fetchone()
+                conn.execute(f"DROP TABLE {table}")
+                conn.execute(f"{sql} WITHOUT ROWID")
+            conn.execute(
+                "INSERT INTO lab_reports (id, lab_provider, collected_date, created_at) "
+                "VALUES (?, 'Quest', '2024-01-15', '2024-01-20 10:00:00')",
+                (report_id.bytes,),
+            )
+            conn.execute(
+                "INSERT INTO panels (id, lab_report_id, name) VALUES (?, ?, 'Panel')",
+                (panel_id.bytes, report_id.bytes),
+            )
+            conn.execute("PRAGMA user_version = 14")
+
+        DatabaseClient(db_path=db_path).init_schema()
+
+        with sqlite3.connect(db_path) as conn:
+            assert self.without_rowid_tables(conn) == set(self.TABLES)
+            row = conn.execute("SELECT rowid, id, name FROM panels").fetchone()
+        assert row == (1, panel_id.bytes, "Panel")
+
+
+class TestBaselineMigration:
+    """Tests for opening a database written by the original schema.
+
+    That schema stored uuid4 IDs as hex text and enums as member names, in
+    rowid tables whose listings had no ORDER BY and so followed import order.
+    """
+
+    DDL = [
+        """CREATE TABLE lab_reports (
+            id CHAR(32) NOT NULL,
+            lab_provider VARCHAR NOT NULL,
+            collected_date DATE NOT NULL,
+            source_file VARCHAR,
+            created_at DATETIME NOT NULL,
+            PRIMARY KEY (id)
+        )""",
+        """CREATE TABLE panels (
+            id CHAR(32) NOT NULL,
+            lab_report_id CHAR(32) NOT NULL,
+            name VARCHAR NOT NULL,
+            comment VARCHAR,
+            PRIMARY KEY (id),
+            FOREIGN KEY(lab_report_id) REFERENCES lab_reports (id)
+        )""",
+        """CREATE TABLE biomarkers (
+            id CHAR(32) NOT NULL,
+            panel_id CHAR(32) NOT NULL,
+            name VARCHAR NOT NULL,
+            code VARCHAR NOT NULL,
+            value FLOAT NOT NULL,
+            unit VARCHAR NOT NULL,
+            reference_low FLOAT,
+            reference_high FLOAT,
+            flag VARCHAR(13) NOT NULL,
+            PRIMARY KEY (id),
+            FOREIGN KEY(panel_id) REFERENCES panels (id)
+        )""",
+        """CREATE TABLE supplement_protocols (
+            id CHAR(32) NOT NULL,
+            protocol_date DATE NOT NULL,
+            prescriber VARCHAR,
+            next_visit VARCHAR,
+            source_file VARCHAR,
+            created_at DATETIME NOT NULL,
+            protein_goal VARCHAR,
+            lifestyle_notes JSON,
+            PRIMARY KEY (id)
+        )""",
+        """CREATE TABLE protocol_supplements (
+            id CHAR(32) NOT NULL,
+            protocol_id CHAR(32) NOT NULL,
+            supplement_label_id CHAR(32),
+            type VARCHAR(9) NOT NULL,
+            name VARCHAR NOT NULL,
+            instructions VARCHAR,
+            dosage VARCHAR,
+            frequency VARCHAR(12) NOT NULL,
+            upon_waking INTEGER NOT NULL,
+            breakfast INTEGER NOT NULL,
+            mid_morning INTEGER NOT NULL,
+            lunch INTEGER NOT NULL,
+            mid_afternoon INTEGER NOT NULL,
+            dinner INTEGER NOT NULL,
+            before_sleep INTEGER NOT NULL,
+            PRIMARY KEY (id),
+            FOREIGN KEY(protocol_id) REFERENCES supplement_protocols (id)
+        )""",
+    ]
+
+    @staticmethod
+    def descending_ids(count: int) -> list:
+        """Return uuid4 IDs whose sort order is the reverse of the list order."""
+        return sorted((uuid4() for _ in range(count)), reverse=True)
+
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        """Create a database with the original schema and no user_version."""
+        db_path = tmp_path / "baseline.db"
+        with sqlite3.connect(db_path) as conn:
+            for statement in self.DDL:
+                conn.execute(statement)
+        return db_path
+
+    def test_report_listings_keep_import_order(self, db_path):
+        """Test panels and biomarkers list in import order, not ID order."""
+        from src.databases.datatypes.bloodwork.repository import BloodworkRepository
+
+        report_id = uuid4()
+        panel_ids = self.descending_ids(2)
+        codes = ["GLUCOSE", "LDL", "HDL"]
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(
+                "INSERT INTO lab_reports (id, lab_provider, collected_date, created_at) "
+                "VALUES (?, 'Quest', '2024-01-15', '2024-01-20 10:00:00')",
+                (report_id.hex,),
+            )
+            for index, panel_id in enumerate(panel_ids):
+                conn.execute(
+                    "INSERT INTO panels (id, lab_report_id, name) VALUES (?, ?, ?)",
+                    (panel_id.hex, report_id.hex, f"Panel {index}"),
+                )
+            for code, biomarker_id in zip(codes, self.descending_ids(len(codes))):
+                conn.execute(
+                    "INSERT INTO biomarkers (id, panel_id, name, code, value, unit, flag) "
+                    "VALUES (?, ?, ?, ?, 1.0, 'mg/dL', 'NORMAL')",
+                    (biomarker_id.hex, panel_ids[0].hex, code.title(), code),
+                )
+
+        client = DatabaseClient(db_path=db_path)
+        with client.get_session() as session:
+            repo = BloodworkRepository(session)
+            panels = repo.get_panels_for_report(report_id)
+            by_report = repo.get_panels_for_reports([report_id])
+            biomarkers = repo.get_biomarkers_for_panel(panel_ids[0])
+            by_panel = repo.get_biomarkers_for_panels(panel_ids)
+        client.close()
+
+        assert [panel.id for panel in panels] == panel_ids
+        assert [panel.id for panel in by_report[report_id]] == panel_ids
+        assert [biomarker.code for biomarker in biomarkers] == codes
+        assert [biomarker.code for biomarker in by_panel[panel_ids[0]]] == codes
+
+    def test_protocol_listings_keep_import_order(self, db_path):
+        """Test protocol supplements list in import order, not ID order."""
+        from src.databases.datatypes.supplement_protocol.repository import (
+            SupplementProtocolRepository,
+        )
+
+        protocol_id = uuid4()
+        names = ["Vitamin D3", "Fish Oil", "Magnesium"]
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(
+                "INSERT INTO supplement_protocols (id, protocol_date, created_at, "
+                "lifestyle_notes) VALUES (?, '2024-01-15', '2024-01-20 10:00:00', '[]')",
+                (protocol_id.hex,),
+            )
+            for name, supplement_id in zip(names, self.descending_ids(len(names))):
+                conn.execute(
+                    "INSERT INTO protocol_supplements (id, protocol_id, type, name, "
+                    "frequency, upon_waking, breakfast, mid_morning, lunch, "
+                    "mid_afternoon, dinner, before_sleep) "
+                    "VALUES (?, ?, 'SCHEDULED', ?, 'DAILY', 0, 1, 0, 0, 0, 0, 0)",
+                    (supplement_id.hex, protocol_id.hex, name),
+                )
+
+        client = DatabaseClient(db_path=db_path)
+        with client.get_session() as session:
+            repo = SupplementProtocolRepository(session)
+            supplements = repo.get_supplements_for_protocol(protocol_id)
+            by_protocol = repo.get_supplements_for_protocols([protocol_id])
+            _, joined = repo.get_protocol_with_supplements(protocol_id)
+            _, current = repo.get_current_protocol_with_supplements()
+        client.close()
+
+        assert [supplement.name for supplement in supplements] == names
+        assert [supplement.name for supplement in by_protocol[protocol_id]] == names
+        assert [supplement.name for supplement in joined] == names
+        assert [supplement.name for supplement in current] == names
+
+
 class TestForeignKeyConstraints:
     """Tests for foreign key constraint enforcement."""
 
@@ -387,6 +1138,23 @@ class TestDnaTablesSchema:
         assert "repute" in columns
         assert "gene" in columns
 
+    def test_snps_indexes(self, client):
+        """Test snps table indexes rsid lookups and gene lookups by magnitude."""
+        with client.engine.connect() as conn:
+            result = conn.execute(text("PRAGMA index_list(snps)"))
+            indexes = {row[1] for row in result.fetchall()}
+        assert "ix_snps_gene_magnitude" in indexes
+        assert "ix_snps_rsid" in indexes
+
+    def test_rsid_lookup_uses_index(self, client):
+        """Test an rsid lookup searches the index instead of scanning snps."""
+        with client.engine.connect() as conn:
+            plan = conn.execute(
+                text("EXPLAIN QUERY PLAN SELECT * FROM snps WHERE rsid = :rsid"),
+                {"rsid": "rs1234"},
+            ).fetchall()
+        assert "ix_snps_rsid" in plan[0][3]
+
 
 class TestBloodworkTablesSchema:
     """Tests for bloodwork table schema."""
@@ -436,6 +1204,40 @@ class TestBloodworkTablesSchema:
         assert "reference_high" in columns
         assert "flag" in columns
 
+    def test_panels_indexes(self, client):
+        """Test panels table indexes report lookups and the report join."""
+        with client.engine.connect() as conn:
+            result = conn.execute(text("PRAGMA index_list(panels)"))
+            indexes = {row[1] for row in result.fetchall()}
+        assert "ix_panels_id_lab_report_id" in indexes
+        assert "ix_panels_lab_report_id" in indexes
+
+    def test_biomarker_history_indexes(self, client):
+        """Test biomarker history lookups and report ordering are indexed."""
+        with client.engine.connect() as conn:
+            biomarker_indexes = {
+                row[1] for row in conn.execute(text("PRAGMA index_list(biomarkers)"))
+            }
+            report_indexes = {
+                row[1] for row in conn.execute(text("PRAGMA index_list(lab_reports)"))
+            }
+        assert "ix_biomarkers_code_panel_id" in biomarker_indexes
+        assert "ix_biomarkers_panel_id" in biomarker_indexes
+        assert "ix_lab_reports_collected_date_id" in report_indexes
+
+    def test_flagged_biomarkers_use_partial_index(self, client):
+        """Test the non-normal flag query is answered from the partial index."""
+        with client.engine.connect() as conn:
+            partial = {
+                row[1]: row[4] for row in conn.execute(text("PRAGMA index_list(biomarkers)"))
+            }
+            plan = conn.execute(
+                text("EXPLAIN QUERY PLAN SELECT * FROM biomarkers WHERE flag != :flag"),
+                {"flag": "NORMAL"},
+            ).fetchall()
+        assert partial["ix_biomarkers_abnormal_flag_code"] == 1
+        assert "ix_biomarkers_abnormal_flag_code" in plan[0][3]
+
 
 class TestSupplementTablesSchema:
     """Tests for supplement table schema."""
@@ -493,6 +1295,113 @@ class TestSupplementTablesSchema:
         assert "percent_dv" in columns
         assert "form" in columns
 
+    def test_ingredients_indexes(self, client):
+        """Test ingredients table indexes its label, blend, and code lookups."""
+        with client.engine.connect() as conn:
+            result = conn.execute(text("PRAGMA index_list(ingredients)"))
+            indexes = {row[1] for row in result.fetchall()}
+        assert "ix_ingredients_supplement_label_id_type_name" in indexes
+        assert "ix_ingredients_blend_id_name" in indexes
+        assert "ix_ingredients_code" in indexes
+
+    @pytest.mark.parametrize(
+        ("query", "index"),
+        [
+            (
+                "SELECT * FROM ingredients WHERE supplement_label_id = :id "
+                "ORDER BY type, name",
+                "ix_ingredients_supplement_label_id_type_name",
+            ),
+            (
+                "SELECT * FROM ingredients WHERE blend_id = :id ORDER BY name",
+                "ix_ingredients_blend_id_name",
+            ),
+            (
+                "SELECT * FROM supplement_labels ORDER BY brand, product_name",
+                "ix_supplement_labels_brand_product_name",
+            ),
+        ],
+    )
+    def test_listings_are_sorted_by_index(self, client, query, index):
+        """Test label and ingredient listings read rows in index order."""
+        with client.engine.connect() as conn:
+            plan = conn.execute(
+                text(f"EXPLAIN QUERY PLAN {query}"), {"id": b"0" * 16}
+            ).fetchall()
+        assert index in plan[0][3]
+        assert not any("TEMP B-TREE" in row[3] for row in plan)
+
+    def test_label_search_uses_trigram_index(self, client):
+        """Test label search matches substrings through the FTS5 index."""
+        with client.engine.connect() as conn:
+            plan = conn.execute(
+                text(
+                    "EXPLAIN QUERY PLAN SELECT id FROM supplement_labels_fts "
+                    "WHERE supplement_labels_fts MATCH :query"
+                ),
+                {"query": '"brand"'},
+            ).fetchall()
+        assert "VIRTUAL TABLE INDEX" in plan[0][3]
+
+    def test_label_search_is_filled_for_older_schema(self, tmp_path):
+        """Test init_schema() indexes labels saved before schema version 10."""
+        db_path = tmp_path / "test.db"
+        DatabaseClient(db_path=db_path).init_schema()
+        label_id = uuid4()
+        with sqlite3.connect(db_path) as conn:
+            for trigger in ("insert", "update", "delete"):
+                conn.execute(f"DROP TRIGGER supplement_labels_fts_{trigger}")
+            conn.execute("DROP TABLE supplement_labels_fts")
+            conn.execute(
+                "INSERT INTO supplement_labels "
+                "(id, created_at, brand, product_name, form, serving_size, warnings) "
+                "VALUES (?, '2024-01-20 10:00:00', 'Thorne', 'Zinc', 'TABLET', "
+                "'1 tablet', '[]')",
+                (label_id.bytes,),
+            )
+            conn.execute("PRAGMA user_version = 9")
+
+        client = DatabaseClient(db_path=db_path)
+        with client.engine.connect() as conn:
+            rows = conn.execute(
+                text(
+                    "SELECT id FROM supplement_labels_fts "
+                    "WHERE supplement_labels_fts MATCH :query"
+                ),
+                {"query": '"horn"'},
+            ).fetchall()
+        client.close()
+        assert rows == [(label_id.bytes,)]
+
+    def test_json_columns_read_stdlib_encoded_text(self, tmp_path):
+        """Test JSON columns decode text in either encoder's formatting."""
+        from src.databases.datatypes.supplement import SupplementRepository
+
+        db_path = tmp_path / "test.db"
+        client = DatabaseClient(db_path=db_path)
+        client.init_schema()
+        label_id = uuid4()
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(
+                "INSERT INTO supplement_labels "
+                "(id, created_at, brand, product_name, form, serving_size, warnings) "
+                "VALUES (?, '2024-01-20 10:00:00', 'Thorne', 'Zinc', 1, "
+                "'1 tablet', ?)",
+                (label_id.bytes, '["Keep cool", "Max 5 \\u00b5g"]'),
+            )
+
+        with client.get_session() as session:
+            label = SupplementRepository(session).get_label(label_id)
+            label.warnings = label.warnings + ["Pregnancy"]
+            session.commit()
+            session.expire_all()
+            assert SupplementRepository(session).get_label(label_id).warnings == [
+                "Keep cool",
+                "Max 5 \u00b5g",
+                "Pregnancy",
+            ]
+        client.close()
+
 
 class TestProtocolTablesSchema:
     """Tests for protocol table schema."""
@@ -541,6 +1450,18 @@ class TestProtocolTablesSchema:
         assert "dinner" in columns
         assert "before_sleep" in columns
 
+    def test_protocol_indexes(self, client):
+        """Test protocol tables index date ordering and supplement lookups."""
+        with client.engine.connect() as conn:
+            protocol_indexes = {
+                row[1] for row in conn.execute(text("PRAGMA index_list(supplement_protocols)"))
+            }
+            supplement_indexes = {
+                row[1] for row in conn.execute(text("PRAGMA index_list(protocol_supplements)"))
+            }
+        assert "ix_supplement_protocols_protocol_date" in protocol_indexes
+        assert "ix_protocol_supplements_protocol_id_name" in supplement_indexes
+
 
 class TestKnowledgeTablesSchema:
     """Tests for knowledge table schema."""
@@ -587,3 +1508,131 @@ class TestKnowledgeTablesSchema:
         assert "id" in columns
         assert "knowledge_id" in columns
         assert "tag" in columns
+
+    def test_active_knowledge_uses_partial_index(self, client):
+        """Test listing active entries by creation time uses the partial index."""
+        with client.engine.connect() as conn:
+            plan = conn.execute(
+                text(
+                    "EXPLAIN QUERY PLAN SELECT * FROM knowledge "
+                    "WHERE status = :status ORDER BY created_at"
+                ),
+                {"status": enum_code(KnowledgeStatus.ACTIVE)},
+            ).fetchall()
+        assert "ix_knowledge_active_created_at" in plan[0][3]
+
+    def test_knowledge_rejects_out_of_range_confidence(self, client):
+        """Test the CHECK constraint rejects confidence outside 0.0 to 1.0."""
+        insert = text(
+            "INSERT INTO knowledge (id, type, status, summary, content, confidence, "
+            "created_at) VALUES (:id, 0, 0, 'Summary', 'Content', "
+            ":confidence, '2024-01-20 10:00:00')"
+        )
+        with client.engine.connect() as conn:
+            conn.execute(insert, {"id": uuid4().bytes, "confidence": 1.0})
+            with pytest.raises(IntegrityError, match="ck_knowledge_confidence"):
+                conn.execute(insert, {"id": uuid4().bytes, "confidence": 1.5})
+
+    def test_knowledge_from_older_schema_gains_check(self, tmp_path):
+        """Test init_schema() rebuilds knowledge from schema version 11 with its rows."""
+        db_path = tmp_path / "test.db"
+        DatabaseClient(db_path=db_path).init_schema()
+        knowledge_id = uuid4()
+        with sqlite3.connect(db_path) as conn:
+            (sql,) = conn.execute(
+                "SELECT sql FROM sqlite_master WHERE name = 'knowledge'"
+            ).fetchone()
+            conn.execute("DROP TABLE knowledge")
+            conn.execute(
+                re.sub(r"CONSTRAINT ck_knowledge_confidence CHECK \(.*?\),\s*", "", sql)
+            )
+            conn.execute(
+                "INSERT INTO knowledge (id, type, status, summary, content, "
+                "confidence, created_at) VALUES (?, 'INSIGHT', 'ACTIVE', 'Summary', "
+                "'Content', 0.5, '2024-01-20 10:00:00')",
+                (knowledge_id.bytes,),
+            )
+            conn.execute("PRAGMA user_version = 11")
+            (sql,) = conn.execute(
+                "SELECT sql FROM sqlite_master WHERE name = 'knowledge'"
+            ).fetchone()
+            assert "ck_knowledge_confidence" not in sql
+
+        client = DatabaseClient(db_path=db_path)
+        with client.engine.connect() as conn:
+            sql = conn.exec_driver_sql(
+                "SELECT sql FROM sqlite_master WHERE name = 'knowledge'"
+            ).scalar()
+            rows = conn.exec_driver_sql("SELECT id FROM knowledge").fetchall()
+            indexes = {
+                row[1] for row in conn.exec_driver_sql("PRAGMA index_list(knowledge)")
+            }
+        client.close()
+        assert "ck_knowledge_confidence" in sql
+        assert rows == [(knowledge_id.bytes,)]
+        assert "ix_knowledge_active_created_at" in indexes
+
+    @pytest.mark.parametrize(
+        ("method", "args", "index"),
+        [
+            (
+                "get_tags_for_knowledge",
+                (uuid4(),),
+                "ix_knowledge_tags_knowledge_id_tag",
+            ),
+            (
+                "get_links_for_knowledge",
+                (uuid4(),),
+                "ix_knowledge_links_knowledge_id_link_type",
+            ),
+            (
+                "get_links_for_entries",
+                ([uuid4(), uuid4()],),
+                "ix_knowledge_links_knowledge_id_link_type",
+            ),
+        ],
+    )
+    def test_tag_and_link_lookups_use_indexes(
+        self, client, count_queries, method, args, index
+    ):
+        """Test repository tag and link lookups search an index without sorting."""
+        plan = self.repository_query_plan(client, count_queries, method, args)
+        assert index in plan[0]
+        assert not any("TEMP B-TREE" in detail for detail in plan)
+
+    @pytest.mark.parametrize(
+        ("method", "args", "index"),
+        [
+            (
+                "get_by_tag",
+                ("test",),
+                "COVERING INDEX ix_knowledge_tags_tag_knowledge_id",
+            ),
+            (
+                "get_linked_to",
+                (LinkType.SNP, uuid4()),
+                "COVERING INDEX ix_knowledge_links_link_type_target_id_knowledge_id",
+            ),
+        ],
+    )
+    def test_tag_and_link_filters_use_covering_indexes(
+        self, client, count_queries, method, args, index
+    ):
+        """Test entry lookups by tag or link never read the tag or link tables."""
+        plan = self.repository_query_plan(client, count_queries, method, args)
+        assert any(index in detail for detail in plan)
+
+    @staticmethod
+    def repository_query_plan(client, count_queries, method, args) -> list[str]:
+        """Run a KnowledgeRepository method and EXPLAIN the one query it issues."""
+        from src.databases.datatypes.knowledge.repository import KnowledgeRepository
+
+        with client.get_session() as session:
+            with count_queries(session) as statements:
+                getattr(KnowledgeRepository(session), method)(*args)
+            [statement] = statements
+            # The plan does not depend on the bound values
+            rows = session.connection().exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {statement}", (None,) * statement.count("?")
+            )
+            return [row[3] for row in rows]
@@ -0,0 +1,33 @@
+"""Shared fixtures for database tests."""
+
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
+
+import pytest
+from sqlalchemy import event
+from sqlmodel import Session
+
+
+@pytest.fixture
+def count_queries() -> Callable[[Session], AbstractContextManager[list[str]]]:
+    """Return a context manager recording each SQL statement a session runs.
+
+    The yielded list fills with statement text as the block executes; an
+    executemany counts once, matching one round trip to SQLite.
+    """
+
+    @contextmanager
+    def counter(session: Session) -> Iterator[list[str]]:
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+    return counter
@@ -13,6 +13,7 @@ from src.databases.datatypes.bloodwork import (
     Panel,
     VALID_BIOMARKER_CODES,
 )
+from src.databases.datatypes.bloodwork.validators import validate_biomarker_code
 
 
 class TestBiomarkerCodeValidation:
@@ -106,6 +107,24 @@ class TestBiomarkerCodeValidation:
         })
         assert biomarker.code == "VITAMIN_B12"
 
+    def test_repeated_code_validation_is_cached(self, monkeypatch):
+        """A code validated once should not be re-checked."""
+        validate_biomarker_code.cache_clear()
+        calls = []
+
+        def record(v):
+            calls.append(v)
+            return v
+
+        monkeypatch.setattr(
+            "src.databases.datatypes.bloodwork.validators.validate_code", record
+        )
+        validate_biomarker_code("GLUCOSE")
+        validate_biomarker_code("GLUCOSE")
+
+        assert calls == ["GLUCOSE"]
+        validate_biomarker_code.cache_clear()
+
 
 class TestFlag:
     """Tests for Flag enum."""
@@ -1,9 +1,11 @@
 """Tests for BloodworkRepository."""
 
+import sqlite3
 from datetime import date
 from uuid import uuid4
 
 import pytest
+from sqlalchemy import inspect
 from sqlmodel import Session
 
 from src.databases.clients.sqlite import DatabaseClient
@@ -83,6 +85,15 @@ class TestListReports:
         assert len(reports) == 1
         assert reports[0].id == sample_report.id
 
+    def test_returns_unattached_reports_with_all_fields(
+        self, repo, db_session, sample_report
+    ):
+        """Should build complete reports that the session does not track."""
+        [report] = repo.list_reports()
+
+        assert not any(obj is report for obj in db_session)
+        assert report.model_dump() == repo.get_report(sample_report.id).model_dump()
+
     def test_orders_by_collected_date_descending(self, repo, db_session):
         """Should order reports by collected_date descending."""
         # Create older report
@@ -143,6 +154,25 @@ class TestGetPanelsForReport:
         assert panels == []
 
 
+class TestGetPanelsForReports:
+    """Tests for get_panels_for_reports method."""
+
+    def test_groups_panels_by_report(self, repo, db_session, sample_report):
+        """Should return each report's panels keyed by report ID."""
+        empty = LabReport(lab_provider="Quest", collected_date=date(2023, 1, 1))
+        db_session.add(empty)
+        db_session.commit()
+
+        result = repo.get_panels_for_reports([sample_report.id, empty.id])
+
+        assert [p.name for p in result[sample_report.id]] == ["Metabolic Panel"]
+        assert result[empty.id] == []
+
+    def test_returns_empty_dict_for_no_reports(self, repo):
+        """Should return empty dict when no report IDs are given."""
+        assert repo.get_panels_for_reports([]) == {}
+
+
 class TestGetBiomarkersForPanel:
     """Tests for get_biomarkers_for_panel method."""
 
@@ -173,6 +203,35 @@ class TestGetBiomarkersForPanel:
         assert biomarkers == []
 
 
+class TestGetBiomarkersForPanels:
+    """Tests for get_biomarkers_for_panels method."""
+
+    def test_groups_biomarkers_by_panel(self, repo, db_session, sample_report):
+        """Should return each panel's biomarkers keyed by panel ID."""
+        [panel] = repo.get_panels_for_report(sample_report.id)
+        empty = Panel(lab_report_id=sample_report.id, name="Empty Panel")
+        db_session.add(empty)
+        db_session.commit()
+
+        result = repo.get_biomarkers_for_panels([panel.id, empty.id])
+
+        assert [b.name for b in result[panel.id]] == ["Glucose"]
+        assert result[empty.id] == []
+
+    def test_returns_unattached_biomarkers(self, repo, db_session, sample_report):
+        """Should build biomarkers that the session does not track."""
+        [panel] = repo.get_panels_for_report(sample_report.id)
+
+        [biomarker] = repo.get_biomarkers_for_panels([panel.id])[panel.id]
+
+        assert not any(obj is biomarker for obj in db_session)
+        assert biomarker.flag is Flag.NORMAL
+
+    def test_returns_empty_dict_for_no_panels(self, repo):
+        """Should return empty dict when no panel IDs are given."""
+        assert repo.get_biomarkers_for_panels([]) == {}
+
+
 class TestGetBiomarkerHistory:
     """Tests for get_biomarker_history method."""
 
@@ -264,6 +323,13 @@ class TestGetBiomarkerHistory:
         history = repo.get_biomarker_history("NONEXISTENT")
         assert history == []
 
+    def test_returns_unattached_biomarkers(self, repo, db_session, sample_report):
+        """Should build biomarkers that the session does not track."""
+        [biomarker] = repo.get_biomarker_history("GLUCOSE")
+
+        assert not any(obj is biomarker for obj in db_session)
+        assert biomarker.flag is Flag.NORMAL
+
 
 class TestGetFlaggedBiomarkers:
     """Tests for get_flagged_biomarkers method."""
@@ -323,6 +389,33 @@ class TestGetFlaggedBiomarkers:
         assert codes == {"LDL", "VITAMIN_D_25_HYDROXY"}
 
 
+class TestIterFlaggedBiomarkers:
+    """Tests for iter_flagged_biomarkers method."""
+
+    def test_streams_flagged_biomarkers(self, repo, db_session, sample_report):
+        """Should yield only non-normal biomarkers, without a list."""
+        [panel] = repo.get_panels_for_report(sample_report.id)
+        db_session.add(
+            Biomarker(
+                panel_id=panel.id,
+                name="LDL",
+                code="LDL",
+                value=150.0,
+                unit="mg/dL",
+                flag=Flag.HIGH,
+            )
+        )
+        db_session.commit()
+
+        flagged = repo.iter_flagged_biomarkers()
+        assert not isinstance(flagged, list)
+        assert [(b.code, b.flag) for b in flagged] == [("LDL", Flag.HIGH)]
+
+    def test_yields_nothing_when_no_flagged(self, repo, sample_report):
+        """Should yield nothing when every biomarker is normal."""
+        assert list(repo.iter_flagged_biomarkers()) == []
+
+
 class TestGetRecentBiomarkers:
     """Tests for get_recent_biomarkers method."""
 
@@ -374,11 +467,62 @@ class TestGetRecentBiomarkers:
         assert len(glucose_values) == 1
         assert glucose_values[0].value == 95.0  # Most recent
 
+    def test_returns_one_per_code_ordered_by_code(self, repo, db_session):
+        """Should return a single row per code, sorted by code."""
+        report = LabReport(lab_provider="Quest", collected_date=date(2024, 1, 1))
+        panel = Panel(lab_report_id=report.id, name="Panel")
+        db_session.add(report)
+        db_session.flush()
+        db_session.add(panel)
+        db_session.flush()
+        for code in ("TSH", "GLUCOSE", "HDL"):
+            db_session.add(Biomarker(
+                panel_id=panel.id, name=code, code=code, value=1.0, unit="u"
+            ))
+        db_session.commit()
+
+        recent = repo.get_recent_biomarkers()
+
+        assert [b.code for b in recent] == ["GLUCOSE", "HDL", "TSH"]
+
     def test_returns_empty_when_no_biomarkers(self, repo):
         """Should return empty list when no biomarkers exist."""
         recent = repo.get_recent_biomarkers()
         assert recent == []
 
+    def test_returns_unattached_biomarkers_with_all_fields(
+        self, repo, db_session, sample_report
+    ):
+        """Should build complete biomarkers that the session does not track."""
+        [stored] = repo.get_biomarkers_for_panel(
+            repo.get_panels_for_report(sample_report.id)[0].id
+        )
+
+        [recent] = repo.get_recent_biomarkers()
+
+        assert not any(obj is recent for obj in db_session)
+        assert recent.model_dump() == stored.model_dump()
+        assert recent.flag is Flag.NORMAL
+
+
+class TestReadPathValidation:
+    """Tests that loading stored rows does not re-run model validators."""
+
+    def test_reads_skip_pydantic_validation(
+        self, repo, db_session, sample_report, monkeypatch
+    ):
+        """Hydrating biomarkers should not run the Pydantic validator."""
+        db_session.expire_all()
+
+        class FailingValidator:
+            def __getattr__(self, name):
+                raise AssertionError("Pydantic validation ran on a read path")
+
+        monkeypatch.setattr(Biomarker, "__pydantic_validator__", FailingValidator())
+
+        assert [b.code for b in repo.get_biomarker_history("GLUCOSE")] == ["GLUCOSE"]
+        assert [b.code for b in repo.get_recent_biomarkers()] == ["GLUCOSE"]
+
 
 class TestSaveReport:
     """Tests for save_report method."""
@@ -414,3 +558,109 @@ class TestSaveReport:
 
         biomarkers = repo.get_biomarkers_for_panel(panel.id)
         assert len(biomarkers) == 1
+
+    def test_saves_field_values(self, repo):
+        """Should store every panel and biomarker field."""
+        report = LabReport(
+            lab_provider="Quest",
+            collected_date=date(2024, 1, 15),
+            source_file="test.json",
+        )
+        panel = Panel(lab_report_id=report.id, name="Lipids", comment="Fasting")
+        biomarker = Biomarker(
+            panel_id=panel.id,
+            name="LDL",
+            code="LDL",
+            value=130.0,
+            unit="mg/dL",
+            reference_high=100.0,
+            flag=Flag.HIGH,
+        )
+
+        repo.save_report(report, [panel], [biomarker])
+
+        [saved_panel] = repo.get_panels_for_report(report.id)
+        assert saved_panel.id == panel.id
+        assert saved_panel.comment == "Fasting"
+        [saved] = repo.get_biomarkers_for_panel(panel.id)
+        assert saved.id == biomarker.id
+        assert saved.flag == Flag.HIGH
+        assert saved.reference_low is None
+        assert saved.reference_high == 100.0
+
+    def test_saves_report_without_panels(self, repo):
+        """Should save a report that has no panels or biomarkers."""
+        report = LabReport(
+            lab_provider="Quest",
+            collected_date=date(2024, 1, 15),
+            source_file="empty.json",
+        )
+
+        assert repo.save_report(report, [], []) is True
+        assert repo.get_panels_for_report(report.id) == []
+
+    def test_leaves_report_untracked(self, repo):
+        """Should insert the report without attaching it to the session."""
+        report = LabReport(
+            lab_provider="Quest",
+            collected_date=date(2024, 1, 15),
+            source_file="test.json",
+        )
+
+        repo.save_report(report, [], [])
+
+        # Still transient, so reading it after commit needs no refresh query
+        assert inspect(report).transient
+        assert repo.get_report(report.id).lab_provider == "Quest"
+
+    def test_duplicate_source_file_is_skipped(self, repo, sample_report):
+        """Should return False for an already imported source file."""
+        report = LabReport(
+            lab_provider="Quest",
+            collected_date=date(2024, 2, 1),
+            source_file="test.json",
+        )
+
+        assert repo.save_report(report, [], []) is False
+        assert len(repo.list_reports()) == 1
+
+
+class TestBeginImmediate:
+    """Tests for taking the write lock at the start of a save."""
+
+    @staticmethod
+    def try_write_lock(db_client) -> bool:
+        """Return whether a separate connection can take the write lock."""
+        conn = sqlite3.connect(db_client.db_path, timeout=0, isolation_level=None)
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("ROLLBACK")
+            return True
+        except sqlite3.OperationalError:
+            return False
+        finally:
+            conn.close()
+
+    def test_holds_write_lock_until_commit(self, repo, db_session, db_client):
+        """Should hold the write lock from begin_immediate() until commit."""
+        repo.begin_immediate()
+        assert not self.try_write_lock(db_client)
+
+        db_session.commit()
+        assert self.try_write_lock(db_client)
+
+    def test_is_noop_inside_open_transaction(self, repo):
+        """Should not issue a nested BEGIN when a transaction is already open."""
+        repo.begin_immediate()
+        repo.begin_immediate()
+
+    def test_duplicate_save_releases_write_lock(self, repo, sample_report, db_client):
+        """Should release the write lock when skipping an already imported file."""
+        report = LabReport(
+            lab_provider="Quest",
+            collected_date=date(2024, 2, 1),
+            source_file="test.json",
+        )
+
+        assert repo.save_report(report, [], []) is False
+        assert self.try_write_lock(db_client)
@@ -120,6 +120,14 @@ class TestGetSnpsForGene:
         assert len(snps) == 1
         assert snps[0].gene == "MTHFR"
 
+    def test_returns_unattached_snps(self, repo, db_session, sample_test):
+        """Should build SNPs that the session does not track."""
+        [snp] = repo.get_snps_for_gene("MTHFR")
+
+        assert not any(obj is snp for obj in db_session)
+        assert snp.dna_test_id == sample_test.id
+        assert snp.repute is Repute.BAD
+
     def test_orders_by_magnitude_descending(self, repo, db_session):
         """Should order SNPs by magnitude descending."""
         test = DnaTest(
@@ -191,6 +199,31 @@ class TestGetHighImpactSnps:
         snps = repo.get_high_impact_snps()
         assert len(snps) == 0
 
+
+class TestIterHighImpactSnps:
+    """Tests for iter_high_impact_snps method."""
+
+    def test_streams_snps_in_list_order(self, repo, db_session, sample_test):
+        """Should yield the same SNPs, in the same order, as the list method."""
+        db_session.add(
+            Snp(
+                dna_test_id=sample_test.id,
+                rsid="rs4680",
+                genotype="AG",
+                magnitude=4.0,
+                gene="COMT",
+            )
+        )
+        db_session.commit()
+
+        snps = repo.iter_high_impact_snps()
+        assert not isinstance(snps, list)
+        assert [snp.rsid for snp in snps] == ["rs4680", "rs1801133"]
+
+    def test_yields_nothing_when_no_snps(self, repo):
+        """Should yield nothing when no high-impact SNPs exist."""
+        assert list(repo.iter_high_impact_snps()) == []
+
     def test_orders_by_magnitude_descending(self, repo, db_session):
         """Should order by magnitude descending."""
         test = DnaTest(
@@ -250,3 +283,52 @@ class TestSaveTest:
 
         saved_snp = repo.get_snp_by_rsid("rs1801133")
         assert saved_snp is not None
+
+    def test_saves_snp_field_values(self, repo):
+        """Should store set and unset optional fields of each SNP."""
+        test = DnaTest(
+            source="23andMe",
+            collected_date=date(2024, 1, 15),
+            source_file="test.json",
+        )
+        snps = [
+            Snp(
+                dna_test_id=test.id,
+                rsid="rs1801133",
+                genotype="CT",
+                magnitude=3.0,
+                repute=Repute.BAD,
+                gene="MTHFR",
+            ),
+            Snp(
+                dna_test_id=test.id,
+                rsid="rs4680",
+                genotype="AG",
+                magnitude=2.5,
+                gene="COMT",
+            ),
+        ]
+
+        repo.save_test(test, snps)
+
+        assert repo.get_snp_by_rsid("rs1801133").repute is Repute.BAD
+        saved = repo.get_snp_by_rsid("rs4680")
+        assert saved.repute is None
+        assert saved.dna_test_id == test.id
+
+    def test_skips_already_imported_source_file(self, repo):
+        """Should return False and save nothing for a known source_file."""
+        first = DnaTest(
+            source="23andMe",
+            collected_date=date(2024, 1, 15),
+            source_file="test.json",
+        )
+        second = DnaTest(
+            source="23andMe",
+            collected_date=date(2024, 2, 1),
+            source_file="test.json",
+        )
+
+        assert repo.save_test(first, []) is True
+        assert repo.save_test(second, []) is False
+        assert [t.id for t in repo.list_tests()] == [first.id]
@@ -200,7 +200,7 @@ class TestKnowledge:
         assert knowledge.confidence == 1.0
 
     def test_knowledge_confidence_below_zero_raises(self):
-        with pytest.raises(ValidationError, match="confidence must be between 0.0 and 1.0"):
+        with pytest.raises(ValidationError, match="greater than or equal to 0"):
             Knowledge.model_validate({
                 "type": KnowledgeType.INSIGHT,
                 "summary": "Test",
@@ -209,7 +209,7 @@ class TestKnowledge:
             })
 
     def test_knowledge_confidence_above_one_raises(self):
-        with pytest.raises(ValidationError, match="confidence must be between 0.0 and 1.0"):
+        with pytest.raises(ValidationError, match="less than or equal to 1"):
             Knowledge.model_validate({
                 "type": KnowledgeType.INSIGHT,
                 "summary": "Test",
@@ -1,5 +1,7 @@
 """Tests for KnowledgeRepository."""
 
+import sqlite3
+from datetime import datetime
 from uuid import uuid4
 
 import pytest
@@ -73,6 +75,20 @@ class TestGetKnowledge:
         assert knowledge is None
 
 
+class TestGetKnowledgeEntries:
+    """Tests for get_knowledge_entries method."""
+
+    def test_maps_found_ids_to_entries(self, repo, sample_knowledge):
+        """Should return found entries keyed by ID and omit unknown IDs."""
+        entries = repo.get_knowledge_entries({sample_knowledge.id, uuid4()})
+        assert list(entries) == [sample_knowledge.id]
+        assert entries[sample_knowledge.id].summary == "Test insight"
+
+    def test_returns_empty_dict_for_no_ids(self, repo):
+        """Should return empty dict when no knowledge IDs are given."""
+        assert repo.get_knowledge_entries(set()) == {}
+
+
 class TestGetTagsForKnowledge:
     """Tests for get_tags_for_knowledge method."""
 
@@ -82,6 +98,81 @@ class TestGetTagsForKnowledge:
         assert len(tags) == 1
         assert tags[0].tag == "test"
 
+    def test_binds_each_call_to_its_own_entry(self, repo, sample_knowledge):
+        """Should return only the requested entry's tags on repeated calls."""
+        other = Knowledge(
+            type=KnowledgeType.MEMORY,
+            summary="Other",
+            content="Other entry.",
+            confidence=0.5,
+        )
+        repo.save_knowledge(other, [KnowledgeTag(knowledge_id=other.id, tag="other")], [])
+
+        assert [t.tag for t in repo.get_tags_for_knowledge(other.id)] == ["other"]
+        assert [t.tag for t in repo.get_tags_for_knowledge(sample_knowledge.id)] == ["test"]
+        assert repo.get_tags_for_knowledge(uuid4()) == []
+
+
+class TestGetTagsAndLinksForEntries:
+    """Tests for get_tags_for_entries and get_links_for_entries methods."""
+
+    def test_groups_tags_and_links_by_entry(self, repo, sample_knowledge):
+        """Should return each entry's tags and links keyed by knowledge ID."""
+        other = Knowledge(
+            type=KnowledgeType.MEMORY,
+            summary="Other",
+            content="Other entry.",
+            confidence=0.5,
+        )
+        link = KnowledgeLink(
+            knowledge_id=other.id,
+            link_type=LinkType.KNOWLEDGE,
+            target_id=sample_knowledge.id,
+        )
+        repo.save_knowledge(
+            other,
+            [
+                KnowledgeTag(knowledge_id=other.id, tag="b"),
+                KnowledgeTag(knowledge_id=other.id, tag="a"),
+            ],
+            [link],
+        )
+        ids = [sample_knowledge.id, other.id]
+
+        tags = repo.get_tags_for_entries(ids)
+        links = repo.get_links_for_entries(ids)
+
+        assert [t.tag for t in tags[sample_knowledge.id]] == ["test"]
+        assert [t.tag for t in tags[other.id]] == ["a", "b"]
+        assert links[sample_knowledge.id] == []
+        assert [l.target_id for l in links[other.id]] == [sample_knowledge.id]
+
+    def test_orders_links_by_type_name(self, repo, sample_knowledge):
+        """Should list links alphabetically by type, not by stored code."""
+        other = Knowledge(
+            type=KnowledgeType.MEMORY,
+            summary="Other",
+            content="Other entry.",
+            confidence=0.5,
+        )
+        link_types = [LinkType.SNP, LinkType.INGREDIENT, LinkType.BIOMARKER]
+        links = [
+            KnowledgeLink(knowledge_id=other.id, link_type=t, target_id=uuid4())
+            for t in link_types
+        ]
+        repo.save_knowledge(other, [], links)
+
+        expected = [LinkType.BIOMARKER, LinkType.INGREDIENT, LinkType.SNP]
+        by_entry = repo.get_links_for_entries([other.id])
+        assert [l.link_type for l in by_entry[other.id]] == expected
+        single = repo.get_links_for_knowledge(other.id)
+        assert [l.link_type for l in single] == expected
+
+    def test_returns_empty_dicts_for_no_entries(self, repo):
+        """Should return empty dicts when no knowledge IDs are given."""
+        assert repo.get_tags_for_entries([]) == {}
+        assert repo.get_links_for_entries([]) == {}
+
 
 class TestListActive:
     """Tests for list_active method."""
@@ -107,6 +198,18 @@ class TestListActive:
         entries = repo.list_active()
         assert len(entries) == 0
 
+    def test_returns_unattached_entries_with_all_fields(
+        self, repo, db_session, sample_knowledge
+    ):
+        """Should build complete entries that the session does not track."""
+        stored = repo.get_knowledge(sample_knowledge.id)
+
+        [entry] = repo.list_active()
+
+        assert not any(obj is entry for obj in db_session)
+        assert entry.model_dump() == stored.model_dump()
+        assert entry.type is KnowledgeType.INSIGHT
+
 
 class TestGetByTag:
     """Tests for get_by_tag method."""
@@ -122,6 +225,116 @@ class TestGetByTag:
         entries = repo.get_by_tag("nonexistent")
         assert entries == []
 
+    def test_returns_each_entry_once_oldest_first(self, repo):
+        """Should return every tagged entry once, ordered by creation time."""
+        older = Knowledge(
+            type=KnowledgeType.INSIGHT,
+            summary="Older",
+            content="Older entry.",
+            confidence=0.5,
+            created_at=datetime(2024, 1, 1),
+        )
+        newer = Knowledge(
+            type=KnowledgeType.INSIGHT,
+            summary="Newer",
+            content="Newer entry.",
+            confidence=0.5,
+            created_at=datetime(2024, 6, 1),
+        )
+        repo.save_knowledge(newer, [KnowledgeTag(knowledge_id=newer.id, tag="shared")], [])
+        repo.save_knowledge(
+            older,
+            [
+                KnowledgeTag(knowledge_id=older.id, tag="shared"),
+                KnowledgeTag(knowledge_id=older.id, tag="shared"),
+            ],
+            [],
+        )
+
+        entries = repo.get_by_tag("shared")
+
+        assert [e.summary for e in entries] == ["Older", "Newer"]
+
+
+class TestGetLinkedTo:
+    """Tests for get_linked_to method."""
+
+    def test_returns_entries_linked_to_target(self, repo, sample_knowledge):
+        """Should return entries linked to the target with the given link type."""
+        target_id = uuid4()
+        linked = Knowledge(
+            type=KnowledgeType.INSIGHT,
+            summary="Linked",
+            content="Linked entry.",
+            confidence=0.5,
+        )
+        link = KnowledgeLink(
+            knowledge_id=linked.id, link_type=LinkType.SNP, target_id=target_id
+        )
+        repo.save_knowledge(linked, [], [link])
+
+        assert [e.id for e in repo.get_linked_to(LinkType.SNP, target_id)] == [linked.id]
+        assert repo.get_linked_to(LinkType.BIOMARKER, target_id) == []
+        assert repo.get_linked_to(LinkType.SNP, uuid4()) == []
+
+
+class TestValidateLinkTargetExists:
+    """Tests for validate_link_target_exists method."""
+
+    def test_returns_true_for_existing_target(self, repo, sample_knowledge):
+        """Should find a target stored in the linked table."""
+        assert repo.validate_link_target_exists(LinkType.KNOWLEDGE, sample_knowledge.id)
+
+    def test_returns_false_for_missing_target(self, repo, sample_knowledge):
+        """Should return False when no row has the target ID."""
+        assert not repo.validate_link_target_exists(LinkType.KNOWLEDGE, uuid4())
+
+    def test_checks_each_link_type_against_its_model_table(self):
+        """Should look targets up in the table of the model each type names."""
+        from src.databases.datatypes.bloodwork import Biomarker
+        from src.databases.datatypes.dna import Snp
+        from src.databases.datatypes.knowledge.repository import _LINK_TARGET_TABLES
+        from src.databases.datatypes.supplement import Ingredient, SupplementLabel
+        from src.databases.datatypes.supplement_protocol import SupplementProtocol
+
+        models = {
+            LinkType.SNP: Snp,
+            LinkType.BIOMARKER: Biomarker,
+            LinkType.INGREDIENT: Ingredient,
+            LinkType.SUPPLEMENT: SupplementLabel,
+            LinkType.PROTOCOL: SupplementProtocol,
+            LinkType.KNOWLEDGE: Knowledge,
+        }
+
+        assert {t: target.name for t, target in _LINK_TARGET_TABLES.items()} == {
+            t: model.__tablename__ for t, model in models.items()
+        }
+
+
+class TestValidateLinkTargetsExist:
+    """Tests for validate_link_targets_exist method."""
+
+    def test_reports_each_requested_target(self, repo, sample_knowledge):
+        """Should map every requested pair to whether its target exists."""
+        missing = uuid4()
+        targets = [
+            (LinkType.KNOWLEDGE, sample_knowledge.id),
+            (LinkType.KNOWLEDGE, missing),
+            (LinkType.SNP, sample_knowledge.id),
+        ]
+
+        found = repo.validate_link_targets_exist(targets)
+
+        assert found == {
+            (LinkType.KNOWLEDGE, sample_knowledge.id): True,
+            (LinkType.KNOWLEDGE, missing): False,
+            (LinkType.SNP, sample_knowledge.id): False,
+        }
+
+    def test_returns_empty_dict_for_no_targets(self, repo):
+        """Should return an empty dict when no targets are given."""
+        assert repo.validate_link_targets_exist([]) == {}
+
 
 class TestSaveKnowledge:
     """Tests for save_knowledge method."""
@@ -179,3 +392,35 @@ class TestSupersede:
         )
         with pytest.raises(ValueError):
             repo.supersede(uuid4(), new_knowledge, [], [])
+
+    def test_missing_old_entry_saves_nothing(self, repo, sample_knowledge):
+        """Should leave the database unchanged when old knowledge is missing."""
+        new_knowledge = Knowledge(
+            type=KnowledgeType.INSIGHT,
+            summary="New insight",
+            content="Content",
+            confidence=0.9,
+        )
+        with pytest.raises(ValueError):
+            repo.supersede(uuid4(), new_knowledge, [], [])
+
+        assert repo.get_knowledge(new_knowledge.id) is None
+        assert [e.id for e in repo.list_active()] == [sample_knowledge.id]
+
+    def test_missing_old_entry_releases_write_lock(self, repo, db_client):
+        """Should give up the write lock taken for the supersede."""
+        new_knowledge = Knowledge(
+            type=KnowledgeType.INSIGHT,
+            summary="New insight",
+            content="Content",
+            confidence=0.9,
+        )
+        with pytest.raises(ValueError):
+            repo.supersede(uuid4(), new_knowledge, [], [])
+
+        conn = sqlite3.connect(db_client.db_path, timeout=0, isolation_level=None)
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("ROLLBACK")
+        finally:
+            conn.close()
@@ -14,6 +14,7 @@ from src.databases.datatypes.supplement import (
     SupplementLabel,
     VALID_INGREDIENT_CODES,
 )
+from src.databases.datatypes.supplement.validators import validate_ingredient_code
 
 
 class TestIngredientCodeValidation:
@@ -117,6 +118,24 @@ class TestIngredientCodeValidation:
         })
         assert ingredient.code == "L_GLUTAMINE"
 
+    def test_repeated_code_validation_is_cached(self, monkeypatch):
+        """A code validated once should not be re-checked."""
+        validate_ingredient_code.cache_clear()
+        calls = []
+
+        def record(v):
+            calls.append(v)
+            return v
+
+        monkeypatch.setattr(
+            "src.databases.datatypes.supplement.validators.validate_code", record
+        )
+        validate_ingredient_code("ZINC")
+        validate_ingredient_code("ZINC")
+
+        assert calls == ["ZINC"]
+        validate_ingredient_code.cache_clear()
+
 
 class TestIngredientType:
     """Tests for IngredientType enum."""
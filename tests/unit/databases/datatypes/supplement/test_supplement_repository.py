@@ -3,6 +3,7 @@
 from uuid import uuid4
 
 import pytest
+from sqlalchemy import inspect
 
 from src.databases.clients.sqlite import DatabaseClient
 from src.databases.datatypes.supplement import (
@@ -80,6 +81,32 @@ class TestListLabels:
         assert labels[0].id == sample_label.id
 
 
+class TestIterLabels:
+    """Tests for iter_labels method."""
+
+    def test_streams_labels_in_list_order(self, repo, db_session, sample_label):
+        """Should yield the same labels, in the same order, as list_labels."""
+        db_session.add(
+            SupplementLabel(
+                brand="AnotherBrand",
+                product_name="Zinc",
+                form=SupplementForm.TABLET,
+                serving_size="1 tablet",
+            )
+        )
+        db_session.commit()
+
+        labels = repo.iter_labels()
+        assert not isinstance(labels, list)
+        assert [label.id for label in labels] == [
+            label.id for label in repo.list_labels()
+        ]
+
+    def test_yields_nothing_when_no_labels(self, repo):
+        """Should yield nothing when no labels exist."""
+        assert list(repo.iter_labels()) == []
+
+
 class TestGetLabel:
     """Tests for get_label method."""
 
@@ -95,6 +122,20 @@ class TestGetLabel:
         assert label is None
 
 
+class TestGetLabels:
+    """Tests for get_labels method."""
+
+    def test_maps_found_ids_to_labels(self, repo, sample_label):
+        """Should return found labels keyed by ID and omit unknown IDs."""
+        labels = repo.get_labels({sample_label.id, uuid4()})
+        assert list(labels) == [sample_label.id]
+        assert labels[sample_label.id].brand == "TestBrand"
+
+    def test_returns_empty_dict_for_no_ids(self, repo):
+        """Should return empty dict when no label IDs are given."""
+        assert repo.get_labels(set()) == {}
+
+
 class TestGetIngredientsByCode:
     """Tests for get_ingredients_by_code method."""
 
@@ -110,6 +151,34 @@ class TestGetIngredientsByCode:
         assert ingredients == []
 
 
+class TestGetIngredientsForBlends:
+    """Tests for get_ingredients_for_blends method."""
+
+    def test_groups_ingredients_by_blend(self, repo, db_session, sample_label):
+        """Should return each blend's ingredients keyed by blend ID."""
+        blend_a = ProprietaryBlend(supplement_label_id=sample_label.id, name="Blend A")
+        blend_b = ProprietaryBlend(supplement_label_id=sample_label.id, name="Blend B")
+        db_session.add(blend_a)
+        db_session.add(blend_b)
+        db_session.flush()
+        db_session.add(Ingredient(
+            blend_id=blend_a.id, type=IngredientType.BLEND, name="Zinc", code="ZINC"
+        ))
+        db_session.add(Ingredient(
+            blend_id=blend_a.id, type=IngredientType.BLEND, name="Ashwagandha", code="ASHWAGANDHA"
+        ))
+        db_session.commit()
+
+        result = repo.get_ingredients_for_blends([blend_a.id, blend_b.id])
+
+        assert [i.name for i in result[blend_a.id]] == ["Ashwagandha", "Zinc"]
+        assert result[blend_b.id] == []
+
+    def test_returns_empty_dict_for_no_blends(self, repo):
+        """Should return empty dict when no blend IDs are given."""
+        assert repo.get_ingredients_for_blends([]) == {}
+
+
 class TestSearchLabels:
     """Tests for search_labels method."""
 
@@ -129,6 +198,50 @@ class TestSearchLabels:
         labels = repo.search_labels("nonexistent")
         assert labels == []
 
+    def test_matches_case_insensitive_substring(self, repo, sample_label):
+        """Should match part of a word regardless of case."""
+        labels = repo.search_labels("tbra")
+        assert [label.id for label in labels] == [sample_label.id]
+
+    def test_matches_short_terms(self, repo, sample_label):
+        """Should match terms shorter than a trigram."""
+        labels = repo.search_labels("D3")
+        assert [label.id for label in labels] == [sample_label.id]
+
+    def test_matches_quotes_literally(self, repo, db_session):
+        """Should treat FTS5 syntax in the term as plain text."""
+        label = SupplementLabel(
+            brand='Say "Hi" Labs',
+            product_name="Magnesium",
+            form=SupplementForm.TABLET,
+            serving_size="1 tablet",
+        )
+        db_session.add(label)
+        db_session.commit()
+
+        assert [x.id for x in repo.search_labels('"Hi" OR')] == []
+        assert [x.id for x in repo.search_labels('"Hi" Labs')] == [label.id]
+
+    def test_follows_label_updates_and_deletes(self, repo, db_session):
+        """Should search the current brand and product names."""
+        label = SupplementLabel(
+            brand="TestBrand",
+            product_name="Zinc",
+            form=SupplementForm.TABLET,
+            serving_size="1 tablet",
+        )
+        db_session.add(label)
+        db_session.commit()
+
+        label.brand = "OtherBrand"
+        db_session.commit()
+        assert repo.search_labels("TestBrand") == []
+        assert len(repo.search_labels("OtherBrand")) == 1
+
+        db_session.delete(label)
+        db_session.commit()
+        assert repo.search_labels("OtherBrand") == []
+
 
 class TestSaveLabel:
     """Tests for save_label method."""
@@ -158,3 +271,34 @@ class TestSaveLabel:
 
         ingredients = repo.get_ingredients_for_label(label.id)
         assert len(ingredients) == 1
+
+    def test_saves_blends_and_blend_ingredients(self, repo):
+        """Should save blends, their ingredients, and list columns in FK order."""
+        label = SupplementLabel(
+            brand="BlendBrand",
+            product_name="Greens",
+            form=SupplementForm.POWDER,
+            serving_size="1 scoop",
+            warnings=["Keep out of reach of children"],
+            source_file="greens.json",
+        )
+        blend = ProprietaryBlend(
+            supplement_label_id=label.id, name="Greens Blend", total_amount=5.0
+        )
+        ingredient = Ingredient(
+            blend_id=blend.id,
+            type=IngredientType.BLEND,
+            name="Ashwagandha",
+            code="ASHWAGANDHA",
+        )
+
+        assert repo.save_label(label, [blend], [ingredient]) is True
+
+        # Still transient, so reading it after commit needs no refresh query
+        assert inspect(label).transient
+        assert repo.get_label(label.id).warnings == ["Keep out of reach of children"]
+        assert [b.id for b in repo.get_blends_for_label(label.id)] == [blend.id]
+        assert [i.id for i in repo.get_ingredients_for_blend(blend.id)] == [
+            ingredient.id
+        ]
+        assert [found.id for found in repo.search_labels("Greens")] == [label.id]
@@ -129,6 +129,76 @@ class TestGetCurrentProtocol:
         assert current is None
 
 
+class TestGetProtocolWithSupplements:
+    """Tests for get_protocol_with_supplements method."""
+
+    def test_returns_protocol_and_supplements(self, repo, sample_protocol):
+        """Should return the protocol together with its supplements."""
+        result = repo.get_protocol_with_supplements(sample_protocol.id)
+
+        assert result is not None
+        protocol, supplements = result
+        assert protocol.id == sample_protocol.id
+        assert [s.name for s in supplements] == ["Vitamin D3"]
+
+    def test_returns_empty_list_when_no_supplements(self, repo, db_session):
+        """Should return the protocol with no supplements when it has none."""
+        protocol = SupplementProtocol(protocol_date=date(2023, 1, 1))
+        db_session.add(protocol)
+        db_session.commit()
+
+        result = repo.get_protocol_with_supplements(protocol.id)
+
+        assert result is not None
+        assert result[0].id == protocol.id
+        assert result[1] == []
+
+    def test_returns_none_when_not_found(self, repo):
+        """Should return None when protocol not found."""
+        assert repo.get_protocol_with_supplements(uuid4()) is None
+
+
+class TestGetCurrentProtocolWithSupplements:
+    """Tests for get_current_protocol_with_supplements method."""
+
+    def test_returns_most_recent_with_supplements(
+        self, repo, db_session, sample_protocol
+    ):
+        """Should return the most recent protocol and its supplements."""
+        db_session.add(SupplementProtocol(protocol_date=date(2023, 1, 1)))
+        db_session.commit()
+
+        result = repo.get_current_protocol_with_supplements()
+
+        assert result is not None
+        protocol, supplements = result
+        assert protocol.id == sample_protocol.id
+        assert [s.name for s in supplements] == ["Vitamin D3"]
+
+    def test_returns_none_when_no_protocols(self, repo):
+        """Should return None when no protocols exist."""
+        assert repo.get_current_protocol_with_supplements() is None
+
+
+class TestGetSupplementsForProtocols:
+    """Tests for get_supplements_for_protocols method."""
+
+    def test_groups_supplements_by_protocol(self, repo, db_session, sample_protocol):
+        """Should return each protocol's supplements keyed by protocol ID."""
+        empty = SupplementProtocol(protocol_date=date(2023, 1, 1))
+        db_session.add(empty)
+        db_session.commit()
+
+        result = repo.get_supplements_for_protocols([sample_protocol.id, empty.id])
+
+        assert [s.name for s in result[sample_protocol.id]] == ["Vitamin D3"]
+        assert result[empty.id] == []
+
+    def test_returns_empty_dict_for_no_protocols(self, repo):
+        """Should return empty dict when no protocol IDs are given."""
+        assert repo.get_supplements_for_protocols([]) == {}
+
+
 class TestSaveProtocol:
     """Tests for save_protocol method."""
 
@@ -153,3 +223,55 @@ class TestSaveProtocol:
 
         supplements = repo.get_supplements_for_protocol(protocol.id)
         assert len(supplements) == 1
+
+    def test_lists_supplements_in_import_order(self, repo):
+        """Should return supplements in the order they were saved, not by name."""
+        protocol = SupplementProtocol(protocol_date=date(2024, 2, 15))
+        names = ["Vitamin D3", "Fish Oil", "Magnesium"]
+        repo.save_protocol(
+            protocol,
+            [
+                ProtocolSupplement(
+                    protocol_id=protocol.id,
+                    type=ProtocolSupplementType.SCHEDULED,
+                    name=name,
+                    frequency=Frequency.DAILY,
+                )
+                for name in names
+            ],
+        )
+
+        by_protocol = repo.get_supplements_for_protocols([protocol.id])
+        _, joined = repo.get_protocol_with_supplements(protocol.id)
+        _, current = repo.get_current_protocol_with_supplements()
+        assert [s.name for s in repo.get_supplements_for_protocol(protocol.id)] == names
+        assert [s.name for s in by_protocol[protocol.id]] == names
+        assert [s.name for s in joined] == names
+        assert [s.name for s in current] == names
+
+    def test_saves_supplement_field_values(self, repo):
+        """Should store set and unset optional fields of each supplement."""
+        protocol = SupplementProtocol(protocol_date=date(2024, 2, 15))
+        supplements = [
+            ProtocolSupplement(
+                protocol_id=protocol.id,
+                type=ProtocolSupplementType.SCHEDULED,
+                name="Magnesium",
+                frequency=Frequency.DAILY,
+                dosage="400mg",
+            ),
+            ProtocolSupplement(
+                protocol_id=protocol.id,
+                type=ProtocolSupplementType.OWN,
+                name="Zinc",
+                frequency=Frequency.AS_NEEDED,
+            ),
+        ]
+
+        repo.save_protocol(protocol, supplements)
+
+        saved = {s.name: s for s in repo.get_supplements_for_protocol(protocol.id)}
+        assert saved["Magnesium"].dosage == "400mg"
+        assert saved["Magnesium"].frequency is Frequency.DAILY
+        assert saved["Zinc"].dosage is None
+        assert saved["Zinc"].type is ProtocolSupplementType.OWN
@@ -0,0 +1,34 @@
+"""Tests for primary key generation."""
+
+import time
+
+from src.databases.datatypes.ids import uuid7
+
+
+class TestUuid7:
+    """Tests for the uuid7 generator."""
+
+    def test_sets_version_and_variant(self):
+        """Test generated IDs are RFC 9562 version 7 UUIDs."""
+        value = uuid7()
+        assert value.version == 7
+        assert value.variant == "specified in RFC 4122"
+
+    def test_embeds_current_unix_time_in_milliseconds(self):
+        """Test the leading 48 bits hold the creation time."""
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+        assert before <= value.int >> 80 <= after
+
+    def test_later_ids_sort_after_earlier_ones(self):
+        """Test IDs from later milliseconds compare greater, as UUIDs and bytes."""
+        first = uuid7()
+        time.sleep(0.002)
+        second = uuid7()
+        assert first < second
+        assert first.bytes < second.bytes
+
+    def test_ids_are_unique(self):
+        """Test IDs created in the same millisecond still differ."""
+        assert len({uuid7() for _ in range(1000)}) == 1000
@@ -0,0 +1,41 @@
+"""Tests for shared datatype validators."""
+
+import pytest
+import yaml
+
+from src.databases.datatypes import validators
+from src.databases.datatypes.validators import load_codes_from_yaml, validate_code
+
+
+class TestLoadCodesFromYaml:
+    """Tests for load_codes_from_yaml."""
+
+    def test_skips_metadata_categories(self):
+        """Test codes come from every category except underscore-prefixed ones."""
+        codes = load_codes_from_yaml("ingredient_codes.yaml")
+        assert "ZINC" in codes
+        assert not any(code.startswith("_") for code in codes)
+
+    def test_c_loader_matches_python_loader(self, monkeypatch):
+        """Test the libyaml loader yields the same codes as the pure-Python one."""
+        fast = load_codes_from_yaml("biomarker_codes.yaml")
+        monkeypatch.setattr(validators, "_YAML_LOADER", yaml.SafeLoader)
+        assert load_codes_from_yaml("biomarker_codes.yaml") == fast
+
+
+class TestValidateCode:
+    """Tests for validate_code."""
+
+    def test_accepts_valid_code(self):
+        """Test a well-formed code is returned unchanged."""
+        assert validate_code("VITAMIN_B12") == "VITAMIN_B12"
+
+    def test_rejects_trailing_newline(self):
+        """Test the whole string must match, not just up to a final newline."""
+        with pytest.raises(ValueError, match="invalid characters"):
+            validate_code("ZINC\n")
+
+    def test_rejects_leading_digit(self):
+        """Test codes must start with a letter."""
+        with pytest.raises(ValueError, match="invalid characters"):
+            validate_code("1ZINC")
@@ -0,0 +1,377 @@
+"""Guards against N+1 queries in repository methods.
+
+Each test seeds several parents with several children each, so a method
+that falls back to one query per row issues more statements than asserted.
+"""
+
+from datetime import date
+
+import pytest
+
+from src.databases.clients.sqlite import DatabaseClient
+from src.databases.datatypes.bloodwork import Biomarker, LabReport, Panel
+from src.databases.datatypes.bloodwork.repository import BloodworkRepository
+from src.databases.datatypes.dna import DnaTest, Snp
+from src.databases.datatypes.dna.repository import DnaRepository
+from src.databases.datatypes.knowledge import (
+    Knowledge,
+    KnowledgeLink,
+    KnowledgeTag,
+    KnowledgeType,
+    LinkType,
+)
+from src.databases.datatypes.knowledge.repository import KnowledgeRepository
+from src.databases.datatypes.supplement import (
+    Ingredient,
+    IngredientType,
+    ProprietaryBlend,
+    SupplementForm,
+    SupplementLabel,
+)
+from src.databases.datatypes.supplement.repository import SupplementRepository
+from src.databases.datatypes.supplement_protocol import (
+    Frequency,
+    ProtocolSupplement,
+    ProtocolSupplementType,
+    SupplementProtocol,
+)
+from src.databases.datatypes.supplement_protocol.repository import (
+    SupplementProtocolRepository,
+)
+
+ROWS = 3
+
+
+@pytest.fixture
+def db_client(tmp_path):
+    """Create a test database client with schema initialized."""
+    db_path = tmp_path / "test.db"
+    client = DatabaseClient(db_path=db_path)
+    client.init_schema()
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def db_session(db_client):
+    """Create a database session for testing."""
+    with db_client.get_session() as session:
+        yield session
+
+
+class TestKnowledgeQueryCounts:
+    """Query counts for KnowledgeRepository."""
+
+    @pytest.fixture
+    def target_id(self, db_session):
+        """Create the knowledge entry the seeded entries link to."""
+        target = Knowledge(
+            type=KnowledgeType.INSIGHT, summary="Target", content="T", confidence=0.5
+        )
+        KnowledgeRepository(db_session).save_knowledge(target, [], [])
+        return target.id
+
+    @pytest.fixture
+    def repo(self, db_session, target_id):
+        """Create a KnowledgeRepository over several tagged, linked entries."""
+        repo = KnowledgeRepository(db_session)
+        for i in range(ROWS):
+            entry = Knowledge(
+                type=KnowledgeType.INSIGHT,
+                summary=f"Entry {i}",
+                content="Content",
+                confidence=0.5,
+            )
+            tags = [
+                KnowledgeTag(knowledge_id=entry.id, tag=tag) for tag in ("shared", f"t{i}")
+            ]
+            links = [
+                KnowledgeLink(
+                    knowledge_id=entry.id,
+                    link_type=LinkType.KNOWLEDGE,
+                    target_id=target_id,
+                )
+                for _ in range(ROWS)
+            ]
+            repo.save_knowledge(entry, tags, links)
+        db_session.expire_all()
+        return repo
+
+    def test_listing_with_tags_and_links(self, repo, count_queries):
+        """Test active entries plus their tags and links take three queries."""
+        with count_queries(repo.session) as statements:
+            entries = repo.list_active()
+            ids = [entry.id for entry in entries]
+            repo.get_tags_for_entries(ids)
+            repo.get_links_for_entries(ids)
+        assert len(entries) == ROWS + 1
+        assert len(statements) == 3
+
+    def test_get_by_tag(self, repo, count_queries):
+        """Test a tag lookup takes one query."""
+        with count_queries(repo.session) as statements:
+            assert len(repo.get_by_tag("shared")) == ROWS
+        assert len(statements) == 1
+
+    def test_get_linked_to(self, repo, target_id, count_queries):
+        """Test a link target lookup takes one query."""
+        with count_queries(repo.session) as statements:
+            entries = repo.get_linked_to(LinkType.KNOWLEDGE, target_id)
+        assert len(entries) == ROWS
+        assert len(statements) == 1
+
+    def test_get_knowledge_entries(self, repo, count_queries):
+        """Test fetching several entries by ID takes one query."""
+        ids = {entry.id for entry in repo.list_active()}
+        with count_queries(repo.session) as statements:
+            assert len(repo.get_knowledge_entries(ids)) == ROWS + 1
+        assert len(statements) == 1
+
+    def test_validate_link_targets_exist(self, repo, target_id, count_queries):
+        """Test checking link targets takes one query per link type."""
+        targets = [(LinkType.KNOWLEDGE, entry.id) for entry in repo.list_active()]
+        targets.append((LinkType.SNP, target_id))
+        with count_queries(repo.session) as statements:
+            repo.validate_link_targets_exist(targets)
+        assert len(statements) == 2
+
+    def test_save_knowledge(self, repo, target_id, count_queries):
+        """Test saving an entry takes the lock and one insert per table."""
+        entry = Knowledge(
+            type=KnowledgeType.INSIGHT, summary="New", content="C", confidence=0.5
+        )
+        tags = [KnowledgeTag(knowledge_id=entry.id, tag=f"n{i}") for i in range(ROWS)]
+        links = [
+            KnowledgeLink(
+                knowledge_id=entry.id,
+                link_type=LinkType.KNOWLEDGE,
+                target_id=target_id,
+            )
+            for _ in range(ROWS)
+        ]
+        with count_queries(repo.session) as statements:
+            repo.save_knowledge(entry, tags, links)
+        assert len(statements) == 4
+
+    def test_supersede(self, repo, target_id, count_queries):
+        """Test superseding takes the lock, one update, and one insert per table."""
+        entry = Knowledge(
+            type=KnowledgeType.INSIGHT, summary="New", content="C", confidence=0.5
+        )
+        tags = [KnowledgeTag(knowledge_id=entry.id, tag=f"n{i}") for i in range(ROWS)]
+        links = [
+            KnowledgeLink(
+                knowledge_id=entry.id,
+                link_type=LinkType.KNOWLEDGE,
+                target_id=target_id,
+            )
+            for _ in range(ROWS)
+        ]
+        with count_queries(repo.session) as statements:
+            repo.supersede(target_id, entry, tags, links)
+        assert len(statements) == 5
+
+
+class TestSupplementQueryCounts:
+    """Query counts for SupplementRepository."""
+
+    @staticmethod
+    def build_label(index: int):
+        """Build a label with blends, blend ingredients, and active ingredients."""
+        label = SupplementLabel(
+            brand=f"Brand {index}",
+            product_name="Product",
+            form=SupplementForm.CAPSULE,
+            serving_size="1 capsule",
+            source_file=f"label_{index}.json",
+        )
+        blends = [
+            ProprietaryBlend(supplement_label_id=label.id, name=f"Blend {i}")
+            for i in range(ROWS)
+        ]
+        ingredients = [
+            Ingredient(
+                supplement_label_id=label.id,
+                type=IngredientType.ACTIVE,
+                name="Zinc",
+                code="ZINC",
+            )
+            for _ in range(ROWS)
+        ]
+        ingredients += [
+            Ingredient(
+                blend_id=blend.id,
+                type=IngredientType.BLEND,
+                name="Ashwagandha",
+                code="ASHWAGANDHA",
+            )
+            for blend in blends
+        ]
+        return label, blends, ingredients
+
+    @pytest.fixture
+    def repo(self, db_session):
+        """Create a SupplementRepository over several labels."""
+        repo = SupplementRepository(db_session)
+        for i in range(ROWS):
+            repo.save_label(*self.build_label(i))
+        return repo
+
+    def test_save_label(self, repo, count_queries):
+        """Test saving a label takes the lock, the duplicate check, and one insert per table."""
+        with count_queries(repo.session) as statements:
+            assert repo.save_label(*self.build_label(ROWS))
+        assert len(statements) == 5
+
+    def test_ingredients_for_blends(self, repo, count_queries):
+        """Test ingredients for every blend of every label take one query."""
+        labels = repo.list_labels()
+        blend_ids = [
+            blend.id for label in labels for blend in repo.get_blends_for_label(label.id)
+        ]
+        with count_queries(repo.session) as statements:
+            ingredients = repo.get_ingredients_for_blends(blend_ids)
+        assert sum(len(found) for found in ingredients.values()) == ROWS * ROWS
+        assert len(statements) == 1
+
+    def test_get_labels(self, repo, count_queries):
+        """Test fetching several labels by ID takes one query."""
+        ids = {label.id for label in repo.list_labels()}
+        repo.session.expire_all()
+        with count_queries(repo.session) as statements:
+            assert len(repo.get_labels(ids)) == ROWS
+        assert len(statements) == 1
+
+
+class TestBloodworkQueryCounts:
+    """Query counts for BloodworkRepository."""
+
+    @staticmethod
+    def build_report(index: int):
+        """Build a report with several panels of several biomarkers."""
+        report = LabReport(
+            lab_provider="Quest",
+            collected_date=date(2024, 1, index + 1),
+            source_file=f"report_{index}.json",
+        )
+        panels = [Panel(lab_report_id=report.id, name=f"Panel {i}") for i in range(ROWS)]
+        # Alternate set and unset reference ranges, so rows differ in which
+        # optional fields they fill
+        biomarkers = [
+            Biomarker(
+                panel_id=panel.id,
+                name="Glucose",
+                code="GLUCOSE",
+                value=90.0,
+                unit="mg/dL",
+                reference_low=70.0 if i % 2 else None,
+            )
+            for panel in panels
+            for i in range(ROWS)
+        ]
+        return report, panels, biomarkers
+
+    @pytest.fixture
+    def repo(self, db_session):
+        """Create a BloodworkRepository over several reports."""
+        repo = BloodworkRepository(db_session)
+        for i in range(ROWS):
+            repo.save_report(*self.build_report(i))
+        return repo
+
+    def test_save_report(self, repo, count_queries):
+        """Test saving a report takes the lock, the duplicate check, and one insert per table."""
+        with count_queries(repo.session) as statements:
+            assert repo.save_report(*self.build_report(ROWS))
+        assert len(statements) == 5
+
+    def test_panels_and_biomarkers_for_reports(self, repo, count_queries):
+        """Test the panels and biomarkers of every report take three queries."""
+        with count_queries(repo.session) as statements:
+            reports = repo.list_reports()
+            panels = repo.get_panels_for_reports([report.id for report in reports])
+            panel_ids = [panel.id for found in panels.values() for panel in found]
+            biomarkers = repo.get_biomarkers_for_panels(panel_ids)
+        assert sum(len(found) for found in biomarkers.values()) == ROWS**3
+        assert len(statements) == 3
+
+
+class TestDnaQueryCounts:
+    """Query counts for DnaRepository."""
+
+    def test_save_test(self, db_session, count_queries):
+        """Test saving a test takes the lock, the duplicate check, and one insert per table."""
+        repo = DnaRepository(db_session)
+        dna_test = DnaTest(
+            source="23andMe", collected_date=date(2024, 1, 1), source_file="dna.json"
+        )
+        snps = [
+            Snp(
+                dna_test_id=dna_test.id,
+                rsid=f"rs{i}",
+                genotype="AG",
+                magnitude=float(i),
+                gene="MTHFR",
+            )
+            for i in range(ROWS)
+        ]
+        with count_queries(repo.session) as statements:
+            assert repo.save_test(dna_test, snps)
+        assert len(statements) == 4
+
+
+class TestProtocolQueryCounts:
+    """Query counts for SupplementProtocolRepository."""
+
+    @pytest.fixture
+    def repo(self, db_session):
+        """Create a SupplementProtocolRepository over several protocols."""
+        repo = SupplementProtocolRepository(db_session)
+        for i in range(ROWS):
+            protocol = SupplementProtocol(
+                protocol_date=date(2024, 1, i + 1), source_file=f"protocol_{i}.json"
+            )
+            supplements = [
+                ProtocolSupplement(
+                    protocol_id=protocol.id,
+                    type=ProtocolSupplementType.SCHEDULED,
+                    name=f"Supplement {j}",
+                    frequency=Frequency.DAILY,
+                )
+                for j in range(ROWS)
+            ]
+            repo.save_protocol(protocol, supplements)
+        return repo
+
+    def test_save_protocol(self, repo, count_queries):
+        """Test saving a protocol takes the lock, the duplicate check, and one insert per table."""
+        protocol = SupplementProtocol(
+            protocol_date=date(2024, 2, 1), source_file="protocol_new.json"
+        )
+        supplements = [
+            ProtocolSupplement(
+                protocol_id=protocol.id,
+                type=ProtocolSupplementType.SCHEDULED,
+                name=f"Supplement {j}",
+                frequency=Frequency.DAILY,
+            )
+            for j in range(ROWS)
+        ]
+        with count_queries(repo.session) as statements:
+            assert repo.save_protocol(protocol, supplements)
+        assert len(statements) == 4
+
+    def test_current_protocol_with_supplements(self, repo, count_queries):
+        """Test the current protocol and its supplements take one query."""
+        with count_queries(repo.session) as statements:
+            _, supplements = repo.get_current_protocol_with_supplements()
+        assert len(supplements) == ROWS
+        assert len(statements) == 1
+
+    def test_supplements_for_protocols(self, repo, count_queries):
+        """Test supplements for every protocol take two queries with the listing."""
+        with count_queries(repo.session) as statements:
+            protocols = repo.list_protocols()
+            repo.get_supplements_for_protocols([p.id for p in protocols])
+        assert len(protocols) == ROWS
+        assert len(statements) == 2